@@ -0,0 +1,91 @@
+"""
+Reclaimable-space estimate: full walk vs the persisted per-directory index.
+
+Builds a synthetic temp tree, then times a plain os.walk + stat, a cold
+index build, a repeat estimate from a freshly loaded index file, one
+after a few directories changed, a forced full rescan and the top-N
+listings.
+
+  python benchmarks/bench_cleanup_index.py
+  python benchmarks/bench_cleanup_index.py --files 300000 --changed 20
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_cleanup import build_tree
+from core.cleanup.engine import format_size
+from core.cleanup.index import SpaceIndex
+from core.cleanup.targets import load_targets
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def walk_size(root):
+    total = 0
+    for path, _, files in os.walk(root):
+        for name in files:
+            total += os.lstat(os.path.join(path, name)).st_size
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100000)
+    parser.add_argument("--per-dir", type=int, default=100)
+    parser.add_argument("--changed", type=int, default=5, help="directories touched before the repeat estimate")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--root", default=tempfile.gettempdir())
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="vortex-index-", dir=args.root)
+    try:
+        root = os.path.join(base, "tree")
+        os.makedirs(root)
+        build_tree(root, args.files, args.per_dir, 512)
+        targets = [t for t in load_targets({"bench": [root]}) if t.id == "bench"]
+        index_file = os.path.join(base, "index.json")
+
+        walk, walked = timed(lambda: walk_size(root))
+        cold_index = SpaceIndex(index_file, max_workers=args.workers)
+        cold, res_cold = timed(lambda: cold_index.estimate(targets))
+
+        # New instance: everything comes from the persisted file
+        index = SpaceIndex(index_file, max_workers=args.workers)
+        warm, res_warm = timed(lambda: index.estimate(targets))
+
+        dirs = sorted(os.path.join(p, d) for p, ds, _ in os.walk(root) for d in ds if d.startswith("tmp"))
+        for path in dirs[:args.changed]:
+            with open(os.path.join(path, "new.tmp"), "wb") as f:
+                f.write(b"y" * 4096)
+        changed, res_changed = timed(lambda: index.estimate(targets))
+        full, res_full = timed(lambda: index.estimate(targets, force=True))
+        top, (files, folders) = timed(lambda: (index.top_files(targets, 10), index.top_dirs(targets, 10)))
+
+        print(f"tree:            {args.files} files, {res_cold['targets']['bench']['dirs']} dirs")
+        print(f"os.walk + stat:  {walk:.2f}s, {format_size(walked)}")
+        print(f"index (cold):    {cold:.2f}s, {format_size(res_cold['bytes'])}, "
+              f"{res_cold['targets']['bench']['rescanned']} dirs listed, file {format_size(os.path.getsize(index_file))}")
+        print(f"index (repeat):  {warm * 1000:.0f} ms incl. load, {res_warm['targets']['bench']['rescanned']} dirs listed, "
+              f"x{walk / warm:.0f} vs walk")
+        print(f"{args.changed} dirs changed:  {changed * 1000:.0f} ms, {res_changed['targets']['bench']['rescanned']} dirs listed, "
+              f"{format_size(res_changed['bytes'])}")
+        print(f"full rescan:     {full:.2f}s, {res_full['targets']['bench']['rescanned']} dirs listed")
+        print(f"top-10 lists:    {top * 1000:.1f} ms, largest dir {folders[0][1][len(root):]} {format_size(folders[0][0])}, "
+              f"largest file {format_size(files[0][0])}")
+        print(f"same totals:     {walked + args.changed * 4096 == res_changed['bytes'] == res_full['bytes']}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
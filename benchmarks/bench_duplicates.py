@@ -0,0 +1,120 @@
+"""
+Duplicate finder on a synthetic download folder: naive full hashing of
+every file vs the three-stage search (in-process and on a process pool),
+and a repeat search served from the hash cache.
+
+The tree mixes unique files, exact copies, same-size files that differ
+only at the end (dropped by the partial hash) and ones that differ only
+in the middle (dropped by the full hash).
+
+  python benchmarks/bench_duplicates.py
+  python benchmarks/bench_duplicates.py --files 4000 --size-kb 2048 --workers 8
+"""
+import argparse
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cleanup.duplicates import DuplicateFinder
+from core.cleanup.engine import format_size
+
+
+def build_tree(root, files, size_kb, seed=7):
+    rng = random.Random(seed)
+    made = 0
+    d = 0
+    while made < files:
+        folder = os.path.join(root, f"dl{d:03d}")
+        os.makedirs(folder)
+        for i in range(min(50, files - made)):
+            size = rng.randint(1024, size_kb * 1024)
+            data = bytearray(rng.randbytes(size))
+            kind = made % 10
+            with open(os.path.join(folder, f"f{i:03d}.bin"), "wb") as f:
+                f.write(data)
+            if kind == 0:
+                # Exact copy, as a browser saves a repeated download
+                with open(os.path.join(folder, f"f{i:03d} (1).bin"), "wb") as f:
+                    f.write(data)
+                made += 1
+            elif kind == 1:
+                # Same size, different tail
+                data[-1] ^= 0xFF
+                with open(os.path.join(folder, f"f{i:03d}-tail.bin"), "wb") as f:
+                    f.write(data)
+                made += 1
+            elif kind == 2 and size > 256 * 1024:
+                # Same size, same head and tail, different middle
+                data[size // 2] ^= 0xFF
+                with open(os.path.join(folder, f"f{i:03d}-mid.bin"), "wb") as f:
+                    f.write(data)
+                made += 1
+            made += 1
+        d += 1
+
+
+def naive(root):
+    """Full hash of every file, grouped by hash."""
+    groups = {}
+    for path, _, names in os.walk(root):
+        for name in names:
+            full = os.path.join(path, name)
+            with open(full, "rb") as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+            groups.setdefault(digest, []).append(full)
+    return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--size-kb", type=int, default=1024, help="max file size")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--root", default=tempfile.gettempdir())
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="vortex-dupes-", dir=args.root)
+    try:
+        root = os.path.join(base, "tree")
+        os.makedirs(root)
+        build_tree(root, args.files, args.size_kb)
+        total = sum(os.path.getsize(os.path.join(p, n)) for p, _, ns in os.walk(root) for n in ns)
+
+        t_naive, expected = timed(lambda: naive(root))
+        inline = DuplicateFinder(cache_path=None, use_processes=False)
+        t_inline, res_inline = timed(lambda: inline.find([root]))
+        pooled = DuplicateFinder(cache_path=os.path.join(base, "hashes.json"), max_workers=args.workers)
+        t_pool, res_pool = timed(lambda: pooled.find([root]))
+        # New instance: hashes come from the persisted cache
+        cached = DuplicateFinder(cache_path=os.path.join(base, "hashes.json"), max_workers=args.workers)
+        t_cached, res_cached = timed(lambda: cached.find([root]))
+
+        groups = sorted(sorted(g['paths']) for g in res_pool['groups'])
+        stages = res_pool['stages']
+        print(f"tree:            {res_pool['files']} files, {format_size(total)}")
+        print(f"stages:          {stages['size']} files -> {stages['partial']} same size -> "
+              f"{stages['full']} hashed in full")
+        print(f"naive full hash: {t_naive:.2f}s")
+        print(f"staged, inline:  {t_inline:.2f}s, x{t_naive / t_inline:.1f}")
+        print(f"staged, pool:    {t_pool:.2f}s, x{t_naive / t_pool:.1f}")
+        print(f"repeat (cache):  {t_cached * 1000:.0f} ms, {sum(cached.hashed.values())} files read")
+        print(f"duplicates:      {len(groups)} groups, {format_size(res_pool['wasted'])} reclaimable")
+        print(f"same groups:     {groups == expected and res_inline['groups'] == res_pool['groups'] == res_cached['groups']}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
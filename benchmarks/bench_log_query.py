@@ -0,0 +1,55 @@
+"""
+Operation log: first history page via query() vs the full get_logs() load,
+both from a cold start, for growing history sizes.
+
+  python benchmarks/bench_log_query.py --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.log_store import SegmentLog
+
+
+def fill(directory, n):
+    store = SegmentLog(directory)
+    base = 1_700_000_000
+    for i in range(n):
+        store.append({"id": i + 1, "time": base + i, "timestamp": "2024-01-01 00:00:00",
+                      "name": f"Vortex Point {i}", "description": "bench", "action": "create"})
+    store.close()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--page", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'entries':>8}  {'first page':>12}  {'full load':>12}")
+    for n in args.sizes:
+        directory = tempfile.mkdtemp(prefix="vx-logs-")
+        try:
+            fill(directory, n)
+            # Fresh instances: nothing cached, only the sidecars on disk
+            page_ms, page = timed(lambda: SegmentLog(directory).range(limit=args.page))
+            full_ms, full = timed(lambda: list(reversed(SegmentLog(directory).entries())))
+            assert page == full[:args.page]
+            print(f"{n:>8}  {page_ms:>10.2f}ms  {full_ms:>10.2f}ms")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Page transition cost: opacity effects on the live pages (old) vs the
+snapshot cross-fade overlay (new). Counts paint events delivered to the
+page widgets (and their children) during one transition, for pages of
+growing complexity. With the overlay the pages are painted a fixed number
+of times (two snapshots and the final reveal), however many frames the fade
+takes; with opacity effects every frame repaints both page subtrees.
+
+Exits with status 1 if that stops holding: the fade must repaint the pages
+at most once (the reveal) while the overlay draws its frames, and a whole
+transition must cost fewer page paints than the old fade.
+
+  python benchmarks/bench_page_transition.py --rows 5 10 40
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QObject, QPropertyAnimation, QEasingCurve
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import (QApplication, QGraphicsOpacityEffect, QStackedWidget, QWidget, QVBoxLayout,
+                               QFrame, QHBoxLayout, QLabel, QCheckBox)
+
+from ui import theme
+from ui.components import FadingStackedWidget
+
+
+class OldFadingStackedWidget(QStackedWidget):
+    # The pre-overlay implementation: fade the live widgets through opacity effects
+    def setCurrentIndex(self, index):
+        if self.currentIndex() == index:
+            return
+        self.m_next_index = index
+        current = self.currentWidget()
+        self.effect_out = QGraphicsOpacityEffect(current)
+        current.setGraphicsEffect(self.effect_out)
+        self.anim_out = QPropertyAnimation(self.effect_out, b"opacity")
+        self.anim_out.setDuration(150)
+        self.anim_out.setStartValue(1.0)
+        self.anim_out.setEndValue(0.0)
+        self.anim_out.setEasingCurve(QEasingCurve.OutQuad)
+        self.anim_out.finished.connect(self.on_fade_out_finished)
+        self.anim_out.start()
+
+    def on_fade_out_finished(self):
+        super().setCurrentIndex(self.m_next_index)
+        new_widget = self.currentWidget()
+        self.effect_in = QGraphicsOpacityEffect(new_widget)
+        new_widget.setGraphicsEffect(self.effect_in)
+        self.anim_in = QPropertyAnimation(self.effect_in, b"opacity")
+        self.anim_in.setDuration(250)
+        self.anim_in.setStartValue(0.0)
+        self.anim_in.setEndValue(1.0)
+        self.anim_in.setEasingCurve(QEasingCurve.InQuad)
+        self.anim_in.finished.connect(lambda: new_widget.setGraphicsEffect(None))
+        self.anim_in.start()
+
+
+class PaintCounter(QObject):
+    def __init__(self, pages, overlay=None):
+        super().__init__()
+        self.pages = pages
+        self.overlay = overlay
+        self.page_paints = 0
+        self.overlay_paints = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and isinstance(obj, QWidget):
+            if obj is self.overlay:
+                self.overlay_paints += 1
+            elif any(page is obj or page.isAncestorOf(obj) for page in self.pages):
+                self.page_paints += 1
+        return False
+
+
+def build_page(rows):
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    for i in range(rows):
+        frame = QFrame()
+        frame.setObjectName("tweakItem")
+        row = QHBoxLayout(frame)
+        lbl = QLabel(f"Tweak {i}")
+        lbl.setObjectName("tweakLabel")
+        row.addWidget(lbl)
+        row.addStretch()
+        row.addWidget(QCheckBox())
+        layout.addWidget(frame)
+    return page
+
+
+def run(app, stack_cls, rows, settle_ms=700):
+    host = QWidget()
+    host.setObjectName("centralWidget") # Painted gradient background, like the main window
+    host.resize(900, 700)
+    layout = QVBoxLayout(host)
+    stack = stack_cls()
+    layout.addWidget(stack)
+    pages = [build_page(rows), build_page(rows)]
+    for page in pages:
+        stack.addWidget(page)
+    host.show()
+    QTest.qWaitForWindowExposed(host)
+    QTest.qWait(100)
+
+    counter = PaintCounter(pages, getattr(stack, "overlay", None))
+    app.installEventFilter(counter)
+    stack.setCurrentIndex(1)
+    # Grabbing the two snapshots happens inside the call; the rest is animation
+    setup = counter.page_paints
+    start = time.perf_counter()
+    QTest.qWait(settle_ms)
+    elapsed = time.perf_counter() - start
+    app.removeEventFilter(counter)
+
+    host.hide()
+    host.deleteLater()
+    return setup, counter.page_paints - setup, counter.overlay_paints, elapsed
+
+
+def check(rows, old_setup, old_anim, new_setup, new_anim, frames):
+    """Returns the repaint regressions for one page size (empty list if none)."""
+    problems = []
+    # The setup grabs both pages, so one page subtree costs half of it
+    reveal = new_setup // 2
+    if frames < 2:
+        problems.append(f"{rows} rows: overlay painted {frames} frames, the fade did not run")
+    if new_anim > reveal:
+        problems.append(f"{rows} rows: pages painted {new_anim} times during the fade, "
+                        f"expected at most {reveal} (final reveal only)")
+    if new_setup + new_anim >= old_setup + old_anim:
+        problems.append(f"{rows} rows: {new_setup + new_anim} page paints, "
+                        f"not fewer than the old fade ({old_setup + old_anim})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[5, 10, 40])
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    theme.apply(app)
+
+    print("page paints per transition: setup (snapshots) + animation (fade and final reveal)")
+    print(f"{'rows':>5}  {'old':>16}  {'new':>16}  {'new frames':>10}")
+    problems = []
+    for rows in args.rows:
+        old_setup, old_anim, _, _ = run(app, OldFadingStackedWidget, rows)
+        new_setup, new_anim, frames, _ = run(app, FadingStackedWidget, rows)
+        print(f"{rows:>5}  {old_setup:>5} + {old_anim:>8}  {new_setup:>5} + {new_anim:>8}  {frames:>10}")
+        problems += check(rows, old_setup, old_anim, new_setup, new_anim, frames)
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    sys.stdout.flush()
+    os._exit(1 if problems else 0) # Skip PySide teardown of the offscreen app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Profile pipeline: stages run serially vs as a DAG on a bounded pool.
+
+Runs on the in-memory FakeSystem; --latency is the cost of one batch
+invocation, --op-latency the cost of each service, power or command
+operation inside it.
+
+  python benchmarks/bench_profile_pipeline.py
+  python benchmarks/bench_profile_pipeline.py --profile risky --op-latency 0.2 --workers 8
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tweaks import profiles
+from core.tweaks.engine import TweakEngine
+from core.tweaks.fake import FakeSystem
+from core.tweaks.pipeline import ProfilePipeline, compile_profile
+from core.tweaks.planner import TweakPlanner
+from core.tweaks.prober import TweakProber
+
+
+def run(profile, args, serial):
+    # Fresh system each time: both runs start from the Windows defaults
+    system = FakeSystem(latency=args.latency, op_latency=args.op_latency)
+    plan, stages = compile_profile(profile, TweakPlanner(TweakProber(system)))
+    pipeline = ProfilePipeline(stages, TweakEngine(system), max_workers=args.workers)
+    res = pipeline.run(serial=serial)
+    return plan, stages, res, system
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", default="performance", choices=[p.id for p in profiles.PROFILES])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per batch invocation")
+    parser.add_argument("--op-latency", type=float, default=0.1, help="seconds per service/power/command op")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    profile = profiles.get(args.profile)
+    plan, stages, serial, _ = run(profile, args, serial=True)
+    _, _, parallel, system = run(profile, args, serial=False)
+
+    print(f"profile:     {profile.id}, {len(plan)} ops in {len(stages)} stages")
+    for stage in stages:
+        deps = f" <- {', '.join(stage.deps)}" if stage.deps else ""
+        print(f"  {stage.id}{deps}")
+    print(f"serial:      {serial['elapsed']:.3f}s, {len(serial['stages'])} stages")
+    print(f"parallel:    {parallel['elapsed']:.3f}s, x{serial['elapsed'] / parallel['elapsed']:.1f} "
+          f"({args.workers} workers, {system.calls} invocations)")
+    print(f"same result: {serial['tweaks'] == parallel['tweaks'] and parallel['success']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-call shell spawn vs the persistent PowerShellHost.
+
+  python benchmarks/bench_ps_host.py                 # stub interpreter (any OS)
+  python benchmarks/bench_ps_host.py --powershell    # real powershell.exe (Windows)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.ps_host import PowerShellHost, NO_WINDOW, default_shell
+
+STUB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ps_stub.py")
+QUERY_PS = "Get-WmiObject -Namespace root\\default -Class SystemRestore | Measure-Object | ConvertTo-Json -Compress"
+QUERY_STUB = "SystemRestore | Measure-Object"
+
+
+def bench_spawn(shell_cmd, script, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        subprocess.run(shell_cmd + ["-Command", script], capture_output=True, creationflags=NO_WINDOW)
+    return time.perf_counter() - start
+
+
+def bench_host(host_argv, script, calls):
+    host = PowerShellHost(host_argv)
+    start = time.perf_counter()
+    for _ in range(calls):
+        res = host.run(script)
+        assert res['success'], res['error']
+    elapsed = time.perf_counter() - start
+    host.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--powershell", action="store_true", help="benchmark the real powershell.exe")
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.powershell:
+        shell_cmd = ["powershell", "-NoProfile"]
+        host_argv = default_shell()
+        script = QUERY_PS
+    else:
+        shell_cmd = [sys.executable, STUB]
+        host_argv = [sys.executable, STUB, "--host"]
+        script = QUERY_STUB
+
+    spawn = bench_spawn(shell_cmd, script, args.calls)
+    host = bench_host(host_argv, script, args.calls)
+
+    print(f"calls:            {args.calls}")
+    print(f"spawn per call:   {spawn:.3f}s total, {spawn / args.calls * 1000:.1f} ms/call")
+    print(f"persistent host:  {host:.3f}s total, {host / args.calls * 1000:.1f} ms/call (incl. start)")
+    print(f"speedup:          x{spawn / host:.1f}")
+
+
+if __name__ == "__main__":
+    main()
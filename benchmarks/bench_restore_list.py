@@ -0,0 +1,121 @@
+"""
+Restore point list: one QFrame per row (old SettingsPage) vs the virtualized model/view.
+Measures construction time, resident memory growth and one full repaint
+at 100, 1k and 10k synthetic points. Each case runs in its own process.
+
+  python benchmarks/bench_restore_list.py
+  python benchmarks/bench_restore_list.py --sizes 100 1000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import psutil
+        return psutil.Process().memory_info().rss
+
+
+def synthetic_points(n):
+    base = datetime(2020, 1, 1)
+    points = []
+    for i in range(n, 0, -1):
+        dt = base + timedelta(hours=i)
+        points.append({'id': i, 'shadow_id': f"{{shadow-{i}}}", 'name': f"Vortex Restore Point #{i}",
+                       'timestamp': dt.strftime("%d.%m.%Y | %H:%M"), 'dt_obj': dt})
+    return points
+
+
+def build_widget_rows(points):
+    # The pre-virtualization list: a styled QFrame, two labels and a button per point
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    layout.setSpacing(10)
+    for point in points:
+        row = QFrame()
+        row.setStyleSheet("QFrame { background-color: rgba(30, 41, 59, 0.2); border-radius: 8px; "
+                          "border: 1px solid rgba(148, 163, 184, 0.05); }")
+        row.setFixedHeight(50)
+        lyt = QHBoxLayout(row)
+        lyt.setContentsMargins(25, 0, 25, 0)
+        lbl_name = QLabel(point['name'])
+        lbl_name.setStyleSheet("color: #cbd5e1; font-weight: 600; font-size: 14px;")
+        lbl_time = QLabel(point['timestamp'])
+        lbl_time.setFixedWidth(180)
+        lbl_time.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        lbl_time.setStyleSheet("color: #7aa2f7; font-family: 'Consolas', monospace; padding-right: 15px;")
+        btn_del = QPushButton("Удалить")
+        btn_del.setFixedSize(70, 28)
+        btn_del.setStyleSheet("QPushButton { background-color: transparent; color: #ef4444; "
+                              "border: 1px solid #ef4444; border-radius: 4px; font-size: 11px; }")
+        lyt.addWidget(lbl_name)
+        lyt.addStretch()
+        lyt.addWidget(lbl_time)
+        lyt.addSpacing(40)
+        lyt.addWidget(btn_del)
+        layout.addWidget(row)
+    return container
+
+
+def build_model_view(points):
+    from ui.restore_list import RestorePointList
+    view = RestorePointList()
+    view.point_model.reconcile([(p['id'], p) for p in points])
+    return view
+
+
+def run_case(kind, n):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    app = QApplication([])
+    points = synthetic_points(n)
+
+    before = rss_bytes()
+    start = time.perf_counter()
+    widget = build_widget_rows(points) if kind == "widgets" else build_model_view(points)
+    widget.resize(900, 600)
+    widget.show()
+    app.processEvents()
+    built = time.perf_counter() - start
+    grown = rss_bytes() - before
+
+    start = time.perf_counter()
+    widget.grab()
+    paint = time.perf_counter() - start
+
+    print(f"{kind:<10} {n:>6} rows  build {built * 1000:9.1f} ms  "
+          f"memory +{grown / 1024 ** 2:7.1f} MB  repaint {paint * 1000:7.1f} ms", flush=True)
+    # Skip interpreter teardown of thousands of Qt wrappers, it only adds noise
+    os._exit(0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--case", nargs=2, metavar=("KIND", "N"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case[0], int(args.case[1]))
+        return
+
+    for n in args.sizes:
+        for kind in ("widgets", "modelview"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--case", kind, str(n)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+ShadowID correlation: old nested R x S loop vs the bisect matcher.
+
+  python benchmarks/bench_shadow_match.py --points 2000 --shadows 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.wmi_manager import RestorePointManager, parse_wmi_datetime, SHADOW_MATCH_WINDOW
+
+
+def wmi_time(dt):
+    return dt.strftime("%Y%m%d%H%M%S") + ".000000+180"
+
+
+def synthetic(n_points, n_shadows, seed=1):
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    points, shadows = [], []
+    for i in range(n_points):
+        dt = base + timedelta(hours=6 * i)
+        points.append({'SequenceNumber': i + 1, 'Description': f"Point {i + 1}", 'CreationTime': wmi_time(dt)})
+        if i < n_shadows:
+            drift = timedelta(seconds=rnd.randint(-30, 90))
+            shadows.append({'ID': f"{{shadow-{i}}}", 'InstallDate': wmi_time(dt + drift)})
+    for j in range(len(shadows), n_shadows):
+        dt = base + timedelta(hours=6 * rnd.randrange(max(n_points, 1)), minutes=30)
+        shadows.append({'ID': f"{{orphan-{j}}}", 'InstallDate': wmi_time(dt)})
+    rnd.shuffle(shadows)
+    return points, shadows
+
+
+def nested_loop(points, shadows):
+    # Same shape as the old PowerShell script: dates converted in the inner loop
+    result = {}
+    for rp in points:
+        rt = parse_wmi_datetime(rp['CreationTime'])[1]
+        best, best_sid = SHADOW_MATCH_WINDOW, ''
+        for sh in shadows:
+            st = parse_wmi_datetime(sh['InstallDate'])[1]
+            diff = abs(rt - st)
+            if diff < best:
+                best, best_sid = diff, sh['ID']
+        result[rp['SequenceNumber']] = best_sid
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=2000)
+    parser.add_argument("--shadows", type=int, default=2000)
+    args = parser.parse_args()
+
+    points, shadows = synthetic(args.points, args.shadows)
+
+    start = time.perf_counter()
+    built = RestorePointManager.build_points(points, shadows)
+    fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old = nested_loop(points, shadows)
+    slow = time.perf_counter() - start
+
+    new = {p['id']: p['shadow_id'] for p in built}
+    mismatched = sum(1 for k in old if old[k] != new.get(k))
+    assigned = [sid for sid in new.values() if sid]
+
+    print(f"points x shadows:  {args.points} x {args.shadows}")
+    print(f"nested loop:       {slow:.3f}s")
+    print(f"bisect matcher:    {fast:.3f}s (incl. parsing and sorting)")
+    print(f"speedup:           x{slow / fast:.1f}")
+    print(f"differing matches: {mismatched}, duplicate shadow ids: {len(assigned) - len(set(assigned))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Style polish cost: per-widget setStyleSheet (old) vs the compiled theme (new).
+  - hover: real mouse enter/leave on an AnimatedButton, old per-hover
+    setStyleSheet vs a state property flip vs the :hover rule it uses now
+  - page build: a tweaks page with N rows, built and rendered once
+
+  python benchmarks/bench_theme.py --hovers 200 --rows 40
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QObject, QPoint
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QPushButton, QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel, QCheckBox
+
+from ui import theme
+
+OLD_BUTTON = """
+    QPushButton {{
+        background-color: {bg};
+        border: 1px solid {border};
+        border-radius: 8px;
+        color: {color};
+        font-weight: {weight};
+        padding: 10px;
+    }}
+"""
+
+OLD_ROW = """
+    #tweakItem {
+        background-color: rgba(30, 41, 59, 0.4);
+        border-radius: 8px;
+        border: 1px solid rgba(148, 163, 184, 0.05);
+        min-height: 56px;
+    }
+    #tweakItem:hover {
+        background-color: rgba(30, 41, 59, 0.6);
+        border: 1px solid rgba(129, 140, 248, 0.3);
+    }
+"""
+
+
+class OldHoverFilter(QObject):
+    # What AnimatedButton.enterEvent/leaveEvent used to do
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Enter:
+            obj.setStyleSheet(OLD_BUTTON.format(bg="#3b4261", border="#818cf8", color="#ffffff", weight=700))
+        elif event.type() == QEvent.Leave:
+            obj.setStyleSheet(OLD_BUTTON.format(bg="#24283b", border="rgba(148, 163, 184, 0.1)", color="#cbd5e1", weight=600))
+        return False
+
+
+class PropertyHoverFilter(QObject):
+    # Dynamic property flip + single-widget polish
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Enter:
+            theme.set_state(obj, "state", "hover")
+        elif event.type() == QEvent.Leave:
+            theme.set_state(obj, "state", None)
+        return False
+
+
+def build_rows(rows, old):
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    for i in range(rows):
+        frame = QFrame()
+        frame.setObjectName("tweakItem")
+        lbl = QLabel(f"Tweak {i}")
+        if old:
+            frame.setStyleSheet(OLD_ROW)
+            lbl.setStyleSheet("color: #e2e8f0; font-size: 14px; font-weight: 500;")
+        else:
+            lbl.setObjectName("tweakLabel")
+        row = QHBoxLayout(frame)
+        row.addWidget(lbl)
+        row.addStretch()
+        row.addWidget(QCheckBox())
+        layout.addWidget(frame)
+    page.resize(800, rows * 70)
+    page.grab() # polish, layout and one paint
+    return page
+
+
+def bench_hover(app, hovers, mode):
+    host = QWidget()
+    host.resize(300, 100)
+    # Plain buttons with AnimatedButton's role: the glow effect is the same in every mode
+    button = QPushButton("Test", host)
+    button.setProperty("role", "animated")
+    if mode != "pseudo":
+        hover_filter = OldHoverFilter(button) if mode == "old" else PropertyHoverFilter(button)
+        button.installEventFilter(hover_filter)
+    button.setGeometry(100, 30, 100, 40)
+    host.show()
+    QTest.qWaitForWindowExposed(host)
+
+    inside, outside = QPoint(150, 50), QPoint(10, 10)
+    start = time.perf_counter()
+    for i in range(hovers):
+        # Real mouse moves: Enter/Leave events, then the repaint they cause
+        QTest.mouseMove(host, inside if i % 2 == 0 else outside)
+        app.processEvents()
+        button.grab()
+    elapsed = (time.perf_counter() - start) / hovers * 1e6
+    host.hide()
+    host.deleteLater()
+    return elapsed
+
+
+def bench_build(rows, old, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        page = build_rows(rows, old)
+        elapsed = time.perf_counter() - start
+        page.deleteLater()
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hovers", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=40)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    theme.apply(app)
+
+    old_h = bench_hover(app, args.hovers, "old")
+    prop_h = bench_hover(app, args.hovers, "property")
+    new_h = bench_hover(app, args.hovers, "pseudo")
+    old_b = bench_build(args.rows, old=True)
+    new_b = bench_build(args.rows, old=False)
+
+    print("hover, per enter/leave + repaint:")
+    print(f"  setStyleSheet (old)      {old_h:8.1f}us")
+    print(f"  state property + polish  {prop_h:8.1f}us")
+    print(f"  :hover in app sheet      {new_h:8.1f}us   x{old_h / new_h:.1f}")
+    print(f"page build + render, {args.rows} rows:")
+    print(f"  per-widget sheets (old)  {old_b:8.2f}ms")
+    print(f"  object names / props     {new_b:8.2f}ms   x{old_b / new_b:.1f}")
+    sys.stdout.flush()
+    os._exit(0) # Skip PySide teardown of the offscreen app
+
+
+if __name__ == "__main__":
+    main()
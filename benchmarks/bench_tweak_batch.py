@@ -0,0 +1,56 @@
+"""
+Per-setting apply vs one batch for the whole tweak catalog.
+
+Runs on the in-memory FakeSystem; --latency is the cost of one system
+invocation (starting reg.exe / a shell), which is what batching saves.
+
+  python benchmarks/bench_tweak_batch.py
+  python benchmarks/bench_tweak_batch.py --latency 0.15 --rounds 3
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tweaks.catalog import TWEAKS, KIND_TOGGLE
+from core.tweaks.engine import TweakEngine
+from core.tweaks.fake import FakeSystem
+
+
+def bench(batched, latency, rounds):
+    system = FakeSystem(latency=latency)
+    engine = TweakEngine(system)
+    toggles = [tweak for tweak in TWEAKS if tweak.kind == KIND_TOGGLE]
+    start = time.perf_counter()
+    for i in range(rounds):
+        # Alternate on/off so every round really changes every setting
+        batch = engine.build([(tweak, i % 2 == 0) for tweak in toggles])
+        parts = [batch] if batched else batch.split()
+        for part in parts:
+            res = engine.run(part)
+            assert res['success'], res
+    return time.perf_counter() - start, system.calls, len(batch), system
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per system invocation")
+    parser.add_argument("--rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    single, single_calls, ops, single_sys = bench(False, args.latency, args.rounds)
+    batched, batched_calls, _, batched_sys = bench(True, args.latency, args.rounds)
+    same = (single_sys.registry, single_sys.services, single_sys.power) == \
+           (batched_sys.registry, batched_sys.services, batched_sys.power)
+
+    print(f"operations/round: {ops}")
+    print(f"per setting:      {single:.3f}s, {single_calls} invocations")
+    print(f"batched:          {batched:.3f}s, {batched_calls} invocations")
+    print(f"speedup:          x{single / batched:.1f}")
+    print(f"same end state:   {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Serial vs parallel tweak probing, and the fingerprint cache on repeat probes.
+
+Runs on the in-memory FakeSystem; --read-latency is the cost of reading
+one tweak's current values from the system.
+
+  python benchmarks/bench_tweak_probe.py
+  python benchmarks/bench_tweak_probe.py --read-latency 0.3 --workers 16
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tweaks.catalog import TWEAKS, KIND_TOGGLE
+from core.tweaks.fake import FakeSystem
+from core.tweaks.prober import TweakProber
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--read-latency", type=float, default=0.1, help="seconds per tweak read")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    system = FakeSystem(read_latency=args.read_latency)
+
+    serial = TweakProber(system)
+    serial_time, serial_states = timed(lambda: {t.id: serial.state(t) for t in TWEAKS if t.kind == KIND_TOGGLE})
+
+    prober = TweakProber(system, max_workers=args.workers)
+    cold, states = timed(lambda: prober.probe(TWEAKS))
+    reads_cold = prober.reads
+    warm, _ = timed(lambda: prober.probe(TWEAKS))
+    reads_warm = prober.reads - reads_cold
+
+    # Change one tweak's settings behind the prober's back
+    tweak = TWEAKS[0]
+    for key, _, value in tweak.targets(True):
+        system.set_value(key, value)
+    changed, after = timed(lambda: prober.probe(TWEAKS))
+    reads_changed = prober.reads - reads_cold - reads_warm
+
+    print(f"tweaks:           {len(states)}")
+    print(f"serial:           {serial_time:.3f}s")
+    print(f"parallel (cold):  {cold:.3f}s, {reads_cold} reads, x{serial_time / cold:.1f}")
+    print(f"repeat (cached):  {warm * 1000:.1f} ms, {reads_warm} reads")
+    print(f"one changed:      {changed:.3f}s, {reads_changed} reads, {tweak.id} now {after[tweak.id]}")
+    print(f"same states:      {serial_states == states}")
+
+
+if __name__ == "__main__":
+    main()
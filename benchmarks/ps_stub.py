@@ -0,0 +1,56 @@
+"""
+Minimal stand-in for powershell.exe that speaks the PowerShellHost framing.
+Lets the persistent host be exercised on machines without PowerShell.
+
+  ps_stub.py --host            framed request/response loop on stdin/stdout
+  ps_stub.py -Command <text>   single-shot run, like `powershell -Command`
+
+Scripts are not interpreted, just echoed back, except for a few verbs:
+  exit      -> the process dies without answering (host must restart)
+  fail ...  -> reported as an error
+  sleep N   -> blocks for N seconds before answering
+"""
+import base64
+import sys
+import time
+
+
+def execute(script):
+    verb, _, arg = script.partition(" ")
+    if verb == "exit":
+        sys.exit(3)
+    if verb == "sleep":
+        time.sleep(float(arg or 0))
+        return True, "", ""
+    if verb == "fail":
+        return False, "", arg or "stub failure"
+    return True, script, ""
+
+
+def b64(text):
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def host_loop():
+    for line in sys.stdin:
+        parts = line.rstrip("\n").split(" ")
+        if len(parts) < 2:
+            continue
+        script = base64.b64decode(parts[1]).decode("utf-8")
+        ok, out, err = execute(script)
+        sys.stdout.write(f"@@VX {parts[0]} {int(ok)} {b64(out)} {b64(err)}\n")
+        sys.stdout.flush()
+
+
+def main():
+    if sys.argv[1:2] == ["--host"]:
+        host_loop()
+    elif sys.argv[1:2] == ["-Command"]:
+        ok, out, err = execute(" ".join(sys.argv[2:]))
+        sys.stdout.write(out)
+        sys.stderr.write(err)
+        sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import sys
+import threading
+
+from core.backends.base import RestoreBackend
+
+_instances = {}
+_lock = threading.Lock()
+
+
+def default_backend_name():
+    if sys.platform != "win32":
+        return "fake"
+    try:
+        import win32com.client  # noqa: F401
+        return "com"
+    except ImportError:
+        return "powershell"
+
+
+def get_backend(name=None):
+    """
+    Shared backend instance. `name` defaults to the "restore_backend"
+    config key: "com", "powershell" or "fake".
+    """
+    if name is None:
+        from core.config import ConfigManager
+        name = ConfigManager().get("restore_backend") or default_backend_name()
+
+    with _lock:
+        backend = _instances.get(name)
+        if backend is None:
+            backend = _create(name)
+            _instances[name] = backend
+        return backend
+
+
+def _create(name):
+    if name == "com":
+        from core.backends.com import ComBackend
+        return ComBackend()
+    if name == "powershell":
+        from core.backends.powershell import PowerShellBackend
+        return PowerShellBackend()
+    if name == "fake":
+        from core.backends.fake import FakeBackend
+        from core.config import ConfigManager
+        return FakeBackend(points=int(ConfigManager().get("fake_backend_points", 12)))
+    raise ValueError(f"Unknown restore backend: {name}")
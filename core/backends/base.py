@@ -0,0 +1,60 @@
+class RestoreBackend:
+    """
+    Access path to System Restore / VSS data.
+    Listing methods return raw rows with the WMI property names
+    (SequenceNumber, CreationTime, ID, InstallDate, ...); parsing and
+    correlation stay in RestorePointManager. Mutations return
+    {'success': bool, 'error': str}.
+    """
+    name = "base"
+    requires_admin = True
+    # Backend to retry creation with when this one fails (None = no fallback)
+    create_fallback = None
+
+    def list_points(self):
+        """Returns (SystemRestore rows, Win32_ShadowCopy rows)."""
+        raise NotImplementedError
+
+    def list_storage(self):
+        """Returns (Win32_ShadowStorage rows, Win32_Volume rows)."""
+        raise NotImplementedError
+
+    def snapshot(self):
+        """All four row lists; backends override this to do it in one round-trip."""
+        points, shadows = self.list_points()
+        storage, volumes = self.list_storage()
+        return {'Points': points, 'Shadows': shadows, 'Storage': storage, 'Volumes': volumes}
+
+    def count_points(self):
+        return len(self.list_points()[0])
+
+    def delete_shadow(self, shadow_id):
+        raise NotImplementedError
+
+    def delete_sequence(self, sequence_number):
+        raise NotImplementedError
+
+    def delete_many(self, pairs):
+        """
+        Hybrid bulk delete of [(sequence_number, shadow_id)]: shadow copy first,
+        SequenceNumber for the ones whose shadow wasn't deleted.
+        Returns {'success': bool, 'error': str, 'shadows': {sid: (ok, error)},
+        'sequences': {seq: (ok, error)}}; ids the system didn't know are simply
+        absent. success is False when the call itself failed (no response,
+        query refused): absent ids then prove nothing. Backends override this
+        to do the whole batch in one invocation.
+        """
+        shadows, sequences = {}, {}
+        for seq, sid in pairs:
+            if sid:
+                res = self.delete_shadow(sid)
+                shadows[sid] = (res['success'], res['error'])
+                if res['success']:
+                    continue
+            if seq is not None:
+                res = self.delete_sequence(seq)
+                sequences[seq] = (res['success'], res['error'])
+        return {'success': True, 'error': '', 'shadows': shadows, 'sequences': sequences}
+
+    def create(self, description):
+        raise NotImplementedError
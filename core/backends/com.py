@@ -0,0 +1,109 @@
+import threading
+
+from core.backends.base import RestoreBackend
+
+
+class ComBackend(RestoreBackend):
+    """
+    Native WMI over COM (pywin32): no shell process at all.
+    COM objects are apartment bound, so every thread gets its own connections.
+    """
+    name = "com"
+    create_fallback = "powershell"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def list_points(self):
+        points = self._select("root\\default", "SystemRestore", ("SequenceNumber", "Description", "CreationTime"))
+        shadows = self._select("root\\cimv2", "Win32_ShadowCopy", ("ID", "InstallDate"))
+        return points, shadows
+
+    def list_storage(self):
+        storage = self._select("root\\cimv2", "Win32_ShadowStorage", ("Volume", "UsedSpace", "AllocatedSpace", "MaxSpace"))
+        volumes = self._select("root\\cimv2", "Win32_Volume", ("DeviceID", "DriveLetter", "Capacity"))
+        return storage, volumes
+
+    def count_points(self):
+        return self._services("root\\default").ExecQuery("SELECT SequenceNumber FROM SystemRestore").Count
+
+    def delete_shadow(self, shadow_id):
+        return self._delete("root\\cimv2", f"SELECT * FROM Win32_ShadowCopy WHERE ID = '{shadow_id}'")
+
+    def delete_sequence(self, sequence_number):
+        return self._delete("root\\default", f"SELECT * FROM SystemRestore WHERE SequenceNumber = {int(sequence_number)}")
+
+    def delete_many(self, pairs):
+        shadows, sequences = {}, {}
+        try:
+            sids = [sid for _, sid in pairs if sid]
+            for chunk in _chunks(sids, 50):
+                where = " OR ".join(f"ID = '{sid}'" for sid in chunk)
+                for obj in self._services("root\\cimv2").ExecQuery(f"SELECT * FROM Win32_ShadowCopy WHERE {where}"):
+                    shadows[obj.ID] = self._delete_obj(obj)
+
+            left = [int(seq) for seq, sid in pairs
+                    if seq is not None and not (sid and shadows.get(sid, (False,))[0])]
+            for chunk in _chunks(left, 50):
+                where = " OR ".join(f"SequenceNumber = {seq}" for seq in chunk)
+                for obj in self._services("root\\default").ExecQuery(f"SELECT * FROM SystemRestore WHERE {where}"):
+                    sequences[int(obj.SequenceNumber)] = self._delete_obj(obj)
+        except Exception as e:
+            # The query itself failed (e.g. access denied): missing ids mean nothing
+            return {'success': False, 'error': str(e), 'shadows': shadows, 'sequences': sequences}
+        return {'success': True, 'error': '', 'shadows': shadows, 'sequences': sequences}
+
+    def create(self, description):
+        try:
+            import win32com.client
+            self._init_thread()
+            o = win32com.client.GetObject("winmgmts:\\\\.\\root\\default:SystemRestore")
+            code = o.CreateRestorePoint(description, 12, 100)
+            if code == 0:
+                return {'success': True, 'error': ''}
+            return {'success': False, 'error': f"CreateRestorePoint returned {code}"}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    def _init_thread(self):
+        if not getattr(self._local, 'initialized', False):
+            import pythoncom
+            pythoncom.CoInitialize()
+            self._local.initialized = True
+            self._local.services = {}
+
+    def _services(self, namespace):
+        self._init_thread()
+        services = self._local.services.get(namespace)
+        if services is None:
+            import win32com.client
+            services = win32com.client.GetObject(f"winmgmts:{{impersonationLevel=impersonate}}!\\\\.\\{namespace}")
+            self._local.services[namespace] = services
+        return services
+
+    def _select(self, namespace, wmi_class, props):
+        rows = []
+        for obj in self._services(namespace).ExecQuery(f"SELECT {', '.join(props)} FROM {wmi_class}"):
+            rows.append({p: getattr(obj, p, None) for p in props})
+        return rows
+
+    @staticmethod
+    def _delete_obj(obj):
+        try:
+            obj.Delete_()
+            return True, ''
+        except Exception as e:
+            return False, str(e)
+
+    def _delete(self, namespace, query):
+        try:
+            for obj in self._services(namespace).ExecQuery(query):
+                obj.Delete_()
+            return {'success': True, 'error': ''}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
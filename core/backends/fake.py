@@ -0,0 +1,128 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from core.backends.base import RestoreBackend
+
+GB = 1024 ** 3
+
+
+def _wmi_time(dt):
+    return dt.strftime("%Y%m%d%H%M%S") + ".000000+000"
+
+
+class FakeBackend(RestoreBackend):
+    """
+    In-memory System Restore: any number of points/shadows, optional
+    per-call latency. Makes the app and its benchmarks runnable without Windows.
+    """
+    name = "fake"
+    requires_admin = False
+
+    def __init__(self, points=0, shadows=None, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.seed(points, shadows)
+
+    def seed(self, points, shadows=None):
+        """Replaces the contents with `points` restore points, `shadows` of them backed by VSS."""
+        if shadows is None:
+            shadows = points
+        base = datetime.now() - timedelta(days=points)
+        with self._lock:
+            self._points = []
+            self._shadows = []
+            self._next_seq = 1
+            for i in range(points):
+                self._add(f"Vortex Restore Point #{i + 1}", base + timedelta(days=i), with_shadow=i >= points - shadows)
+
+    def list_points(self):
+        self._tick()
+        return self._point_rows()
+
+    def list_storage(self):
+        self._tick()
+        return self._storage_rows()
+
+    def snapshot(self):
+        self._tick() # One round-trip, like the real backends
+        points, shadows = self._point_rows()
+        storage, volumes = self._storage_rows()
+        return {'Points': points, 'Shadows': shadows, 'Storage': storage, 'Volumes': volumes}
+
+    def count_points(self):
+        self._tick()
+        with self._lock:
+            return len(self._points)
+
+    def delete_shadow(self, shadow_id):
+        self._tick()
+        with self._lock:
+            before = len(self._shadows)
+            self._shadows = [s for s in self._shadows if s['ID'] != shadow_id]
+            if len(self._shadows) != before:
+                # Without its snapshot the restore point is gone as well
+                self._points = [p for p in self._points if p['shadow'] != shadow_id]
+        return {'success': True, 'error': ''}
+
+    def delete_sequence(self, sequence_number):
+        self._tick()
+        with self._lock:
+            gone = [p for p in self._points if p['SequenceNumber'] == sequence_number]
+            self._points = [p for p in self._points if p['SequenceNumber'] != sequence_number]
+            sids = {p['shadow'] for p in gone}
+            self._shadows = [s for s in self._shadows if s['ID'] not in sids]
+        return {'success': True, 'error': ''}
+
+    def delete_many(self, pairs):
+        self._tick() # One invocation for the whole batch
+        shadows, sequences = {}, {}
+        with self._lock:
+            for seq, sid in pairs:
+                if sid and any(s['ID'] == sid for s in self._shadows):
+                    self._shadows = [s for s in self._shadows if s['ID'] != sid]
+                    self._points = [p for p in self._points if p['shadow'] != sid]
+                    shadows[sid] = (True, '')
+                elif seq is not None and any(p['SequenceNumber'] == seq for p in self._points):
+                    self._points = [p for p in self._points if p['SequenceNumber'] != seq]
+                    sequences[seq] = (True, '')
+        return {'success': True, 'error': '', 'shadows': shadows, 'sequences': sequences}
+
+    def create(self, description):
+        self._tick()
+        with self._lock:
+            self._add(description, datetime.now(), with_shadow=True)
+        return {'success': True, 'error': ''}
+
+    def _add(self, description, dt, with_shadow):
+        seq = self._next_seq
+        self._next_seq += 1
+        sid = ''
+        if with_shadow:
+            sid = f"{{FA4E0000-0000-0000-0000-{seq:012d}}}"
+            self._shadows.append({'ID': sid, 'InstallDate': _wmi_time(dt + timedelta(seconds=3)),
+                                  'size': (256 + seq % 7 * 64) * 1024 ** 2})
+        self._points.append({'SequenceNumber': seq, 'Description': description,
+                             'CreationTime': _wmi_time(dt), 'shadow': sid})
+
+    def _point_rows(self):
+        with self._lock:
+            points = [{k: p[k] for k in ('SequenceNumber', 'Description', 'CreationTime')} for p in self._points]
+            shadows = [{k: s[k] for k in ('ID', 'InstallDate')} for s in self._shadows]
+        return points, shadows
+
+    def _storage_rows(self):
+        with self._lock:
+            used = sum(s['size'] for s in self._shadows)
+        device = "\\\\?\\Volume{00000000-0000-0000-0000-000000000000}\\"
+        escaped = device.replace("\\", "\\\\")
+        storage = [{'Volume': f'Win32_Volume.DeviceID="{escaped}"',
+                    'UsedSpace': used, 'AllocatedSpace': used, 'MaxSpace': 50 * GB}]
+        volumes = [{'DeviceID': device, 'DriveLetter': 'C:', 'Capacity': 500 * GB}]
+        return storage, volumes
+
+    def _tick(self):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
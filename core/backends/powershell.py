@@ -0,0 +1,143 @@
+import json
+
+from core.backends.base import RestoreBackend
+
+
+class PowerShellBackend(RestoreBackend):
+    """WMI through PowerShell scripts, executed in the persistent shell host."""
+    name = "powershell"
+
+    POINTS_SCRIPT = (
+        "$rps = Get-WmiObject -Namespace root\\default -Class SystemRestore | "
+        "  Select-Object SequenceNumber, Description, CreationTime; "
+        "$shadows = Get-WmiObject Win32_ShadowCopy | Select-Object ID, InstallDate; "
+    )
+    STORAGE_SCRIPT = (
+        "$storage = Get-WmiObject Win32_ShadowStorage | Select-Object Volume, UsedSpace, AllocatedSpace, MaxSpace; "
+        "$vols = Get-WmiObject Win32_Volume | Select-Object DeviceID, DriveLetter, Capacity; "
+    )
+
+    def list_points(self):
+        raw = self._query(self.POINTS_SCRIPT + "@{ Points = @($rps); Shadows = @($shadows) }")
+        return raw.get('Points') or [], raw.get('Shadows') or []
+
+    def list_storage(self):
+        raw = self._query(self.STORAGE_SCRIPT + "@{ Storage = @($storage); Volumes = @($vols) }")
+        return raw.get('Storage') or [], raw.get('Volumes') or []
+
+    def snapshot(self):
+        raw = self._query(
+            self.POINTS_SCRIPT + self.STORAGE_SCRIPT +
+            "@{ Points = @($rps); Shadows = @($shadows); Storage = @($storage); Volumes = @($vols) }"
+        )
+        return {key: raw.get(key) or [] for key in ('Points', 'Shadows', 'Storage', 'Volumes')}
+
+    def count_points(self):
+        data = self.run_json("@(Get-WmiObject -Namespace root\\default -Class SystemRestore).Count")
+        return int(data[0]) if data else 0
+
+    def delete_shadow(self, shadow_id):
+        return self.run_raw(
+            f"Get-WmiObject Win32_ShadowCopy | Where-Object {{ $_.ID -eq '{shadow_id}' }} | ForEach-Object {{ $_.Delete() }}"
+        )
+
+    def delete_sequence(self, sequence_number):
+        return self.run_raw(
+            f"Get-WmiObject -Namespace root\\default -Class SystemRestore | "
+            f"Where-Object {{ $_.SequenceNumber -eq {int(sequence_number)} }} | ForEach-Object {{ $_.Delete() }}"
+        )
+
+    def delete_many(self, pairs):
+        # One script: WQL-filtered deletes for the shadows, then for the
+        # SequenceNumbers whose shadow wasn't removed. Chunked to keep queries short.
+        # A query that fails (access denied...) is reported in Error, not skipped.
+        lines = ["$out = @(); $done = @{}; $failed = ''; "]
+        sids = [sid for _, sid in pairs if sid]
+        for chunk in _chunks(sids, 50):
+            where = " OR ".join(f"ID='{sid}'" for sid in chunk)
+            lines.append(
+                f"try {{ Get-WmiObject -Query \"SELECT * FROM Win32_ShadowCopy WHERE {where}\" -ErrorAction Stop | ForEach-Object {{ "
+                "$id = $_.ID; "
+                "try { $_.Delete(); $done[$id] = 1; $out += @{ Kind='shadow'; Key=$id; Ok=$true; Error='' } } "
+                "catch { $out += @{ Kind='shadow'; Key=$id; Ok=$false; Error=$_.Exception.Message } } } } "
+                "catch { $failed = $_.Exception.Message }; "
+            )
+        fallback = [(int(seq), sid) for seq, sid in pairs if seq is not None]
+        for chunk in _chunks(fallback, 50):
+            pairs_ps = ", ".join(f"@{{ Seq={seq}; Sid='{sid or ''}' }}" for seq, sid in chunk)
+            lines.append(
+                f"$left = @(@({pairs_ps}) | Where-Object {{ -not $done.ContainsKey($_.Sid) }} | ForEach-Object {{ $_.Seq }}); "
+                "if ($left.Count) { "
+                "$where = ($left | ForEach-Object { 'SequenceNumber=' + $_ }) -join ' OR '; "
+                "try { Get-WmiObject -Namespace root\\default -Query ('SELECT * FROM SystemRestore WHERE ' + $where) -ErrorAction Stop | ForEach-Object { "
+                "$seq = $_.SequenceNumber; "
+                "try { $_.Delete(); $out += @{ Kind='seq'; Key=$seq; Ok=$true; Error='' } } "
+                "catch { $out += @{ Kind='seq'; Key=$seq; Ok=$false; Error=$_.Exception.Message } } } } "
+                "catch { $failed = $_.Exception.Message } }; "
+            )
+        lines.append("ConvertTo-Json -InputObject @{ Items = @($out); Error = $failed } -Compress -Depth 3")
+
+        shadows, sequences = {}, {}
+        data, error = self.run_json_checked("".join(lines))
+        report = data[0] if data and isinstance(data[0], dict) else None
+        if report is None:
+            return {'success': False, 'error': error or "Нет ответа от PowerShell",
+                    'shadows': shadows, 'sequences': sequences}
+        for item in report.get('Items') or []:
+            try:
+                status = (bool(item.get('Ok')), item.get('Error') or '')
+                if item.get('Kind') == 'shadow':
+                    shadows[item.get('Key')] = status
+                else:
+                    sequences[int(item.get('Key'))] = status
+            except: pass
+        failed = report.get('Error') or ''
+        return {'success': not failed, 'error': failed, 'shadows': shadows, 'sequences': sequences}
+
+    def create(self, description):
+        safe = description.replace("'", "''")
+        return self.run_raw(f"Checkpoint-Computer -Description '{safe}' -RestorePointType 'MODIFY_SETTINGS'")
+
+    def _query(self, script):
+        data = self.run_json(script + " | ConvertTo-Json -Compress -Depth 3")
+        return data[0] if data and isinstance(data[0], dict) else {}
+
+    @staticmethod
+    def run_raw(cmd):
+        from core.ps_host import get_host
+        try:
+            res = get_host().run(cmd)
+            if res['success']:
+                return {'success': True, 'error': ''}
+            else:
+                return {'success': False, 'error': res['error'].strip() or "Unknown PS Error"}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def run_json(cmd):
+        return PowerShellBackend.run_json_checked(cmd)[0] or []
+
+    @staticmethod
+    def run_json_checked(cmd):
+        """(rows, error): rows is None when the host failed or sent no usable JSON."""
+        from core.ps_host import get_host
+        try:
+            res = get_host().run(cmd)
+            raw = res['output'].strip()
+            if not raw:
+                return None, res['error'].strip() or "Unknown PS Error"
+            try:
+                data = json.loads(raw)
+            except Exception as e:
+                # Partial/bad JSON
+                return None, f"Bad JSON from PowerShell: {e}"
+            if not isinstance(data, list): data = [data]
+            return data, ''
+        except Exception as e:
+            return None, str(e)
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
@@ -0,0 +1,36 @@
+import threading
+
+_cleaner = None
+_index = None
+_finder = None
+_lock = threading.Lock()
+
+
+def get_cleaner():
+    """Application-wide CleanupEngine."""
+    global _cleaner
+    with _lock:
+        if _cleaner is None:
+            from core.cleanup.engine import CleanupEngine
+            _cleaner = CleanupEngine()
+        return _cleaner
+
+
+def get_index():
+    """Application-wide SpaceIndex (persisted next to the config)."""
+    global _index
+    with _lock:
+        if _index is None:
+            from core.cleanup.index import SpaceIndex
+            _index = SpaceIndex()
+        return _index
+
+
+def get_finder():
+    """Application-wide DuplicateFinder (its hash cache is shared by every search)."""
+    global _finder
+    with _lock:
+        if _finder is None:
+            from core.cleanup.duplicates import DuplicateFinder
+            _finder = DuplicateFinder()
+        return _finder
@@ -0,0 +1,306 @@
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import stat
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+HASH_CACHE_FILE = "hash_cache.json"
+HASH_CACHE_VERSION = 1
+BLOCK_SIZE = 64 * 1024 # head and tail hashed in stage 2
+POOL_MIN_FILES = 32 # fewer files than this are hashed in-process: not worth starting workers
+CHUNK_FILES = 16 # files per worker task
+
+STAGE_SIZE = "size"
+STAGE_PARTIAL = "partial"
+STAGE_FULL = "full"
+
+
+def partial_hash(path, size, block=BLOCK_SIZE):
+    """Hash of the first and last block; for files up to two blocks that's the whole file."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if size <= 2 * block:
+            h.update(f.read())
+            return h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h.update(mm[:block])
+            h.update(mm[-block:])
+    return h.hexdigest()
+
+
+def full_hash(path, size):
+    h = hashlib.blake2b(digest_size=16)
+    if not size:
+        return h.hexdigest()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Pages are mapped lazily; hashing slices keeps the resident set small
+        step = 8 * 1024 * 1024
+        for offset in range(0, len(mm), step):
+            h.update(mm[offset:offset + step])
+    return h.hexdigest()
+
+
+def _unchanged(path, mtime, size):
+    """True if `path` is still a regular file with the size and mtime seen by the search."""
+    try:
+        info = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return False
+    return stat.S_ISREG(info.st_mode) and info.st_size == size and info.st_mtime_ns == mtime
+
+
+def _hash_chunk(stage, items):
+    """Worker entry point: [(path, size)] -> [(path, hash or None)]."""
+    fn = partial_hash if stage == STAGE_PARTIAL else full_hash
+    results = []
+    for path, size in items:
+        try:
+            results.append((path, fn(path, size)))
+        except (OSError, ValueError):
+            results.append((path, None)) # gone, locked or unreadable: not a duplicate
+    return results
+
+
+class DuplicateFinder:
+    """
+    Finds files with identical content in three stages, each one only
+    looking at what the previous one left: group by size, hash the first
+    and last block, then hash the remaining candidates in full. Hashing
+    runs on a process pool with memory-mapped reads, and hashes are cached
+    on disk by (path, size, mtime), so a repeat search over unchanged files
+    reads nothing. Hard links to the same file are never reported.
+    """
+    def __init__(self, cache_path=HASH_CACHE_FILE, max_workers=None, use_processes=True):
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.hashed = {STAGE_PARTIAL: 0, STAGE_FULL: 0} # files actually read, since creation
+
+        self._lock = threading.Lock()
+        self._cache = None # path -> [size, mtime_ns, partial, full]
+        self._dirty = False
+
+    def find(self, roots, min_size=1, on_progress=None, token=None):
+        """
+        Returns {'groups': [{'size', 'hash', 'paths', 'mtimes'}], 'files': int,
+        'wasted': bytes, 'stages': {stage: files looked at}, 'elapsed': seconds}.
+        Groups are sorted by wasted space; paths in a group by mtime, oldest first,
+        with their mtime_ns at the same index in 'mtimes'.
+        on_progress(stage, done, total) is called from the calling thread.
+        """
+        start = time.perf_counter()
+        self._ensure_loaded()
+        roots = [os.path.abspath(root) for root in roots]
+        files = self._collect(roots, min_size, token)
+        stages = {STAGE_SIZE: len(files)}
+        if token is None or not token.is_set():
+            self._prune(roots, files)
+
+        by_size = {}
+        for info in files:
+            by_size.setdefault(info[1], []).append(info)
+        candidates = [info for group in by_size.values() if len(group) > 1 for info in group]
+        if on_progress is not None:
+            on_progress(STAGE_SIZE, len(files), len(files))
+
+        stages[STAGE_PARTIAL] = len(candidates)
+        partial = self._hashes(STAGE_PARTIAL, candidates, on_progress, token)
+        groups = self._regroup(candidates, lambda info: (info[1], partial.get(info[0])))
+
+        # Up to two blocks the partial hash already covered the whole file
+        small = [g for g in groups if g[0][1] <= 2 * BLOCK_SIZE]
+        large = [info for g in groups if g[0][1] > 2 * BLOCK_SIZE for info in g]
+        stages[STAGE_FULL] = len(large)
+        full = self._hashes(STAGE_FULL, large, on_progress, token)
+        groups = small + self._regroup(large, lambda info: (info[1], full.get(info[0])))
+        self.save()
+
+        result = []
+        for group in groups:
+            group.sort(key=lambda info: info[2])
+            size = group[0][1]
+            digest = partial[group[0][0]] if size <= 2 * BLOCK_SIZE else full[group[0][0]]
+            result.append({'size': size, 'hash': digest, 'paths': [info[0] for info in group],
+                           'mtimes': [info[2] for info in group]})
+        result.sort(key=lambda g: g['size'] * (len(g['paths']) - 1), reverse=True)
+        return {'groups': result, 'files': len(files),
+                'wasted': sum(g['size'] * (len(g['paths']) - 1) for g in result),
+                'stages': stages, 'elapsed': time.perf_counter() - start}
+
+    @staticmethod
+    def _collect(roots, min_size, token):
+        """[(path, size, mtime_ns)] of regular files, one entry per (device, inode)."""
+        files = []
+        seen = set()
+        stack = list(roots)
+        while stack:
+            if token is not None and token.is_set():
+                break
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_symlink():
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if info.st_size < min_size:
+                    continue
+                # Hard links share the data: deleting one frees nothing.
+                # DirEntry.inode() is also filled in on Windows, where stat() from scandir has no st_ino
+                inode = (info.st_dev, entry.inode()) if entry.inode() else None
+                if inode is not None:
+                    if inode in seen:
+                        continue
+                    seen.add(inode)
+                files.append((entry.path, info.st_size, info.st_mtime_ns))
+        return files
+
+    @staticmethod
+    def _regroup(infos, key):
+        groups = {}
+        for info in infos:
+            k = key(info)
+            if k[1] is not None:
+                groups.setdefault(k, []).append(info)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def _hashes(self, stage, infos, on_progress, token):
+        """{path: hash} for the stage, from the cache where (size, mtime) still match."""
+        slot = 2 if stage == STAGE_PARTIAL else 3
+        hashes = {}
+        todo = []
+        with self._lock:
+            for path, size, mtime in infos:
+                cached = self._cache.get(path)
+                if cached and cached[0] == size and cached[1] == mtime and cached[slot]:
+                    hashes[path] = cached[slot]
+                else:
+                    todo.append((path, size, mtime))
+
+        stamps = {path: (size, mtime) for path, size, mtime in todo}
+        done = len(hashes)
+        total = len(infos)
+        for results in self._run(stage, [(path, size) for path, size, _ in todo], token):
+            with self._lock:
+                for path, digest in results:
+                    if digest is None:
+                        continue
+                    hashes[path] = digest
+                    size, mtime = stamps[path]
+                    entry = self._cache.get(path)
+                    if not entry or entry[0] != size or entry[1] != mtime:
+                        entry = [size, mtime, None, None]
+                    entry[slot] = digest
+                    self._cache[path] = entry
+                self._dirty = True
+            done += len(results)
+            self.hashed[stage] += len(results)
+            if on_progress is not None:
+                on_progress(stage, done, total)
+        return hashes
+
+    def _run(self, stage, items, token):
+        """Yields [(path, hash)] chunks as they complete."""
+        chunks = [items[i:i + CHUNK_FILES] for i in range(0, len(items), CHUNK_FILES)]
+        if not self.use_processes or len(items) < POOL_MIN_FILES:
+            for chunk in chunks:
+                if token is not None and token.is_set():
+                    return
+                yield _hash_chunk(stage, chunk)
+            return
+        # spawn everywhere: forking a process that runs Qt and worker threads isn't safe
+        with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = [pool.submit(_hash_chunk, stage, chunk) for chunk in chunks]
+            try:
+                for future in futures:
+                    if token is not None and token.is_set():
+                        return
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def remove(groups):
+        """
+        Deletes the copies picked in find() results. Each group is
+        {'size', 'hash', 'keep': (path, mtime_ns), 'copies': [(path, mtime_ns)]}.
+        A group is skipped when its kept file is gone or changed since the
+        search: deleting the copies would leave no file with that content.
+        A copy whose size and mtime still match is deleted; one touched since
+        then is hashed again and only deleted if the content is unchanged.
+        Returns (bytes freed, [paths not deleted]).
+        """
+        freed = 0
+        failed = []
+        for group in groups:
+            size = group['size']
+            copies = [path for path, _ in group['copies']]
+            if not _unchanged(*group['keep'], size):
+                failed.extend(copies)
+                continue
+            for path, mtime in group['copies']:
+                try:
+                    if not _unchanged(path, mtime, size):
+                        fn = partial_hash if size <= 2 * BLOCK_SIZE else full_hash
+                        if os.stat(path).st_size != size or fn(path, size) != group['hash']:
+                            raise OSError("changed since the search")
+                    os.remove(path)
+                    freed += size
+                except (OSError, ValueError):
+                    failed.append(path)
+        return freed, failed
+
+    # --- Hash cache ---
+
+    def _prune(self, roots, files):
+        """Drops cached hashes of files under `roots` that no longer exist."""
+        prefixes = tuple(os.path.join(root, "") for root in roots)
+        present = {info[0] for info in files}
+        with self._lock:
+            stale = [path for path in self._cache if path.startswith(prefixes) and path not in present]
+            for path in stale:
+                del self._cache[path]
+            if stale:
+                self._dirty = True
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._cache is not None:
+                return
+            self._cache = {}
+            if not self.cache_path or not os.path.exists(self.cache_path):
+                return
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == HASH_CACHE_VERSION:
+                    self._cache = data.get("files", {})
+            except Exception as e:
+                print(f"[SYSTEM] Hash cache unreadable, starting over: {e}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or not self.cache_path:
+                return
+            data = json.dumps({"version": HASH_CACHE_VERSION, "files": self._cache}, ensure_ascii=False)
+            self._dirty = False
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"[SYSTEM] Could not save hash cache: {e}")
@@ -0,0 +1,206 @@
+import os
+import stat
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROGRESS_INTERVAL = 0.1 # seconds between progress reports
+
+# POSIX: list and delete through a directory descriptor (like shutil.rmtree does);
+# Windows has no dir_fd support and uses full paths
+_USE_DIR_FD = ({os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd
+               and hasattr(os, "O_DIRECTORY"))
+
+
+def format_size(size):
+    for unit in ("Б", "КБ", "МБ", "ГБ"):
+        if size < 1024 or unit == "ГБ":
+            return f"{size:.0f} {unit}" if unit == "Б" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class _TargetStats:
+    """Counters of one target, updated once per directory from the pool threads."""
+    def __init__(self, target):
+        self.target = target
+        self.files = 0
+        self.bytes = 0
+        self.skipped = 0 # locked / in use / no access: left in place
+        self.dirs = [] # (depth, path) of subdirectories, removed bottom-up at the end
+        self.dirs_removed = 0
+        self.error = ""
+        self.lock = threading.Lock()
+
+    def add(self, files, size, skipped, dirs, error=""):
+        with self.lock:
+            self.files += files
+            self.bytes += size
+            self.skipped += skipped
+            self.dirs.extend(dirs)
+            if error and not self.error:
+                self.error = error
+
+    def report(self, elapsed):
+        with self.lock:
+            return {'target': self.target.id, 'title': self.target.title, 'success': not self.error,
+                    'files': self.files, 'bytes': self.bytes, 'skipped': self.skipped,
+                    'dirs': self.dirs_removed, 'elapsed': elapsed, 'error': self.error}
+
+
+class CleanupEngine:
+    """
+    Deletes the contents of cleanup targets; the target roots themselves stay.
+    Every directory is one pool task: it is listed with os.scandir and its
+    files are deleted in the same pass, while subdirectories are queued as
+    new tasks. Locked or inaccessible files are counted and skipped, never
+    retried or waited on. Emptied directories are removed deepest-first
+    once the walk is done.
+    """
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+
+    def clean(self, targets, on_progress=None, token=None):
+        """
+        Returns {'success': bool, 'targets': {id: report}, 'bytes': int,
+        'elapsed': seconds, 'error': str}; a report holds files, bytes,
+        skipped, dirs (removed), elapsed and error for one target.
+        on_progress(info) is called from the calling thread every
+        PROGRESS_INTERVAL with cumulative 'files', 'bytes', 'skipped'.
+        """
+        start = time.perf_counter()
+        stats = [_TargetStats(target) for target in targets]
+        pending = [0]
+        idle = threading.Condition()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def submit(st, path, depth):
+                with idle:
+                    pending[0] += 1
+                pool.submit(task, st, path, depth)
+
+            def task(st, path, depth):
+                try:
+                    if token is None or not token.is_set():
+                        self._clean_dir(st, path, depth, submit)
+                except Exception as e:
+                    st.add(0, 0, 0, [], str(e) or e.__class__.__name__)
+                finally:
+                    with idle:
+                        pending[0] -= 1
+                        if not pending[0]:
+                            idle.notify_all()
+
+            for st in stats:
+                roots = st.target.roots()
+                if not roots:
+                    st.add(0, 0, 0, [], "Папка не найдена")
+                for root in roots:
+                    submit(st, root, 0)
+
+            with idle:
+                while pending[0]:
+                    idle.wait(PROGRESS_INTERVAL)
+                    if on_progress is not None and pending[0]:
+                        on_progress(self._progress(stats))
+
+        for st in stats:
+            if token is not None and token.is_set():
+                break
+            # Deepest first; a directory that still holds skipped files just stays
+            for _, path in sorted(st.dirs, key=lambda item: item[0], reverse=True):
+                try:
+                    os.rmdir(path)
+                    st.dirs_removed += 1
+                except OSError:
+                    pass
+
+        elapsed = time.perf_counter() - start
+        reports = {st.target.id: st.report(elapsed) for st in stats}
+        if on_progress is not None:
+            on_progress(self._progress(stats))
+        errors = [report['error'] for report in reports.values() if report['error']]
+        if token is not None and token.is_set():
+            errors.insert(0, "Отменено")
+        return {'success': not errors, 'targets': reports,
+                'bytes': sum(report['bytes'] for report in reports.values()),
+                'elapsed': elapsed, 'error': errors[0] if errors else ""}
+
+    @staticmethod
+    def _progress(stats):
+        info = {'files': 0, 'bytes': 0, 'skipped': 0}
+        for st in stats:
+            with st.lock:
+                info['files'] += st.files
+                info['bytes'] += st.bytes
+                info['skipped'] += st.skipped
+        return info
+
+    @staticmethod
+    def _clean_dir(st, path, depth, submit):
+        files = size = skipped = 0
+        dirs = []
+        fd = None
+        try:
+            if _USE_DIR_FD:
+                # One open handle for the whole directory: names are resolved relative to it,
+                # and a directory swapped for a symlink after listing is never followed
+                fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | getattr(os, "O_NOFOLLOW", 0))
+            with os.scandir(path if fd is None else fd) as it:
+                entries = list(it)
+        except OSError:
+            if fd is not None:
+                os.close(fd)
+            st.add(0, 0, 1, [])
+            return
+
+        try:
+            for entry in entries:
+                name = entry.path if fd is None else entry.name
+                try:
+                    if is_link(entry):
+                        # Never followed: only the link itself goes
+                        _remove_link(name, fd)
+                        files += 1
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        child = os.path.join(path, entry.name)
+                        dirs.append((depth + 1, child))
+                        submit(st, child, depth + 1)
+                        continue
+                    info = entry.stat(follow_symlinks=False)
+                    _unlink(name, fd, info)
+                    files += 1
+                    size += info.st_size
+                except OSError:
+                    skipped += 1
+        finally:
+            if fd is not None:
+                os.close(fd)
+        st.add(files, size, skipped, dirs)
+
+
+def is_link(entry):
+    if entry.is_symlink():
+        return True
+    is_junction = getattr(entry, "is_junction", None) # Python 3.12+
+    return bool(is_junction and is_junction())
+
+
+def _remove_link(name, fd):
+    try:
+        os.unlink(name, dir_fd=fd)
+    except OSError:
+        os.rmdir(name, dir_fd=fd) # Directory links / junctions on Windows
+
+
+def _unlink(name, fd, info):
+    try:
+        os.unlink(name, dir_fd=fd)
+    except PermissionError:
+        # Read-only files can't be deleted on Windows until the flag is cleared;
+        # anything else (in use by another process) is left alone
+        if sys.platform != "win32" or not getattr(info, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_READONLY:
+            raise
+        os.chmod(name, stat.S_IWRITE)
+        os.unlink(name)
@@ -0,0 +1,208 @@
+import heapq
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.cleanup.engine import is_link
+
+INDEX_FILE = "cleanup_index.json"
+INDEX_VERSION = 1
+TOP_KEEP = 20 # largest files remembered per directory
+
+# Summary of one directory (its own files only), as stored in the index
+MTIME, FILES, BYTES, SUBDIRS, TOP = range(5)
+
+
+class SpaceIndex:
+    """
+    Persisted per-directory summary of what cleanup targets hold: for each
+    directory its mtime, the count and size of its own files, its
+    subdirectories and its largest files. A directory's mtime changes when
+    entries are added, removed or renamed in it, so a repeat estimate only
+    stats every directory and re-lists the ones whose mtime moved. Files
+    rewritten in place don't touch it; estimate(force=True) re-lists all.
+    """
+    def __init__(self, path=INDEX_FILE, max_workers=8, top_keep=TOP_KEEP):
+        self.path = path
+        self.max_workers = max_workers
+        self.top_keep = top_keep
+        self.rescans = 0 # directories listed since creation
+
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock() # one writer at a time
+        self._dirs = None # path -> [mtime_ns, files, bytes, [subdir names], [[size, name]]]
+        self._dirty = False
+
+    def estimate(self, targets, force=False, token=None):
+        """
+        Returns {'targets': {id: {'files', 'bytes', 'dirs', 'rescanned'}},
+        'bytes': int, 'elapsed': seconds}; rescanned counts the
+        directories that actually had to be listed.
+        """
+        start = time.perf_counter()
+        self._ensure_loaded()
+        totals = {target.id: {'files': 0, 'bytes': 0, 'dirs': 0, 'rescanned': 0} for target in targets}
+        visited = set()
+        pending = [0]
+        idle = threading.Condition()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def submit(target_id, path):
+                with idle:
+                    pending[0] += 1
+                pool.submit(task, target_id, path)
+
+            def task(target_id, path):
+                try:
+                    if token is None or not token.is_set():
+                        self._visit(totals[target_id], path, force, visited, lambda child: submit(target_id, child))
+                except Exception as e:
+                    print(f"[SYSTEM] Could not index {path}: {e}")
+                finally:
+                    with idle:
+                        pending[0] -= 1
+                        if not pending[0]:
+                            idle.notify_all()
+
+            roots = {target.id: target.roots() for target in targets}
+            for target_id, paths in roots.items():
+                for root in paths:
+                    submit(target_id, root)
+            with idle:
+                while pending[0]:
+                    idle.wait()
+
+        if token is None or not token.is_set():
+            # Directories that are gone (or no longer reachable) leave the index
+            self._prune([root for paths in roots.values() for root in paths], visited)
+        self.save()
+        return {'targets': totals, 'bytes': sum(t['bytes'] for t in totals.values()),
+                'elapsed': time.perf_counter() - start}
+
+    def _visit(self, totals, path, force, visited, submit):
+        try:
+            # Taken before listing: a change during the scan shows up next time
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            summary = self._dirs.get(path)
+        rescanned = summary is None or force or summary[MTIME] != mtime
+        if rescanned:
+            summary = self._scan(path, mtime)
+            if summary is None:
+                return
+            with self._lock:
+                self._dirs[path] = summary
+                self._dirty = True
+                self.rescans += 1
+        with self._lock:
+            visited.add(path)
+            totals['files'] += summary[FILES]
+            totals['bytes'] += summary[BYTES]
+            totals['dirs'] += 1
+            totals['rescanned'] += rescanned
+        for name in summary[SUBDIRS]:
+            submit(os.path.join(path, name))
+
+    def _scan(self, path, mtime):
+        files = size = 0
+        subdirs = []
+        sizes = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        link = is_link(entry)
+                        if not link and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        # Links count as files of size 0: cleanup never follows them
+                        length = 0 if link else entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+                    files += 1
+                    size += length
+                    sizes.append((length, entry.name))
+        except OSError:
+            return None
+        top = [list(item) for item in heapq.nlargest(self.top_keep, sizes)]
+        return [mtime, files, size, subdirs, top]
+
+    def _prune(self, roots, visited):
+        prefixes = tuple(os.path.join(root, "") for root in roots)
+        with self._lock:
+            stale = [path for path in self._dirs
+                     if path not in visited and (path in roots or path.startswith(prefixes))]
+            for path in stale:
+                del self._dirs[path]
+            if stale:
+                self._dirty = True
+
+    def top_files(self, targets, n=10):
+        """[(size, path)] of the largest files in the targets, as of the last estimate()."""
+        self._ensure_loaded()
+        candidates = []
+        with self._lock:
+            for path in self._under(targets):
+                candidates.extend((size, os.path.join(path, name)) for size, name in self._dirs[path][TOP])
+        return heapq.nlargest(min(n, self.top_keep), candidates)
+
+    def top_dirs(self, targets, n=10):
+        """[(bytes, path)] of the largest directories in the targets (subdirectories included)."""
+        self._ensure_loaded()
+        roots = {root for target in targets for root in target.roots()}
+        with self._lock:
+            totals = {path: self._dirs[path][BYTES] for path in self._under(targets)}
+        # Children have longer paths than their parents: deepest totals are complete first
+        for path in sorted(totals, key=len, reverse=True):
+            parent = os.path.dirname(path)
+            if path not in roots and parent in totals:
+                totals[parent] += totals[path]
+        return heapq.nlargest(n, ((size, path) for path, size in totals.items() if path not in roots))
+
+    def _under(self, targets):
+        roots = [root for target in targets for root in target.roots()]
+        prefixes = tuple(os.path.join(root, "") for root in roots)
+        return [path for path in self._dirs if path in roots or path.startswith(prefixes)]
+
+    def invalidate(self):
+        """Forgets everything: the next estimate lists every directory again."""
+        self._ensure_loaded()
+        with self._lock:
+            self._dirs = {}
+            self._dirty = True
+
+    # --- Persistence ---
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._dirs is not None:
+                return
+            self._dirs = {}
+            if not os.path.exists(self.path):
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self._dirs = data.get("dirs", {})
+            except Exception as e:
+                print(f"[SYSTEM] Cleanup index unreadable, rebuilding: {e}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({"version": INDEX_VERSION, "dirs": self._dirs}, ensure_ascii=False)
+            self._dirty = False
+        tmp_path = self.path + ".tmp"
+        with self._io_lock:
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"[SYSTEM] Could not save cleanup index: {e}")
@@ -0,0 +1,67 @@
+"""
+Cleanup targets: named sets of directories whose contents can be deleted.
+
+The defaults are the Windows locations behind the "Прочее" tab actions.
+The "cleanup_targets" config key overrides their paths or adds new
+targets: {"temp": ["/tmp/vortex-bench"], "downloads": ["~/Downloads/tmp"]}.
+The duplicate finder searches the "duplicate_paths" config key instead
+(Downloads by default); those folders are never cleaned wholesale.
+"""
+import os
+
+
+class CleanupTarget:
+    def __init__(self, target_id, title, paths):
+        self.id = target_id
+        self.title = title
+        self.paths = list(paths)
+
+    def roots(self):
+        """Existing directories of this target, with variables and ~ expanded."""
+        roots = []
+        for path in self.paths:
+            path = os.path.expanduser(os.path.expandvars(path))
+            # An unset variable stays as "%NAME%": never guess a location
+            if "%" in path:
+                continue
+            path = os.path.abspath(path)
+            if os.path.isdir(path) and path not in roots:
+                roots.append(path)
+        return roots
+
+    def __repr__(self):
+        return f"<CleanupTarget {self.id}>"
+
+
+DEFAULT_TARGETS = [
+    CleanupTarget("temp", "Временные файлы", [r"%TEMP%", r"%SystemRoot%\Temp"]),
+    CleanupTarget("update_cache", "Кэш обновлений", [r"%SystemRoot%\SoftwareDistribution\Download"]),
+    CleanupTarget("browser_cache", "Кэш браузеров",
+                  [r"%LOCALAPPDATA%\Google\Chrome\User Data\Default\Cache",
+                   r"%LOCALAPPDATA%\Microsoft\Edge\User Data\Default\Cache",
+                   r"%LOCALAPPDATA%\Yandex\YandexBrowser\User Data\Default\Cache"]),
+]
+
+
+def load_targets(overrides=None):
+    """Default targets with the "cleanup_targets" config overrides applied."""
+    if overrides is None:
+        from core.config import ConfigManager
+        overrides = ConfigManager().get("cleanup_targets") or {}
+    targets = {target.id: CleanupTarget(target.id, target.title, target.paths) for target in DEFAULT_TARGETS}
+    for target_id, paths in overrides.items():
+        if isinstance(paths, str):
+            paths = [paths]
+        title = targets[target_id].title if target_id in targets else target_id
+        targets[target_id] = CleanupTarget(target_id, title, paths)
+    return list(targets.values())
+
+
+def get(target_id):
+    return next((target for target in load_targets() if target.id == target_id), None)
+
+
+def duplicates_target():
+    from core.config import ConfigManager
+    paths = ConfigManager().get("duplicate_paths") or [r"%USERPROFILE%\Downloads"]
+    return CleanupTarget("duplicates", "Дубликаты файлов", [paths] if isinstance(paths, str) else paths)
@@ -1,39 +1,119 @@
+import atexit
 import json
 import os
+import threading
+import time
 
 CONFIG_FILE = "config.json"
+FLUSH_DELAY = 0.5 # seconds of quiet before pending changes hit the disk
+FLUSH_MAX_DELAY = 2.0 # steady changes still get written this long after the first one
+
+class ConfigSignal:
+    """Minimal callback list so core code can notify without depending on Qt."""
+    def __init__(self):
+        self._slots = []
+        self._lock = threading.Lock()
+
+    def connect(self, slot):
+        with self._lock:
+            if slot not in self._slots:
+                self._slots.append(slot)
+
+    def disconnect(self, slot):
+        with self._lock:
+            if slot in self._slots:
+                self._slots.remove(slot)
+
+    def emit(self, *args):
+        with self._lock:
+            slots = list(self._slots)
+        for slot in slots:
+            try:
+                slot(*args)
+            except Exception as e:
+                print(f"Error in config listener: {e}")
 
 class ConfigManager:
     _instance = None
+    _instance_lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ConfigManager, cls).__new__(cls)
-            cls._instance.config = {}
-            cls._instance.load_config()
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super(ConfigManager, cls).__new__(cls)
+                instance.config = {}
+                instance.changed = ConfigSignal() # (key, value), called on the thread that changed it
+                instance._lock = threading.RLock()
+                instance._io_lock = threading.Lock() # one writer at a time
+                instance._dirty = False
+                instance._dirty_since = None
+                instance._timer = None
+                instance.load_config()
+                atexit.register(instance.flush)
+                cls._instance = instance
         return cls._instance
 
     def load_config(self):
+        config = {}
         if os.path.exists(CONFIG_FILE):
             try:
                 with open(CONFIG_FILE, 'r') as f:
-                    self.config = json.load(f)
+                    config = json.load(f)
             except Exception as e:
                 print(f"Error loading config: {e}")
-                self.config = {}
-        else:
-            self.config = {}
+        with self._lock:
+            self.config = config
 
     def get(self, key, default=None):
-        return self.config.get(key, default)
+        with self._lock:
+            return self.config.get(key, default)
 
     def set(self, key, value):
-        self.config[key] = value
-        self.save_config()
+        with self._lock:
+            if key in self.config and self.config[key] == value:
+                return
+            self.config[key] = value
+            self._dirty = True
+            self._schedule_flush()
+        self.changed.emit(key, value)
 
     def save_config(self):
-        try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+        """Writes pending changes right away (also runs at exit)."""
+        self.flush()
+
+    def flush(self):
+        with self._io_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                data = json.dumps(self.config, indent=4)
+                self._dirty = False
+                self._dirty_since = None
+            # Readers never see a half-written file: write aside, then swap in
+            tmp_path = CONFIG_FILE + ".tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, CONFIG_FILE)
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def _schedule_flush(self):
+        # Called with the lock held. Debounce: every change restarts the quiet
+        # period, but changes never wait more than FLUSH_MAX_DELAY in total
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        delay = min(FLUSH_DELAY, max(0.0, self._dirty_since + FLUSH_MAX_DELAY - now))
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
@@ -0,0 +1,427 @@
+import bisect
+import json
+import os
+import threading
+
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx"
+SPARSE_EVERY = 64 # one (id, offset) seek point per this many entries
+TIME_FIELD = "time" # entry time (epoch seconds) that range() can bound on
+
+
+class SegmentLog:
+    """
+    Append-only JSON Lines store split into numbered segments.
+    Each line is either an entry (dict with an "id") or a tombstone
+    {"op": "del", "id": ...}. Appends and deletes only write one line;
+    the id -> (segment, offset) index is built on first use, and sealed
+    segments are compacted in the background once enough of them is dead.
+
+    Every segment also has a small sidecar index (id range, time range,
+    sparse seek points, ids it tombstones), persisted once the segment is
+    sealed, so range() can page through history without scanning it.
+    Range queries assume ids grow in write order, which the Logger
+    guarantees. Entry times carry no such promise (clocks move back), so
+    a time bound skips whole segments by their time range and filters
+    the rest entry by entry.
+    """
+    def __init__(self, directory, segment_max_bytes=1024 * 1024, compact_min_dead=200, compact_ratio=0.5):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.compact_min_dead = compact_min_dead
+        self.compact_ratio = compact_ratio
+
+        self._lock = threading.RLock()
+        self._index = None # id -> (segment, offset), built lazily
+        self._dead = 0 # records (puts + tombstones) compaction would drop
+        self._last_id = None
+        self._writer = None
+        self._compacting = False
+        self._meta = {} # segment -> sidecar index, loaded on demand
+
+        os.makedirs(directory, exist_ok=True)
+        self._segments = self._discover()
+        if not self._segments:
+            self._segments = [1]
+
+    # --- Public API ---
+
+    def append(self, entry):
+        with self._lock:
+            seg, offset = self._write(entry)
+            if self._index is not None:
+                self._index[entry['id']] = (seg, offset)
+            if self._last_id is None or entry['id'] > self._last_id:
+                self._last_id = entry['id']
+            return entry
+
+    def delete(self, entry_id):
+        with self._lock:
+            self._ensure_index()
+            if entry_id not in self._index:
+                return False
+            self._write({"op": "del", "id": entry_id})
+            del self._index[entry_id]
+            self._dead += 2
+        self.maybe_compact()
+        return True
+
+    def get(self, entry_id):
+        with self._lock:
+            self._ensure_index()
+            loc = self._index.get(entry_id)
+            if loc is None:
+                return None
+            return self._read_at(*loc)
+
+    def last_id(self):
+        """Highest id written so far (deleted ones included); only reads the newest segment."""
+        with self._lock:
+            if self._last_id is None:
+                for seg in reversed(self._segments):
+                    for _, record in self._scan(seg):
+                        if record.get('op') != 'compacted':
+                            self._last_id = max(self._last_id or 0, record.get('id', 0))
+                    if self._last_id is not None:
+                        break
+            return self._last_id or 0
+
+    def entries(self):
+        """All live entries in write order (oldest first)."""
+        with self._lock:
+            self._ensure_index()
+            locs = sorted(self._index.values())
+            return [self._read_at(seg, offset) for seg, offset in locs]
+
+    def range(self, lo=None, hi=None, limit=50, predicate=None, since=None, until=None):
+        """
+        Live entries with lo <= id <= hi and since <= time <= until, newest
+        first, at most `limit` of them. Entries without a time only match
+        when no time bound is given.
+        Seeks via the segment sidecars: cost depends on the page, not the history.
+        """
+        timed = since is not None or until is not None
+        result = []
+        if limit <= 0:
+            return result
+        with self._lock:
+            deleted = set()
+            seen = set()
+            for seg in reversed(self._segments):
+                meta = self._meta_for(seg)
+                # Tombstones always come after their entry, so newer segments are collected first
+                deleted.update(meta['dels'])
+                if meta['max'] is None or (lo is not None and meta['max'] < lo):
+                    continue
+                if hi is not None and meta['min'] > hi:
+                    continue
+                if timed and (meta['tmax'] is None or (since is not None and meta['tmax'] < since)
+                              or (until is not None and meta['tmin'] > until)):
+                    continue
+                for record in self._iter_back(seg, meta, hi):
+                    entry_id = record.get('id')
+                    if lo is not None and entry_id < lo:
+                        return result
+                    if entry_id in deleted or entry_id in seen:
+                        continue
+                    seen.add(entry_id)
+                    if timed and not _in_time(record, since, until):
+                        continue
+                    if predicate is None or predicate(record):
+                        result.append(record)
+                        if len(result) >= limit:
+                            return result
+        return result
+
+    def count(self):
+        with self._lock:
+            self._ensure_index()
+            return len(self._index)
+
+    def stats(self):
+        with self._lock:
+            self._ensure_index()
+            return {'segments': len(self._segments), 'live': len(self._index), 'dead': self._dead}
+
+    def maybe_compact(self):
+        with self._lock:
+            if self._compacting or self._index is None:
+                return False
+            total = len(self._index) + self._dead
+            if self._dead < self.compact_min_dead or self._dead < total * self.compact_ratio:
+                return False
+            # Seal the active segment so everything so far can be rewritten
+            self._roll()
+            self._compacting = True
+        threading.Thread(target=self.compact, daemon=True).start()
+        return True
+
+    def compact(self):
+        """
+        Rewrites all sealed segments into one, keeping only live entries.
+        Runs without the lock; new appends keep going to the active segment.
+        """
+        with self._lock:
+            self._compacting = True
+            sealed = self._segments[:-1]
+            if not sealed:
+                self._compacting = False
+                return
+        target = sealed[-1]
+
+        live = {}
+        scanned = 0
+        for seg in sealed:
+            for _, record in self._scan(seg):
+                if record.get('op') != 'compacted':
+                    scanned += 1
+                if record.get('op') == 'del':
+                    live.pop(record.get('id'), None)
+                elif 'op' not in record:
+                    live[record.get('id')] = record
+
+        tmp_path = self._path(target) + ".compact"
+        new_locs = {}
+        meta = self._new_meta()
+        with open(tmp_path, 'wb') as f:
+            # Header lets a reload drop older segments if we crash before deleting them
+            f.write(self._encode({"op": "compacted", "upto": target}))
+            for entry_id, record in live.items():
+                offset = f.tell()
+                new_locs[entry_id] = (target, offset)
+                self._meta_add(meta, record, offset)
+                f.write(self._encode(record))
+            meta['size'] = f.tell()
+
+        with self._lock:
+            os.replace(tmp_path, self._path(target))
+            for seg in sealed[:-1]:
+                self._meta.pop(seg, None)
+                for path in (self._path(seg), self._index_path(seg)):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._meta[target] = meta
+            self._save_meta(target, meta)
+            self._segments = [s for s in self._segments if s not in sealed[:-1]]
+            if self._index is not None:
+                for entry_id, loc in new_locs.items():
+                    # Entries deleted while we were compacting stay deleted
+                    if entry_id in self._index:
+                        self._index[entry_id] = loc
+                self._dead = max(0, self._dead - (scanned - len(live)))
+            self._compacting = False
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    # --- Internals ---
+
+    def _path(self, seg):
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{seg:06d}{SEGMENT_SUFFIX}")
+
+    def _index_path(self, seg):
+        return self._path(seg)[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+
+    def _discover(self):
+        segs = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    segs.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    pass
+        segs.sort()
+
+        for name in os.listdir(self.directory):
+            if name.endswith(".compact"):
+                # Compaction died before the swap: the originals are intact
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+        # Finish an interrupted compaction: segments it already covers are leftovers
+        for seg in reversed(segs):
+            header = self._read_header(seg)
+            if header and header.get('op') == 'compacted':
+                for old in [s for s in segs if s < seg]:
+                    for path in (self._path(old), self._index_path(old)):
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                segs = [s for s in segs if s >= seg]
+                break
+        return segs
+
+    def _read_header(self, seg):
+        try:
+            with open(self._path(seg), 'rb') as f:
+                return json.loads(f.readline() or b"null")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _encode(record):
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+
+    def _write(self, record):
+        data = self._encode(record)
+        if self._writer is None:
+            self._writer = open(self._path(self._segments[-1]), 'ab')
+        if self._writer.tell() and self._writer.tell() + len(data) > self.segment_max_bytes:
+            self._roll()
+            self._writer = open(self._path(self._segments[-1]), 'ab')
+        offset = self._writer.tell()
+        self._writer.write(data)
+        self._writer.flush()
+        meta = self._meta.get(self._segments[-1])
+        if meta is not None:
+            # Keep the active segment's index current instead of rescanning it
+            self._meta_add(meta, record, offset)
+            meta['size'] = offset + len(data)
+        return self._segments[-1], offset
+
+    def _roll(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        seg = self._segments[-1]
+        if os.path.exists(self._path(seg)) and os.path.getsize(self._path(seg)):
+            # Sealed for good: persist its index so reloads don't rescan it
+            self._save_meta(seg, self._meta_for(seg))
+            self._segments.append(seg + 1)
+
+    def _scan(self, seg):
+        try:
+            f = open(self._path(seg), 'rb')
+        except OSError:
+            return
+        with f:
+            offset = 0
+            for line in f:
+                start = offset
+                offset += len(line)
+                try:
+                    yield start, json.loads(line)
+                except ValueError:
+                    continue # Torn write at the tail
+
+    def _iter_back(self, seg, meta, hi):
+        """Entries of one segment with id <= hi, newest first, one seek block at a time."""
+        sparse = meta['sparse']
+        block = len(sparse) - 1
+        if hi is not None:
+            block = bisect.bisect_right(sparse, [hi, float('inf')]) - 1
+        with open(self._path(seg), 'rb') as f:
+            while block >= 0:
+                start = sparse[block][1]
+                end = sparse[block + 1][1] if block + 1 < len(sparse) else meta['size']
+                f.seek(start)
+                records = []
+                for line in f.read(end - start).splitlines():
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if 'op' not in record and (hi is None or record.get('id') <= hi):
+                        records.append(record)
+                yield from reversed(records)
+                block -= 1
+
+    @staticmethod
+    def _new_meta():
+        return {'min': None, 'max': None, 'tmin': None, 'tmax': None, 'count': 0, 'size': 0,
+                'sparse': [], 'dels': []}
+
+    @staticmethod
+    def _meta_add(meta, record, offset):
+        op = record.get('op')
+        if op == 'del':
+            meta['dels'].append(record.get('id'))
+        elif op is None:
+            entry_id = record.get('id')
+            if meta['count'] % SPARSE_EVERY == 0:
+                meta['sparse'].append([entry_id, offset])
+            meta['count'] += 1
+            if meta['min'] is None or entry_id < meta['min']:
+                meta['min'] = entry_id
+            if meta['max'] is None or entry_id > meta['max']:
+                meta['max'] = entry_id
+            entry_time = record.get(TIME_FIELD)
+            if entry_time is not None:
+                if meta['tmin'] is None or entry_time < meta['tmin']:
+                    meta['tmin'] = entry_time
+                if meta['tmax'] is None or entry_time > meta['tmax']:
+                    meta['tmax'] = entry_time
+
+    def _meta_for(self, seg):
+        meta = self._meta.get(seg)
+        if meta is not None:
+            return meta
+        try:
+            size = os.path.getsize(self._path(seg))
+        except OSError:
+            size = 0
+        try:
+            with open(self._index_path(seg), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('size') != size or 'tmin' not in meta:
+                meta = None # Segment grew or was rewritten after the sidecar, or an older format
+        except (OSError, ValueError):
+            meta = None
+        if meta is None:
+            meta = self._new_meta()
+            for offset, record in self._scan(seg):
+                self._meta_add(meta, record, offset)
+            meta['size'] = size
+        self._meta[seg] = meta
+        return meta
+
+    def _save_meta(self, seg, meta):
+        tmp_path = self._index_path(seg) + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self._index_path(seg))
+        except OSError as e:
+            print(f"[SYSTEM] Failed to write log index for segment {seg}: {e}")
+
+    def _read_at(self, seg, offset):
+        with open(self._path(seg), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def _ensure_index(self):
+        if self._index is not None:
+            return
+        index = {}
+        dead = 0
+        for seg in self._segments:
+            for offset, record in self._scan(seg):
+                op = record.get('op')
+                if op == 'del':
+                    if index.pop(record.get('id'), None) is not None:
+                        dead += 1
+                    dead += 1
+                elif op is None:
+                    if record.get('id') in index:
+                        dead += 1
+                    index[record.get('id')] = (seg, offset)
+        self._index = index
+        self._dead = dead
+        if index:
+            self._last_id = max(index)
+
+
+def _in_time(record, since, until):
+    entry_time = record.get(TIME_FIELD)
+    if entry_time is None:
+        return False
+    return (since is None or entry_time >= since) and (until is None or entry_time <= until)
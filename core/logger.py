@@ -1,52 +1,124 @@
 import json
 import os
+import threading
 from datetime import datetime
 
-LOGS_FILE = "logs.json"
+LOGS_FILE = "logs.json" # Legacy single-file history, migrated on first start
+LOGS_DIR = "logs"
 
 class Logger:
     _instance = None
+    _lock = threading.Lock()
     
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Logger, cls).__new__(cls)
-            cls._instance.logs = []
-            cls._instance.load_logs()
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(Logger, cls).__new__(cls)
+                cls._instance.store = None
+                cls._instance.load_logs()
         return cls._instance
 
     def load_logs(self):
-        if os.path.exists(LOGS_FILE):
-            try:
-                with open(LOGS_FILE, 'r', encoding='utf-8') as f:
-                    self.logs = json.load(f)
-            except Exception as e:
-                print(f"Error loading logs: {e}")
-                self.logs = []
-        else:
-            self.logs = []
+        """Opens the segment store. Nothing is parsed until history is actually read."""
+        from core.log_store import SegmentLog
+        try:
+            fresh = not os.path.isdir(LOGS_DIR)
+            self.store = SegmentLog(LOGS_DIR)
+            if fresh and os.path.exists(LOGS_FILE):
+                self.migrate_legacy()
+        except Exception as e:
+            print(f"Error loading logs: {e}")
+
+    def migrate_legacy(self):
+        try:
+            with open(LOGS_FILE, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+            # Legacy file is newest first; the store wants ids ascending in write order.
+            # Legacy ids were second timestamps (and could repeat): they become the
+            # entry time, and the id is a fresh sequence number
+            for entry_id, entry in enumerate(reversed(legacy), 1):
+                self.store.append(dict(entry, id=entry_id, time=_legacy_time(entry)))
+            os.replace(LOGS_FILE, LOGS_FILE + ".bak")
+        except Exception as e:
+            print(f"Error migrating logs: {e}")
 
     def log_restore_point(self, name, description="User initiated"):
+        # The id is a write sequence; time filters use the separate "time" field
+        now = datetime.now()
         entry = {
-            "id": int(datetime.now().timestamp()), # Simple ID
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "id": (self.store.last_id() if self.store is not None else 0) + 1,
+            "time": int(now.timestamp()),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
             "name": name,
             "description": description,
             "action": "create"
         }
-        self.logs.insert(0, entry) # Newest first
-        self.save_logs()
+        if self.store is None:
+            print("Error saving logs: log store is not open")
+            return entry
+        try:
+            self.store.append(entry) # O(1): one line at the end of the active segment
+        except Exception as e:
+            print(f"Error saving logs: {e}")
         return entry
 
     def delete_log(self, log_id):
-        self.logs = [log for log in self.logs if log.get("id") != log_id]
-        self.save_logs()
+        if self.store is None:
+            print("Error deleting log entry: log store is not open")
+            return
+        try:
+            self.store.delete(log_id) # Tombstone, compacted later in the background
+        except Exception as e:
+            print(f"Error saving logs: {e}")
 
-    def get_logs(self):
-        return self.logs
+    def query(self, since=None, until=None, action=None, limit=50, cursor=None):
+        """
+        One page of history, newest first.
+        since/until bound the entry time (datetime or epoch seconds, inclusive);
+        pass the returned cursor back to get the next page, None means no more.
+        Returns {'entries': [...], 'cursor': int or None}.
+        """
+        if self.store is None:
+            return {'entries': [], 'cursor': None}
+        # Ids only order the pages; the time range is matched on each entry's "time"
+        hi = cursor - 1 if cursor is not None else None
+
+        predicate = None
+        if action is not None:
+            predicate = lambda entry: entry.get('action') == action
 
-    def save_logs(self):
         try:
-            with open(LOGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.logs, f, indent=4, ensure_ascii=False)
+            # One extra entry tells us whether another page exists
+            entries = self.store.range(None, hi, limit + 1, predicate, _epoch(since), _epoch(until))
         except Exception as e:
-            print(f"Error saving logs: {e}")
+            print(f"Error reading logs: {e}")
+            return {'entries': [], 'cursor': None}
+
+        if len(entries) > limit:
+            entries = entries[:limit]
+            return {'entries': entries, 'cursor': entries[-1]['id']}
+        return {'entries': entries, 'cursor': None}
+
+    def get_logs(self):
+        """Full history, newest first. Reads every segment: prefer paging for UI."""
+        if self.store is None:
+            return []
+        return list(reversed(self.store.entries()))
+
+
+def _legacy_time(entry):
+    """Epoch seconds of a logs.json entry: its id was int(timestamp()), else parse "timestamp"."""
+    if isinstance(entry.get('id'), int) and entry['id'] > 0:
+        return entry['id']
+    try:
+        return int(datetime.strptime(entry.get('timestamp', ''), "%Y-%m-%d %H:%M:%S").timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def _epoch(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return int(value)
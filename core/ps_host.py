@@ -0,0 +1,243 @@
+import atexit
+import base64
+import contextlib
+import queue
+import subprocess
+import threading
+
+NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Every response line starts with this marker so stray console output
+# (Write-Host, progress records...) can't break the framing.
+FRAME_MARKER = "@@VX"
+
+# Host loop running inside the long-lived PowerShell process.
+# Request frame:  "<seq> <base64 utf-8 script>\n"
+# Response frame: "@@VX <seq> <ok 0|1> <base64 stdout> <base64 stderr>\n"
+HOST_LOOP = r"""
+[Console]::OutputEncoding = [Text.Encoding]::UTF8
+$utf8 = [Text.Encoding]::UTF8
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($line -eq $null) { break }
+    $parts = $line.Split(' ')
+    if ($parts.Length -lt 2) { continue }
+    $ok = 1
+    $out = ''
+    $Error.Clear()
+    $global:VortexOk = $true
+    try {
+        $script = $utf8.GetString([Convert]::FromBase64String($parts[1]))
+        # Same rule as the exit code of "powershell -Command": the status of the
+        # last statement ($? also turns false on a non-zero native exit code)
+        $sb = [ScriptBlock]::Create($script + [char]10 + '$global:VortexOk = $?')
+        $out = (& $sb 2>$null | ForEach-Object { [string]$_ }) -join [char]10
+        if (-not $global:VortexOk) { $ok = 0 }
+    } catch { $ok = 0 }
+    # Handled errors (try/catch, SilentlyContinue) are still recorded: diagnostics only
+    $err = ($Error | ForEach-Object { $_.ToString() }) -join [char]10
+    $b64out = [Convert]::ToBase64String($utf8.GetBytes([string]$out))
+    $b64err = [Convert]::ToBase64String($utf8.GetBytes([string]$err))
+    [Console]::Out.WriteLine('@@VX ' + $parts[0] + ' ' + $ok + ' ' + $b64out + ' ' + $b64err)
+    [Console]::Out.Flush()
+}
+"""
+
+
+def default_shell():
+    encoded = base64.b64encode(HOST_LOOP.encode("utf-16-le")).decode("ascii")
+    return ["powershell", "-NoProfile", "-NonInteractive",
+            "-ExecutionPolicy", "Bypass", "-EncodedCommand", encoded]
+
+
+def _b64(text):
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _unb64(data):
+    if not data:
+        return ""
+    return base64.b64decode(data).decode("utf-8", errors="ignore")
+
+
+class PowerShellHost:
+    """
+    Long-lived shell process attached over stdin/stdout pipes.
+    Commands are sent as framed requests and answered with framed results,
+    so we pay the interpreter cold start once instead of on every query.
+    The process is restarted transparently if it dies.
+    """
+    def __init__(self, argv=None, timeout=120):
+        self.argv = list(argv) if argv else default_shell()
+        self.timeout = timeout
+        self.restarts = 0
+
+        self._proc = None
+        self._lines = None
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        self._proc = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            creationflags=NO_WINDOW,
+        )
+        self._lines = queue.Queue()
+        reader = threading.Thread(target=self._read_loop, args=(self._proc, self._lines), daemon=True)
+        reader.start()
+
+    def is_alive(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def run(self, script, timeout=None):
+        """
+        Executes a script in the host.
+        Returns {'success': bool, 'output': str, 'error': str}.
+        """
+        with self._lock:
+            for attempt in range(2):
+                if not self.is_alive():
+                    if self._proc is not None:
+                        self.restarts += 1
+                        print(f"[SYSTEM] Shell host died, restarting (#{self.restarts})")
+                    try:
+                        self.start()
+                    except Exception as e:
+                        return {'success': False, 'output': '', 'error': str(e)}
+
+                res = self._exchange(script, timeout or self.timeout)
+                if res is not None:
+                    return res
+                # Host was already dead when the request was written: nothing ran,
+                # so one retry on a fresh process is safe
+                self._kill()
+
+            return {'success': False, 'output': '', 'error': "Shell host terminated unexpectedly"}
+
+    def close(self):
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=2)
+            except Exception:
+                self._kill()
+            self._proc = None
+
+    def _exchange(self, script, timeout):
+        """
+        Returns the response, or None if the request could not be sent.
+        Once it is sent the script may have run (a restore point, a delete),
+        so a host dying after that is a failure, never a reason to resend.
+        """
+        self._seq += 1
+        seq = str(self._seq)
+        try:
+            self._proc.stdin.write(f"{seq} {_b64(script)}\n".encode("ascii"))
+            self._proc.stdin.flush()
+        except (OSError, ValueError):
+            return None
+
+        while True:
+            try:
+                line = self._lines.get(timeout=timeout)
+            except queue.Empty:
+                # Stuck command: the only safe way out is a fresh process
+                self._kill()
+                return {'success': False, 'output': '', 'error': f"Timeout after {timeout}s"}
+
+            if line is None:
+                self._kill()
+                return {'success': False, 'output': '', 'error': "Shell host terminated unexpectedly"}
+
+            parts = line.split(" ")
+            if len(parts) < 5 or parts[0] != FRAME_MARKER or parts[1] != seq:
+                continue # Stray output or a late answer to a timed out request
+
+            return {
+                'success': parts[2] == "1",
+                'output': _unb64(parts[3]),
+                'error': _unb64(parts[4]),
+            }
+
+    def _kill(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.kill()
+            self._proc.wait(timeout=2)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _read_loop(proc, lines):
+        try:
+            for raw in proc.stdout:
+                lines.put(raw.decode("utf-8", errors="ignore").rstrip("\r\n"))
+        except Exception:
+            pass
+        lines.put(None)
+
+
+_shared_host = None
+_shared_lock = threading.Lock()
+
+
+def get_host():
+    """Process-wide host shared by all system queries."""
+    global _shared_host
+    with _shared_lock:
+        if _shared_host is None:
+            _shared_host = PowerShellHost()
+            atexit.register(_shared_host.close)
+        return _shared_host
+
+
+_bound = threading.local()
+
+
+def current_host():
+    """The host bound to this thread by HostPool.borrow(), else the shared one."""
+    return getattr(_bound, "host", None) or get_host()
+
+
+class HostPool:
+    """
+    At most `size` hosts for workers that run batches concurrently, so they
+    don't queue up behind the shared one. A borrowed host is bound to the
+    calling thread: current_host() returns it until the block exits.
+    Hosts whose process died (a timed out command kills it) are closed
+    instead of going back to the pool; close() stops the rest.
+    """
+    def __init__(self, size):
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle = queue.LifoQueue()
+
+    @contextlib.contextmanager
+    def borrow(self):
+        with self._slots:
+            try:
+                host = self._idle.get_nowait()
+            except queue.Empty:
+                host = PowerShellHost()
+            prev = getattr(_bound, "host", None)
+            _bound.host = host
+            try:
+                yield host
+            finally:
+                _bound.host = prev
+                if host.is_alive():
+                    self._idle.put(host)
+                else:
+                    host.close()
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
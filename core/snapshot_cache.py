@@ -0,0 +1,100 @@
+import threading
+import time
+
+
+class _Flight:
+    """One in-progress load shared by every caller that asked for it."""
+    def __init__(self, generation):
+        self.generation = generation
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SnapshotCache:
+    """
+    TTL cache around an expensive system scan.
+    Concurrent callers share the same in-flight load, and invalidate()
+    makes sure a scan that started before a create/delete is never stored.
+    """
+    def __init__(self, loader, ttl=30):
+        self.loader = loader
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._value = None
+        self._stamp = 0.0
+        self._generation = 0
+        self._flight = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.joined = 0
+        self.invalidations = 0
+
+    def get(self, force=False):
+        with self._lock:
+            if self._value is not None and not force:
+                if time.monotonic() - self._stamp < self.ttl:
+                    self.hits += 1
+                    return self._value
+                self.stale += 1
+            else:
+                self.misses += 1
+
+            flight = self._flight
+            if flight is not None and flight.generation == self._generation:
+                self.joined += 1
+                owner = False
+            else:
+                flight = _Flight(self._generation)
+                self._flight = flight
+                owner = True
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self.loader()
+        except Exception as e:
+            flight.error = e
+
+        with self._lock:
+            if flight.error is None and flight.generation == self._generation:
+                self._value = flight.result
+                self._stamp = time.monotonic()
+            if self._flight is flight:
+                self._flight = None
+        flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def peek(self):
+        """Cached value without triggering a scan (None if empty or expired)."""
+        with self._lock:
+            if self._value is not None and time.monotonic() - self._stamp < self.ttl:
+                return self._value
+            return None
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+            self._generation += 1
+            self.invalidations += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'joined': self.joined,
+                'invalidations': self.invalidations,
+                'age': time.monotonic() - self._stamp if self._value is not None else None,
+            }
@@ -0,0 +1,51 @@
+import sys
+import threading
+import time
+
+# Imported first thing in main.py, so this is as close to process start as Python gets
+PROCESS_START = time.perf_counter()
+
+REPORT_FLAG = "--startup-report"
+
+_marks = {}
+_order = []
+_lock = threading.Lock()
+_reported = False
+
+
+def report_requested(argv=None):
+    return REPORT_FLAG in (sys.argv if argv is None else argv)
+
+
+def mark(name):
+    """Records the first time a startup milestone is reached; later calls are ignored."""
+    with _lock:
+        if name in _marks:
+            return
+        _marks[name] = time.perf_counter() - PROCESS_START
+        _order.append(name)
+
+
+def elapsed(name):
+    return _marks.get(name)
+
+
+def report():
+    with _lock:
+        lines = ["[STARTUP] Timing (ms since process start):"]
+        prev = 0.0
+        for name in _order:
+            at = _marks[name]
+            lines.append(f"[STARTUP]   {name:<14} {at * 1000:8.1f}  (+{(at - prev) * 1000:.1f})")
+            prev = at
+        return "\n".join(lines)
+
+
+def finish():
+    """Called once the pages have their data; prints the report if it was asked for."""
+    global _reported
+    mark("data_ready")
+    if _reported or not report_requested():
+        return
+    _reported = True
+    print(report())
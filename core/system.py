@@ -10,41 +10,39 @@ def is_admin():
 
 def create_restore_point(description=None):
     """
-    Creates a Windows System Restore Point using PowerShell (Checkpoint-Computer).
+    Creates a Windows System Restore Point through the configured backend,
+    falling back to PowerShell (Checkpoint-Computer) if the native path fails.
     Returns (success: bool, message: str)
     """
-    if not is_admin():
+    from core.wmi_manager import RestorePointManager
+    backend = RestorePointManager.backend()
+
+    if backend.requires_admin and not is_admin():
         return False, "Требуются права администратора"
 
-    from core.wmi_manager import RestorePointManager
     if description is None:
         description = RestorePointManager.generate_next_name()
 
     try:
-        # Try WMI creation first (faster, purely pythonic if using com)
-        success_wmi = RestorePointManager.create_point_wmi(description)
-        if success_wmi:
+        # Try the configured backend first (COM: faster, no shell process)
+        res = RestorePointManager.create_point(description, backend)
+        if res['success']:
+            RestorePointManager.invalidate_cache()
             from core.logger import Logger
             Logger().log_restore_point(description) # Keep logging but list relies on WMI
             return True, "Точка восстановления успешно создана"
         
-        # Fallback to PowerShell if WMI method failed (backup)
-        cmd = f'Checkpoint-Computer -Description "{description}" -RestorePointType "MODIFY_SETTINGS"'
-        import subprocess
-        result = subprocess.run(
-            ["powershell", "-Command", cmd],
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW
-        )
-        
-        if result.returncode == 0:
-            from core.logger import Logger
-            Logger().log_restore_point(description)
-            return True, "Точка восстановления успешно создана (PowerShell)"
-        else:
-            err = result.stderr.strip()
-            return False, f"Ошибка создания: {err}"
+        # Fallback to PowerShell if the native method failed (backup)
+        if backend.create_fallback:
+            from core.backends import get_backend
+            res = RestorePointManager.create_point(description, get_backend(backend.create_fallback))
+            if res['success']:
+                RestorePointManager.invalidate_cache()
+                from core.logger import Logger
+                Logger().log_restore_point(description)
+                return True, "Точка восстановления успешно создана (PowerShell)"
+
+        return False, f"Ошибка создания: {res['error']}"
             
     except Exception as e:
         return False, f"System error: {str(e)}"
@@ -54,7 +52,22 @@ def delete_restore_point_system(point_data):
     Attempts to delete a restore point using a hybrid method (ShadowID or SequenceNumber).
     """
     from core.wmi_manager import RestorePointManager
-    return RestorePointManager.delete_restore_point(point_data)
+    try:
+        return RestorePointManager.delete_restore_point(point_data)
+    finally:
+        # Even a failed fallback may have removed something, never trust the old snapshot
+        RestorePointManager.invalidate_cache()
+
+def delete_restore_points_system(points):
+    """
+    Deletes several restore points in one backend invocation.
+    Returns [(point_data, success, message)].
+    """
+    from core.wmi_manager import RestorePointManager
+    try:
+        return RestorePointManager.delete_restore_points(points)
+    finally:
+        RestorePointManager.invalidate_cache()
 
 def run_as_admin():
     """Relaunch the app with admin rights"""
@@ -0,0 +1,58 @@
+import sys
+import threading
+
+_instances = {}
+_engine = None
+_prober = None
+_lock = threading.Lock()
+
+
+def default_system_name():
+    return "windows" if sys.platform == "win32" else "fake"
+
+
+def get_system(name=None):
+    """
+    Shared tweak backend. `name` defaults to the "tweak_backend"
+    config key: "windows" or "fake".
+    """
+    if name is None:
+        from core.config import ConfigManager
+        name = ConfigManager().get("tweak_backend") or default_system_name()
+
+    with _lock:
+        system = _instances.get(name)
+        if system is None:
+            system = _create(name)
+            _instances[name] = system
+        return system
+
+
+def get_engine():
+    """Application-wide TweakEngine on the configured backend."""
+    global _engine
+    with _lock:
+        if _engine is None:
+            from core.tweaks.engine import TweakEngine
+            _engine = TweakEngine()
+        return _engine
+
+
+def get_prober():
+    """Application-wide TweakProber; its cache is shared by every page."""
+    global _prober
+    with _lock:
+        if _prober is None:
+            from core.tweaks.prober import TweakProber
+            _prober = TweakProber()
+        return _prober
+
+
+def _create(name):
+    if name == "windows":
+        from core.tweaks.windows import WindowsSystem
+        return WindowsSystem()
+    if name == "fake":
+        from core.tweaks.fake import FakeSystem
+        return FakeSystem()
+    raise ValueError(f"Unknown tweak backend: {name}")
@@ -0,0 +1,33 @@
+class SystemBackend:
+    """
+    Where tweak batches are applied: the real machine or an in-memory fake.
+    apply_batch() runs a whole TweakBatch in one invocation and returns
+    {op key: (ok, error)} for the operations it attempted.
+
+    Reads are per tweak so they can run concurrently: read_tweak() returns
+    {op key: current value (None = absent)}, fingerprint() a cheap value
+    that changes whenever anything read_tweak() looks at may have changed.
+
+    clean() runs one cleanup step of an action and returns the target's
+    CleanupEngine report.
+    """
+    name = "base"
+    requires_admin = True
+
+    def apply_batch(self, batch):
+        raise NotImplementedError
+
+    def read_tweak(self, tweak):
+        raise NotImplementedError
+
+    def fingerprint(self, tweak):
+        """None means "can't tell": the tweak is re-read every time."""
+        return None
+
+    def clean(self, target_id, on_progress=None):
+        from core.cleanup import get_cleaner
+        from core.cleanup.targets import get as get_target
+        target = get_target(target_id)
+        if target is None:
+            raise ValueError(f"Unknown cleanup target: {target_id}")
+        return get_cleaner().clean([target], on_progress)['targets'][target_id]
@@ -0,0 +1,204 @@
+"""
+Declarative tweak catalog: what each switch in the tweaks tabs changes.
+
+A tweak only lists target states (registry values, service start types,
+power settings, one-shot shell commands or cleanup steps) together with
+the Windows defaults they revert to; the engine turns any selection of
+them into a single batch. Categories match the tab titles in TweaksContainer.
+"""
+
+# Registry value types, as written in a .reg file
+REG_DWORD = "dword"
+REG_SZ = "string"
+
+# Service start types (Set-Service -StartupType)
+START_AUTO = "Automatic"
+START_MANUAL = "Manual"
+START_DISABLED = "Disabled"
+
+# PowerSetting.setting that means "the active power scheme" rather than a value in it
+ACTIVE_SCHEME = "ACTIVE_SCHEME"
+
+KIND_TOGGLE = "toggle" # Has a state: on applies the values, off restores the defaults
+KIND_ACTION = "action" # One-shot: runs its commands, nothing to revert
+
+HKLM = "HKEY_LOCAL_MACHINE"
+HKCU = "HKEY_CURRENT_USER"
+
+
+class RegValue:
+    """Registry value. default=None means the value doesn't exist out of the box."""
+    def __init__(self, path, name, kind, value, default=None):
+        self.path = path
+        self.name = name
+        self.kind = kind
+        self.value = value
+        self.default = default
+
+    @property
+    def key(self):
+        return f"reg:{self.path.lower()}\\{self.name.lower()}"
+
+
+class ServiceState:
+    def __init__(self, name, start, default):
+        self.name = name
+        self.start = start
+        self.default = default
+
+    @property
+    def key(self):
+        return f"svc:{self.name.lower()}"
+
+
+class PowerSetting:
+    """powercfg value in the current scheme (AC), or the active scheme itself."""
+    def __init__(self, subgroup, setting, value, default):
+        self.subgroup = subgroup
+        self.setting = setting
+        self.value = value
+        self.default = default
+
+    @property
+    def key(self):
+        return f"power:{self.subgroup or ''}/{self.setting}"
+
+
+class CleanupStep:
+    """Action step done by the cleanup engine (core.cleanup) instead of a shell command."""
+    def __init__(self, target):
+        self.target = target # CleanupTarget id
+
+    def __repr__(self):
+        return f"<CleanupStep {self.target}>"
+
+
+class Tweak:
+    def __init__(self, tweak_id, title, category, registry=(), services=(), power=(),
+                 commands=(), kind=KIND_TOGGLE, recommended=False, after=()):
+        self.id = tweak_id
+        self.title = title
+        self.category = category
+        self.registry = list(registry)
+        self.services = list(services)
+        self.power = list(power)
+        self.commands = list(commands)
+        self.kind = kind
+        self.recommended = recommended
+        # Tweaks whose changes must be done before this one runs (profile pipelines)
+        self.after = list(after)
+
+    def targets(self, enable=True):
+        """[(op key, entry, value)] this tweak sets when switched on (or back off)."""
+        if self.kind == KIND_ACTION:
+            return []
+        return ([(reg.key, reg, reg.value if enable else reg.default) for reg in self.registry] +
+                [(svc.key, svc, svc.start if enable else svc.default) for svc in self.services] +
+                [(setting.key, setting, setting.value if enable else setting.default) for setting in self.power])
+
+    def __repr__(self):
+        return f"<Tweak {self.id}>"
+
+
+def same_value(current, target):
+    """Compares a value read from the system with a declared one (None = absent)."""
+    if current is None or target is None:
+        return current is None and target is None
+    if isinstance(target, int) and not isinstance(current, int):
+        try:
+            current = int(str(current), 0)
+        except ValueError:
+            return False
+    elif isinstance(target, str):
+        return str(current).lower() == target.lower()
+    return current == target
+
+
+_MM = HKLM + r"\SYSTEM\CurrentControlSet\Control\Session Manager\Memory Management"
+_PROFILE = HKLM + r"\SOFTWARE\Microsoft\Windows NT\CurrentVersion\Multimedia\SystemProfile"
+_GAMES = _PROFILE + r"\Tasks\Games"
+_DISPLAY_CLASS = HKLM + r"\SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}\0000"
+
+TWEAKS = [
+    # --- Производительность ---
+    Tweak("power_plan", "Установить схему питания", "Производительность",
+          power=[PowerSetting(None, ACTIVE_SCHEME, "SCHEME_MIN", "SCHEME_BALANCED"),
+                 PowerSetting("SUB_PROCESSOR", "CPMINCORES", 100, 5)],
+          recommended=True),
+    Tweak("memory", "Интеллектуальная производительность памяти", "Производительность",
+          registry=[RegValue(_MM, "DisablePagingExecutive", REG_DWORD, 1, 0)],
+          recommended=True),
+    Tweak("nvidia_power", "Отключить энергосбережение видеокарты NVIDIA", "Производительность",
+          registry=[RegValue(_DISPLAY_CLASS, "PerfLevelSrc", REG_DWORD, 0x2222),
+                    RegValue(_DISPLAY_CLASS, "PowerMizerEnable", REG_DWORD, 0)]),
+    Tweak("fast_boot", "Ускорить запуск Windows", "Производительность",
+          registry=[RegValue(HKLM + r"\SYSTEM\CurrentControlSet\Control", "WaitToKillServiceTimeout", REG_SZ, "2000", "5000")],
+          recommended=True),
+    Tweak("game_priority", "Задать приоритет играм", "Производительность",
+          registry=[RegValue(_GAMES, "Priority", REG_DWORD, 6, 2),
+                    RegValue(_GAMES, "Scheduling Category", REG_SZ, "High", "Medium"),
+                    RegValue(_PROFILE, "SystemResponsiveness", REG_DWORD, 10, 20)],
+          recommended=True),
+    Tweak("background", "Убрать фоновые операции", "Производительность",
+          registry=[RegValue(HKCU + r"\Software\Microsoft\Windows\CurrentVersion\BackgroundAccessApplications",
+                             "GlobalUserDisabled", REG_DWORD, 1, 0)],
+          services=[ServiceState("SysMain", START_DISABLED, START_AUTO),
+                    ServiceState("DiagTrack", START_DISABLED, START_AUTO)]),
+
+    # --- Задержка ---
+    Tweak("mouse_accel", "Убрать ускорение мыши", "Задержка",
+          registry=[RegValue(HKCU + r"\Control Panel\Mouse", "MouseSpeed", REG_SZ, "0", "1"),
+                    RegValue(HKCU + r"\Control Panel\Mouse", "MouseThreshold1", REG_SZ, "0", "6"),
+                    RegValue(HKCU + r"\Control Panel\Mouse", "MouseThreshold2", REG_SZ, "0", "10")],
+          recommended=True),
+    Tweak("startup_delay", "Автозапуск приложений без задержек", "Задержка",
+          registry=[RegValue(HKCU + r"\Software\Microsoft\Windows\CurrentVersion\Explorer\Serialize",
+                             "StartupDelayInMSec", REG_DWORD, 0)],
+          recommended=True),
+    Tweak("input_filter", "Отключить фильтрацию ввода", "Задержка",
+          registry=[RegValue(HKCU + r"\Control Panel\Accessibility\Keyboard Response", "Flags", REG_SZ, "122", "126"),
+                    RegValue(HKCU + r"\Control Panel\Accessibility\StickyKeys", "Flags", REG_SZ, "506", "510")]),
+    Tweak("window_delay", "Убрать задержку показа окон", "Задержка",
+          registry=[RegValue(HKCU + r"\Control Panel\Desktop", "MenuShowDelay", REG_SZ, "0", "400"),
+                    RegValue(HKCU + r"\Control Panel\Mouse", "MouseHoverTime", REG_SZ, "10", "400")],
+          recommended=True),
+
+    # --- Интернет ---
+    Tweak("net_latency", "Уменьшить сетевую задержку", "Интернет",
+          registry=[RegValue(HKLM + r"\SOFTWARE\Microsoft\MSMQ\Parameters", "TCPNoDelay", REG_DWORD, 1),
+                    RegValue(HKLM + r"\SYSTEM\CurrentControlSet\Services\Tcpip\Parameters", "DefaultTTL", REG_DWORD, 64)],
+          recommended=True),
+    Tweak("delivery_opt", "Отключить оптимизацию доставки", "Интернет",
+          registry=[RegValue(HKLM + r"\SOFTWARE\Policies\Microsoft\Windows\DeliveryOptimization", "DODownloadMode", REG_DWORD, 0)],
+          services=[ServiceState("DoSvc", START_DISABLED, START_AUTO)]),
+    Tweak("net_throttle", "Не ограничивать сетевой трафик", "Интернет",
+          registry=[RegValue(_PROFILE, "NetworkThrottlingIndex", REG_DWORD, 0xFFFFFFFF, 10)],
+          recommended=True),
+
+    # --- Прочее ---
+    Tweak("temp_files", "Очистить временные файлы", "Прочее", kind=KIND_ACTION,
+          commands=[CleanupStep("temp")]),
+    # Commands of an action run in order: the service is stopped before its cache goes
+    Tweak("update_cache", "Удалить кэш обновлений", "Прочее", kind=KIND_ACTION,
+          commands=["Stop-Service -Name wuauserv -Force -ErrorAction SilentlyContinue",
+                    CleanupStep("update_cache"),
+                    "Start-Service -Name wuauserv -ErrorAction SilentlyContinue"]),
+    Tweak("browser_cache", "Очистить кэш браузеров", "Прочее", kind=KIND_ACTION,
+          commands=[CleanupStep("browser_cache")]),
+    Tweak("dns_cache", "Очистить кэш DNS", "Прочее", kind=KIND_ACTION,
+          commands=["Clear-DnsClientCache"], after=["net_latency", "delivery_opt"]),
+]
+
+_by_id = {tweak.id: tweak for tweak in TWEAKS}
+
+
+def get(tweak_id):
+    return _by_id.get(tweak_id)
+
+
+def by_category(category):
+    return [tweak for tweak in TWEAKS if tweak.category == category]
+
+
+def recommended():
+    return [tweak for tweak in TWEAKS if tweak.recommended]
@@ -0,0 +1,215 @@
+from core.tweaks.catalog import KIND_ACTION, REG_DWORD, REG_SZ, ACTIVE_SCHEME, CleanupStep
+
+REG_HEADER = "Windows Registry Editor Version 5.00"
+REG_OP_KEY = "registry" # The .reg import succeeds or fails as a whole
+
+
+class TweakBatch:
+    """
+    Everything a selection of tweaks changes, merged into one unit of work:
+    registry values become a single .reg import, services, power settings
+    and commands a single shell script. When two tweaks touch the same
+    setting the later one wins.
+    """
+    def __init__(self):
+        self.registry = {} # op key -> (RegValue, value to write, None = delete)
+        self.services = {} # op key -> (ServiceState, start type)
+        self.power = {} # op key -> (PowerSetting, value)
+        self.commands = {} # op key -> script or CleanupStep
+        self.owners = {} # op key -> [tweak ids]
+
+    def add(self, tweak, enable=True):
+        if tweak.kind == KIND_ACTION:
+            if enable:
+                for i, script in enumerate(tweak.commands):
+                    self._own(f"cmd:{tweak.id}:{i}", tweak)
+                    self.commands[f"cmd:{tweak.id}:{i}"] = script
+            return
+        for reg in tweak.registry:
+            self._own(reg.key, tweak)
+            self.registry[reg.key] = (reg, reg.value if enable else reg.default)
+        for svc in tweak.services:
+            self._own(svc.key, tweak)
+            self.services[svc.key] = (svc, svc.start if enable else svc.default)
+        for setting in tweak.power:
+            self._own(setting.key, tweak)
+            self.power[setting.key] = (setting, setting.value if enable else setting.default)
+
+    def _own(self, key, tweak):
+        owners = self.owners.setdefault(key, [])
+        if tweak.id not in owners:
+            owners.append(tweak.id)
+
+    def __len__(self):
+        return len(self.registry) + len(self.services) + len(self.power) + len(self.commands)
+
+    def power_ops(self):
+        """Power settings in execution order: switching the scheme comes before values in it."""
+        return sorted(self.power.items(), key=lambda item: item[1][0].setting != ACTIVE_SCHEME)
+
+    def reg_file(self):
+        """The registry part as .reg text (CRLF), or "" if there is none."""
+        if not self.registry:
+            return ""
+        by_path = {}
+        for reg, value in self.registry.values():
+            by_path.setdefault(reg.path, []).append((reg, value))
+        lines = [REG_HEADER, ""]
+        for path, values in by_path.items():
+            lines.append(f"[{path}]")
+            for reg, value in values:
+                lines.append(f"{_reg_quote(reg.name)}={_reg_data(reg.kind, value)}")
+            lines.append("")
+        return "\r\n".join(lines) + "\r\n"
+
+    def segments(self):
+        """
+        The batch in execution order, cut at cleanup steps: a list of
+        TweakBatch (one system invocation each) and (op key, CleanupStep).
+        Without cleanup steps that is just [self].
+        """
+        if not any(isinstance(script, CleanupStep) for script in self.commands.values()):
+            return [self] if len(self) else []
+        parts = []
+        current = TweakBatch()
+        for attr in ('registry', 'services', 'power'):
+            for key, op in getattr(self, attr).items():
+                getattr(current, attr)[key] = op
+                current.owners[key] = list(self.owners[key])
+        for key, script in self.commands.items():
+            if isinstance(script, CleanupStep):
+                if len(current):
+                    parts.append(current)
+                parts.append((key, script))
+                current = TweakBatch()
+            else:
+                current.commands[key] = script
+                current.owners[key] = list(self.owners[key])
+        if len(current):
+            parts.append(current)
+        return parts
+
+    def split(self):
+        """One batch per operation: the per-setting way, kept for comparison."""
+        parts = []
+        for attr in ('registry', 'services', 'power', 'commands'):
+            for key, op in getattr(self, attr).items():
+                part = TweakBatch()
+                getattr(part, attr)[key] = op
+                part.owners[key] = list(self.owners[key])
+                parts.append(part)
+        return parts
+
+    def results_by_tweak(self, op_results, error=""):
+        """Folds {op key: (ok, error)} into {tweak id: (ok, error)}; missing ops count as failed."""
+        results = {}
+        for key, owners in self.owners.items():
+            lookup = REG_OP_KEY if key in self.registry else key
+            ok, op_error = op_results.get(lookup, (False, error or "Нет ответа от системы"))
+            for tweak_id in owners:
+                prev_ok, prev_error = results.get(tweak_id, (True, ""))
+                results[tweak_id] = (prev_ok and ok, prev_error or ("" if ok else op_error))
+        return results
+
+
+def _reg_quote(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _reg_data(kind, value):
+    if value is None:
+        return "-"
+    if kind == REG_DWORD:
+        return f"dword:{int(value) & 0xFFFFFFFF:08x}"
+    return _reg_quote(str(value))
+
+
+def parse_reg_file(text):
+    """
+    Minimal .reg reader for the files TweakBatch writes.
+    Yields (path, name, kind, value); value None means "delete".
+    """
+    path = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line == REG_HEADER:
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            path = line[1:-1]
+            continue
+        if path is None or not line.startswith('"'):
+            continue
+        # Name runs to the first unescaped quote
+        i, name = 1, []
+        while i < len(line) and line[i] != '"':
+            if line[i] == "\\" and i + 1 < len(line):
+                i += 1
+            name.append(line[i])
+            i += 1
+        data = line[i + 2:] # skip closing quote and "="
+        if data == "-":
+            yield path, "".join(name), None, None
+        elif data.startswith("dword:"):
+            yield path, "".join(name), REG_DWORD, int(data[6:], 16)
+        else:
+            yield path, "".join(name), REG_SZ, data[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+
+
+class TweakEngine:
+    """
+    Applies tweak selections as one batch on a SystemBackend.
+    apply() takes [(tweak, enable)] and returns
+    {'success': bool, 'tweaks': {tweak id: (ok, error)}, 'error': str,
+    'cleanup': {target id: cleanup report}}.
+    """
+    def __init__(self, system=None):
+        self._system = system
+
+    @property
+    def system(self):
+        if self._system is None:
+            from core.tweaks import get_system
+            self._system = get_system()
+        return self._system
+
+    @staticmethod
+    def build(changes):
+        batch = TweakBatch()
+        for tweak, enable in changes:
+            batch.add(tweak, enable)
+        return batch
+
+    def apply(self, changes, on_progress=None):
+        return self.run(self.build(changes), on_progress)
+
+    def run(self, batch, on_progress=None):
+        """on_progress(info) is passed on to cleanup steps (see CleanupEngine.clean)."""
+        if not len(batch):
+            return {'success': True, 'tweaks': {}, 'error': '', 'cleanup': {}}
+
+        from core.system import is_admin
+        if self.system.requires_admin and not is_admin():
+            error = "Требуются права администратора"
+            return {'success': False, 'tweaks': batch.results_by_tweak({}, error), 'error': error, 'cleanup': {}}
+
+        error = ""
+        op_results = {}
+        cleanup = {}
+        for part in batch.segments():
+            try:
+                if isinstance(part, TweakBatch):
+                    op_results.update(self.system.apply_batch(part))
+                else:
+                    key, step = part
+                    report = self.system.clean(step.target, on_progress)
+                    cleanup[step.target] = report
+                    op_results[key] = (report['success'], report['error'])
+            except Exception as e:
+                # Later steps of the batch depend on the earlier ones: stop here
+                error = str(e) or e.__class__.__name__
+                break
+        tweaks = batch.results_by_tweak(op_results, error)
+        failed = [tweak_id for tweak_id, (ok, _) in tweaks.items() if not ok]
+        if failed:
+            print(f"[SYSTEM] Tweaks failed: {', '.join(failed)}")
+        return {'success': not failed, 'tweaks': tweaks, 'error': error, 'cleanup': cleanup}
@@ -0,0 +1,135 @@
+import threading
+import time
+
+from core.tweaks.base import SystemBackend
+from core.tweaks.catalog import TWEAKS, REG_SZ
+from core.tweaks.engine import REG_OP_KEY, parse_reg_file
+
+
+class FakeSystem(SystemBackend):
+    """
+    In-memory registry, service manager and power settings with optional
+    per-invocation latency (the cost of starting reg.exe / a shell),
+    per-operation latency (a service restart, a powercfg call, a command)
+    and per-tweak read latency. Starts from the Windows defaults of the
+    catalog. Makes batches and probing testable and benchmarkable without
+    Windows.
+    """
+    name = "fake"
+    requires_admin = False
+
+    def __init__(self, latency=0.0, read_latency=0.0, tweaks=None, op_latency=0.0):
+        self.latency = latency
+        self.op_latency = op_latency
+        self.read_latency = read_latency
+        self.calls = 0
+        self.reads = 0
+        self._lock = threading.Lock()
+        self.seed(tweaks)
+
+    def seed(self, tweaks=None):
+        """Resets everything to the defaults declared by `tweaks` (the whole catalog by default)."""
+        with self._lock:
+            self.registry = {} # (path, name) lowercased -> (kind, value)
+            self.services = {} # name lowercased -> start type
+            self.power = {} # PowerSetting.key -> value
+            self.commands = [] # scripts run (and cleanup steps, as CleanupStep), in order
+            self.revisions = {} # op key -> write counter, the fake's fingerprint
+            for tweak in TWEAKS if tweaks is None else tweaks:
+                for reg in tweak.registry:
+                    if reg.default is not None:
+                        self.registry[(reg.path.lower(), reg.name.lower())] = (reg.kind, reg.default)
+                for svc in tweak.services:
+                    self.services[svc.name.lower()] = svc.default
+                for setting in tweak.power:
+                    self.power[setting.key] = setting.default
+
+    def apply_batch(self, batch):
+        self._tick() # One invocation for the whole batch
+        if self.op_latency:
+            # Outside the lock: independent batches overlap, as separate hosts do
+            time.sleep(self.op_latency * (len(batch.services) + len(batch.power) + len(batch.commands)))
+        results = {}
+        with self._lock:
+            reg_text = batch.reg_file()
+            if reg_text:
+                # Goes through the same .reg text the real import gets
+                for path, name, kind, value in parse_reg_file(reg_text):
+                    if value is None:
+                        self.registry.pop((path.lower(), name.lower()), None)
+                    else:
+                        self.registry[(path.lower(), name.lower())] = (kind, value)
+                    self._touch(f"reg:{path.lower()}\\{name.lower()}")
+                results[REG_OP_KEY] = (True, '')
+
+            for key, (svc, start) in batch.services.items():
+                if svc.name.lower() in self.services:
+                    self.services[svc.name.lower()] = start
+                    self._touch(key)
+                    results[key] = (True, '')
+                else:
+                    results[key] = (False, f"Служба {svc.name} не найдена")
+
+            for key, (setting, value) in batch.power_ops():
+                self.power[setting.key] = value
+                self._touch(key)
+                results[key] = (True, '')
+
+            for key, script in batch.commands.items():
+                self.commands.append(script)
+                results[key] = (True, '')
+        return results
+
+    def clean(self, target_id, on_progress=None):
+        """Records the step instead of deleting anything: the fake never touches the disk."""
+        from core.tweaks.catalog import CleanupStep
+        self._tick()
+        with self._lock:
+            self.commands.append(CleanupStep(target_id))
+        return {'target': target_id, 'title': target_id, 'success': True, 'files': 0, 'bytes': 0,
+                'skipped': 0, 'dirs': 0, 'elapsed': 0.0, 'error': ""}
+
+    def read_tweak(self, tweak):
+        with self._lock:
+            self.reads += 1
+        if self.read_latency:
+            time.sleep(self.read_latency)
+        values = {}
+        with self._lock:
+            for key, entry, _ in tweak.targets(True):
+                if key.startswith("reg:"):
+                    values[key] = self.registry.get((entry.path.lower(), entry.name.lower()), (None, None))[1]
+                elif key.startswith("svc:"):
+                    values[key] = self.services.get(entry.name.lower())
+                else:
+                    values[key] = self.power.get(key)
+        return values
+
+    def fingerprint(self, tweak):
+        with self._lock:
+            return tuple(self.revisions.get(key, 0) for key, _, _ in tweak.targets(True))
+
+    def set_value(self, key, value):
+        """Changes a setting behind the app's back, as another tool would."""
+        with self._lock:
+            if key.startswith("reg:"):
+                path, name = key[4:].rsplit("\\", 1)
+                kind = self.registry.get((path, name), (REG_SZ, None))[0]
+                if value is None:
+                    self.registry.pop((path, name), None)
+                else:
+                    self.registry[(path, name)] = (kind, value)
+            elif key.startswith("svc:"):
+                self.services[key[4:]] = value
+            else:
+                self.power[key] = value
+            self._touch(key)
+
+    def _touch(self, key):
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+
+    def _tick(self):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
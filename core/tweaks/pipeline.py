@@ -0,0 +1,229 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from core.tweaks.catalog import ACTIVE_SCHEME
+from core.tweaks.engine import TweakBatch
+
+# Pipeline events passed to on_event(event, info)
+EVENT_STARTED = "started"
+EVENT_FINISHED = "finished"
+EVENT_FAILED = "failed"
+EVENT_SKIPPED = "skipped"
+
+
+class Stage:
+    """One node of a profile pipeline: a sub-batch plus the stages it waits for."""
+    def __init__(self, stage_id, title, batch, deps=()):
+        self.id = stage_id
+        self.title = title
+        self.batch = batch
+        self.deps = list(deps)
+
+    def __repr__(self):
+        return f"<Stage {self.id} deps={self.deps}>"
+
+
+def _subset(batch, mechanism, keys):
+    part = TweakBatch()
+    for key in keys:
+        getattr(part, mechanism)[key] = getattr(batch, mechanism)[key]
+        part.owners[key] = list(batch.owners[key])
+    return part
+
+
+def compile_stages(batch, tweaks):
+    """
+    Splits a (planned) batch into a DAG of stages:
+      - all registry values: one import, no dependencies;
+      - each service on its own, so slow reconfigurations overlap;
+      - the power scheme, then the values inside it;
+      - each command of an action after the previous one, and the first
+        after every stage of the tweaks the action declares in `after`.
+    """
+    stages = []
+    if batch.registry:
+        stages.append(Stage("registry", f"Реестр ({len(batch.registry)})",
+                            _subset(batch, 'registry', batch.registry)))
+    for key, (svc, _) in batch.services.items():
+        stages.append(Stage(f"service:{svc.name}", f"Служба {svc.name}", _subset(batch, 'services', [key])))
+
+    scheme = [key for key, (setting, _) in batch.power.items() if setting.setting == ACTIVE_SCHEME]
+    values = [key for key in batch.power if key not in scheme]
+    if scheme:
+        stages.append(Stage("power:scheme", "Схема питания", _subset(batch, 'power', scheme)))
+    if values:
+        stages.append(Stage("power:values", "Параметры питания", _subset(batch, 'power', values),
+                            deps=["power:scheme"] if scheme else []))
+
+    # Commands: chained per action, in declaration order
+    first_command = {}
+    prev = {}
+    titles = {tweak.id: tweak.title for tweak in tweaks}
+    for key in batch.commands:
+        owner = batch.owners[key][0]
+        stage = Stage(key, titles.get(owner, owner), _subset(batch, 'commands', [key]),
+                      deps=[prev[owner]] if owner in prev else [])
+        first_command.setdefault(owner, stage)
+        prev[owner] = stage.id
+        stages.append(stage)
+
+    by_tweak = {}
+    for stage in stages:
+        for owners in stage.batch.owners.values():
+            for tweak_id in owners:
+                by_tweak.setdefault(tweak_id, []).append(stage.id)
+    for tweak in tweaks:
+        stage = first_command.get(tweak.id)
+        if stage is None:
+            continue
+        for dep in tweak.after:
+            # Tweaks with nothing to change have no stage: nothing to wait for
+            stage.deps.extend(s for s in by_tweak.get(dep, []) if s not in stage.deps)
+    return stages
+
+
+def compile_profile(profile, planner=None):
+    """Plans a profile (only real changes) and compiles the diff into stages."""
+    from core.tweaks.planner import TweakPlanner
+    changes = profile.changes()
+    plan = (planner or TweakPlanner()).plan(changes)
+    return plan, compile_stages(plan.batch, [tweak for tweak, _ in changes])
+
+
+class ProfilePipeline:
+    """
+    Runs a DAG of stages on a bounded thread pool: a stage starts as soon
+    as everything it depends on has succeeded, and is skipped if any of it
+    failed. on_event(event, info) is called from the pool threads with
+    info = {'stage', 'title', 'done', 'total', 'error'}.
+    """
+    def __init__(self, stages, engine=None, max_workers=4):
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self._engine = engine
+        self._by_id = {stage.id: stage for stage in self.stages}
+        self._hosts = None
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from core.tweaks import get_engine
+            self._engine = get_engine()
+        return self._engine
+
+    def order(self):
+        """Stages in a valid serial order; raises ValueError on a cycle or an unknown dependency."""
+        order, state = [], {}
+
+        def visit(stage):
+            if state.get(stage.id) == "done":
+                return
+            if state.get(stage.id) == "visiting":
+                raise ValueError(f"Dependency cycle at stage {stage.id}")
+            state[stage.id] = "visiting"
+            for dep in stage.deps:
+                if dep not in self._by_id:
+                    raise ValueError(f"Stage {stage.id} depends on unknown stage {dep}")
+                visit(self._by_id[dep])
+            state[stage.id] = "done"
+            order.append(stage)
+
+        for stage in self.stages:
+            visit(stage)
+        return order
+
+    def run(self, on_event=None, token=None, serial=False):
+        """
+        Returns {'success': bool, 'stages': {id: (ok, error)},
+        'tweaks': {tweak id: (ok, error)}, 'cleanup': {target id: report},
+        'elapsed': seconds, 'error': str}.
+        """
+        start = time.perf_counter()
+        order = self.order()
+        self._done = {}
+        self._results = {}
+        self._on_event = on_event
+
+        if serial or self.max_workers <= 1:
+            for stage in order:
+                if self._blocked(stage, token):
+                    continue
+                self._finish(stage, self._run_stage(stage))
+        else:
+            from core.ps_host import HostPool
+            # One shell host per worker, stopped when the run is over
+            self._hosts = HostPool(self.max_workers)
+            try:
+                self._run_parallel(order, token)
+            finally:
+                self._hosts.close()
+                self._hosts = None
+
+        tweaks = {}
+        cleanup = {}
+        for stage_id, res in self._results.items():
+            cleanup.update(res.get('cleanup', {}))
+            for tweak_id, (ok, error) in res['tweaks'].items():
+                prev_ok, prev_error = tweaks.get(tweak_id, (True, ""))
+                tweaks[tweak_id] = (prev_ok and ok, prev_error or ("" if ok else error))
+        stages = {stage_id: (ok, self._results[stage_id]['error']) for stage_id, ok in self._done.items()}
+        failed = [stage_id for stage_id, ok in self._done.items() if not ok]
+        return {'success': not failed, 'stages': stages, 'tweaks': tweaks, 'cleanup': cleanup,
+                'elapsed': time.perf_counter() - start,
+                'error': self._results[failed[0]]['error'] if failed else ''}
+
+    def _run_parallel(self, order, token):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {}
+            launched = set()
+
+            def submit_ready():
+                for stage in order:
+                    if stage.id in launched or not all(dep in self._done for dep in stage.deps):
+                        continue
+                    launched.add(stage.id)
+                    if not self._blocked(stage, token):
+                        futures[pool.submit(self._run_stage, stage)] = stage
+
+            submit_ready()
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    self._finish(futures.pop(future), future.result())
+                submit_ready()
+
+    def _blocked(self, stage, token):
+        """Skips a stage whose dependencies failed (or the whole run was cancelled)."""
+        failed = [dep for dep in stage.deps if not self._done.get(dep)]
+        if not failed and not (token is not None and token.is_set()):
+            return False
+        if failed:
+            error = f"Пропущено: не выполнен этап {self._by_id[failed[0]].title}"
+        else:
+            error = "Отменено"
+        self._finish(stage, {'success': False, 'error': error,
+                             'tweaks': stage.batch.results_by_tweak({}, error)}, EVENT_SKIPPED)
+        return True
+
+    def _run_stage(self, stage):
+        self._emit(EVENT_STARTED, stage)
+        try:
+            if self._hosts is None:
+                return self.engine.run(stage.batch)
+            with self._hosts.borrow():
+                return self.engine.run(stage.batch)
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+            return {'success': False, 'error': error, 'tweaks': stage.batch.results_by_tweak({}, error)}
+
+    def _finish(self, stage, res, event=None):
+        if not res['success'] and not res['error']:
+            res['error'] = next((e for ok, e in res['tweaks'].values() if not ok), "")
+        self._results[stage.id] = res
+        self._done[stage.id] = res['success']
+        self._emit(event or (EVENT_FINISHED if res['success'] else EVENT_FAILED), stage, res['error'])
+
+    def _emit(self, event, stage, error=""):
+        if self._on_event is not None:
+            self._on_event(event, {'stage': stage.id, 'title': stage.title, 'done': len(self._done),
+                                   'total': len(self.stages), 'error': error})
@@ -0,0 +1,173 @@
+from core.tweaks.catalog import ACTIVE_SCHEME, KIND_ACTION, same_value
+from core.tweaks.engine import TweakBatch
+
+# Rough per-operation costs in seconds; only used for the estimate shown to the user
+COST_INVOCATION = 0.3 # one round-trip to the shell host for the batch script
+COST_REG_IMPORT = 0.15 # reg.exe start + import
+COST_REG_VALUE = 0.002
+COST_SERVICE = 0.8 # reconfigure + stop/start
+COST_POWER = 0.1 # one powercfg call
+COST_POWER_APPLY = 0.2 # re-applying the scheme after value changes
+COST_COMMAND = 1.0
+
+MECHANISMS = (
+    ('registry', "Реестр"),
+    ('services', "Службы"),
+    ('power', "Питание"),
+    ('commands', "Команды"),
+)
+
+UNKNOWN = object() # Current value couldn't be read
+
+
+class PlannedChange:
+    def __init__(self, mechanism, key, entry, current, target, owners):
+        self.mechanism = mechanism
+        self.key = key
+        self.entry = entry
+        self.current = current
+        self.target = target
+        self.owners = owners
+
+    def label(self):
+        if self.mechanism == 'registry':
+            path = self.entry.path.replace("HKEY_LOCAL_MACHINE", "HKLM").replace("HKEY_CURRENT_USER", "HKCU")
+            return f"{path}\\{self.entry.name}"
+        if self.mechanism == 'services':
+            return self.entry.name
+        if self.mechanism == 'power':
+            if self.entry.setting == ACTIVE_SCHEME:
+                return "Схема питания"
+            return f"{self.entry.subgroup}/{self.entry.setting}"
+        return self.entry
+
+    def describe(self):
+        if self.mechanism == 'commands':
+            return f"  {self.label()}"
+        return f"  {self.label()}: {_show(self.current)} → {_show(self.target)}"
+
+
+def _show(value):
+    if value is UNKNOWN:
+        return "?"
+    if value is None:
+        return "(нет)"
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+
+class TweakPlan:
+    """
+    Dry-run result: only the operations that actually change something,
+    as a ready-to-run TweakBatch plus a readable diff and a cost estimate.
+    """
+    def __init__(self, batch, changes, unchanged):
+        self.batch = batch
+        self.changes = changes
+        self.unchanged = unchanged # operations already at their target value
+
+    def __len__(self):
+        return len(self.changes)
+
+    def by_mechanism(self):
+        groups = {mechanism: [] for mechanism, _ in MECHANISMS}
+        for change in self.changes:
+            groups[change.mechanism].append(change)
+        return groups
+
+    def tweak_ids(self):
+        return sorted({tweak_id for change in self.changes for tweak_id in change.owners})
+
+    def estimated_cost(self):
+        groups = self.by_mechanism()
+        if not self.changes:
+            return 0.0
+        cost = 0.0
+        if groups['services'] or groups['power'] or groups['commands']:
+            cost += COST_INVOCATION
+        if groups['registry']:
+            cost += COST_REG_IMPORT + COST_REG_VALUE * len(groups['registry'])
+        cost += COST_SERVICE * len(groups['services'])
+        cost += COST_POWER * len(groups['power'])
+        if any(change.entry.setting != ACTIVE_SCHEME for change in groups['power']):
+            cost += COST_POWER_APPLY
+        cost += COST_COMMAND * len(groups['commands'])
+        return cost
+
+    def describe(self):
+        lines = []
+        for mechanism, title in MECHANISMS:
+            group = self.by_mechanism()[mechanism]
+            if group:
+                lines.append(f"{title} ({len(group)}):")
+                lines.extend(change.describe() for change in group)
+                lines.append("")
+        if self.unchanged:
+            lines.append(f"Уже применено, пропускается: {self.unchanged}")
+        lines.append(f"Оценка времени: ~{self.estimated_cost():.1f} с")
+        return "\n".join(lines)
+
+
+class TweakPlanner:
+    """
+    Compares what a selection of tweaks wants with what the system has
+    (read through the shared prober, so mostly from its cache) and keeps
+    only the operations that differ. Actions have no state and always run;
+    settings that couldn't be read are kept as well.
+    """
+    def __init__(self, prober=None):
+        self._prober = prober
+
+    @property
+    def prober(self):
+        if self._prober is None:
+            from core.tweaks import get_prober
+            self._prober = get_prober()
+        return self._prober
+
+    def plan(self, changes, force=False):
+        changes = list(changes)
+        # Warms the cache for every tweak in parallel; the reads below are then lookups
+        self.prober.probe([tweak for tweak, _ in changes], force=force)
+
+        current = {}
+        for tweak, _ in changes:
+            if tweak.kind == KIND_ACTION:
+                continue
+            try:
+                values = self.prober.values(tweak)
+            except Exception as e:
+                print(f"[SYSTEM] Could not read tweak '{tweak.id}': {e}")
+                values = {key: UNKNOWN for key, _, _ in tweak.targets(True)}
+            current.update(values)
+
+        titles = {tweak.id: tweak.title for tweak, _ in changes}
+        full = TweakBatch()
+        for tweak, enable in changes:
+            full.add(tweak, enable)
+
+        # Power values are per scheme: after a scheme switch the current ones no longer apply
+        scheme_switch = any(setting.setting == ACTIVE_SCHEME and not same_value(current.get(key), target)
+                            for key, (setting, target) in full.power.items())
+
+        diff = TweakBatch()
+        planned = []
+        unchanged = 0
+        for mechanism, _ in MECHANISMS:
+            for key, op in getattr(full, mechanism).items():
+                if mechanism == 'commands':
+                    # Shown by the title of the action it belongs to
+                    entry, target, value = titles.get(full.owners[key][0], op), None, UNKNOWN
+                else:
+                    entry, target = op
+                    value = current.get(key, UNKNOWN)
+                    if mechanism == 'power' and scheme_switch and entry.setting != ACTIVE_SCHEME:
+                        value = UNKNOWN
+                    if value is not UNKNOWN and same_value(value, target):
+                        unchanged += 1
+                        continue
+                getattr(diff, mechanism)[key] = op
+                diff.owners[key] = list(full.owners[key])
+                planned.append(PlannedChange(mechanism, key, entry, value, target, diff.owners[key]))
+        return TweakPlan(diff, planned, unchanged)
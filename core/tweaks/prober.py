@@ -0,0 +1,87 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.tweaks.catalog import KIND_ACTION, same_value
+
+# Tweak states
+STATE_ON = True
+STATE_OFF = False
+STATE_UNKNOWN = None # Not readable (or an action, which has no state)
+
+
+class TweakProber:
+    """
+    Finds out which tweaks are in effect. Tweaks are read concurrently on
+    a small thread pool and the values are cached together with the
+    backend fingerprint taken before the read, so asking again only costs
+    a fingerprint check until something on the system actually changes.
+    """
+    def __init__(self, system=None, max_workers=8):
+        self._system = system
+        self.max_workers = max_workers
+        self.reads = 0 # read_tweak() calls actually made
+        self._cache = {} # tweak id -> (fingerprint, values)
+        self._lock = threading.Lock()
+
+    @property
+    def system(self):
+        if self._system is None:
+            from core.tweaks import get_system
+            self._system = get_system()
+        return self._system
+
+    def values(self, tweak, force=False):
+        """{op key: current value} for one tweak, from the cache while its fingerprint holds."""
+        fingerprint = self.system.fingerprint(tweak)
+        if not force and fingerprint is not None:
+            with self._lock:
+                cached = self._cache.get(tweak.id)
+            if cached is not None and cached[0] == fingerprint:
+                return cached[1]
+
+        values = self.system.read_tweak(tweak)
+        with self._lock:
+            self.reads += 1
+            # Fingerprint from before the read: a change during the read forces another one
+            self._cache[tweak.id] = (fingerprint, values)
+        return values
+
+    def state(self, tweak, force=False):
+        if tweak.kind == KIND_ACTION:
+            return STATE_UNKNOWN
+        try:
+            values = self.values(tweak, force)
+        except Exception as e:
+            print(f"[SYSTEM] Could not read tweak '{tweak.id}': {e}")
+            return STATE_UNKNOWN
+        return all(same_value(values.get(key), target) for key, _, target in tweak.targets(True))
+
+    def probe(self, tweaks, on_result=None, token=None, force=False):
+        """
+        States of several tweaks, read in parallel. on_result(tweak id, state)
+        is called from the pool as each one is known. Returns {tweak id: state}.
+        """
+        tweaks = [tweak for tweak in tweaks if tweak.kind != KIND_ACTION]
+        results = {}
+        if not tweaks:
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tweaks))) as pool:
+            futures = {}
+            for tweak in tweaks:
+                if token is not None and token.is_set():
+                    break
+                futures[pool.submit(self.state, tweak, force)] = tweak
+            for future in as_completed(futures):
+                tweak = futures[future]
+                results[tweak.id] = future.result()
+                if on_result is not None and not (token is not None and token.is_set()):
+                    on_result(tweak.id, results[tweak.id])
+        return results
+
+    def invalidate(self, tweak_ids=None):
+        with self._lock:
+            if tweak_ids is None:
+                self._cache.clear()
+            else:
+                for tweak_id in tweak_ids:
+                    self._cache.pop(tweak_id, None)
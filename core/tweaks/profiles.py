@@ -0,0 +1,39 @@
+"""
+Dashboard profiles: named selections of tweaks to switch on (and back off).
+The "custom" profile is whatever the "custom_profile" config key lists.
+"""
+from core.tweaks import catalog
+
+
+class Profile:
+    def __init__(self, profile_id, title, enable=(), disable=()):
+        self.id = profile_id
+        self.title = title
+        self.enable = list(enable)
+        self.disable = list(disable) # Restored to Windows defaults
+
+    def changes(self):
+        """[(tweak, enable)] for the planner and the pipeline."""
+        return ([(catalog.get(t), True) for t in self.enable if catalog.get(t)] +
+                [(catalog.get(t), False) for t in self.disable if catalog.get(t)])
+
+
+_TOGGLES = [t.id for t in catalog.TWEAKS if t.kind == catalog.KIND_TOGGLE]
+
+PROFILES = [
+    Profile("performance", "Производительный",
+            enable=[t.id for t in catalog.recommended()] + ["background", "dns_cache"]),
+    Profile("power_saving", "Энергосберегающий",
+            enable=["startup_delay", "window_delay", "background"],
+            disable=["power_plan", "nvidia_power", "game_priority", "memory"]),
+    Profile("risky", "Рискованный",
+            enable=_TOGGLES + ["temp_files", "update_cache", "dns_cache"]),
+]
+
+
+def get(profile_id):
+    if profile_id == "custom":
+        from core.config import ConfigManager
+        chosen = ConfigManager().get("custom_profile") or [t.id for t in catalog.recommended()]
+        return Profile("custom", "Пользовательский", enable=chosen)
+    return next((p for p in PROFILES if p.id == profile_id), None)
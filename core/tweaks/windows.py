@@ -0,0 +1,183 @@
+import json
+import os
+import re
+import subprocess
+import tempfile
+
+from core.tweaks.base import SystemBackend
+from core.tweaks.catalog import ACTIVE_SCHEME, START_AUTO, START_MANUAL, START_DISABLED, HKLM
+from core.tweaks.engine import REG_OP_KEY
+
+NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+SERVICES_KEY = HKLM + r"\SYSTEM\CurrentControlSet\Services"
+POWER_SCHEMES_KEY = HKLM + r"\SYSTEM\CurrentControlSet\Control\Power\User\PowerSchemes"
+SERVICE_START = {2: START_AUTO, 3: START_MANUAL, 4: START_DISABLED}
+
+# powercfg aliases used by the catalog
+POWER_SCHEMES = {
+    'SCHEME_MIN': "8c5e7fda-e8bf-4a96-9a85-a6e23a8c635c",
+    'SCHEME_MAX': "a1841308-3541-4fab-bc81-f71556f20b4a",
+    'SCHEME_BALANCED': "381b4222-f694-41f0-9685-ff5bb260df2e",
+}
+POWER_GUIDS = {
+    'SUB_PROCESSOR': "54533251-82be-4824-96c1-47b60b740d00",
+    'CPMINCORES': "0cc5b647-c1df-4637-891a-dec35c318583",
+}
+
+
+class WindowsSystem(SystemBackend):
+    """
+    Applies a batch with one `reg import` and one script in the persistent
+    shell host, instead of a reg.exe / sc.exe / powercfg process per setting.
+    Reads go straight to the registry (service start types and the active
+    power scheme live there too); key last-write times are the fingerprint.
+    """
+    name = "windows"
+
+    def apply_batch(self, batch):
+        reg_path = None
+        lines = ["$out = @(); "]
+        try:
+            reg_text = batch.reg_file()
+            if reg_text:
+                reg_path = self._write_reg(reg_text)
+                lines.append(
+                    f"$o = & reg.exe import '{_ps_quote(reg_path)}' 2>&1; "
+                    f"$out += @{{ Key='{REG_OP_KEY}'; Ok=($LASTEXITCODE -eq 0); Error=[string]($o | Select-Object -Last 1) }}; "
+                )
+
+            for key, (svc, start) in batch.services.items():
+                follow = ("Stop-Service -Name '{0}' -Force -ErrorAction SilentlyContinue; " if start == START_DISABLED
+                          else "Start-Service -Name '{0}' -ErrorAction SilentlyContinue; ").format(_ps_quote(svc.name))
+                lines.append(_guarded(key, f"Set-Service -Name '{_ps_quote(svc.name)}' -StartupType {start} -ErrorAction Stop; " + follow))
+
+            power = batch.power_ops()
+            for key, (setting, value) in power:
+                if setting.setting == ACTIVE_SCHEME:
+                    cmd = f"& powercfg /setactive {value}"
+                else:
+                    cmd = f"& powercfg /setacvalueindex SCHEME_CURRENT {setting.subgroup} {setting.setting} {int(value)}"
+                lines.append(_guarded(key, cmd + "; if ($LASTEXITCODE -ne 0) { throw \"powercfg exit $LASTEXITCODE\" }; "))
+            if any(setting.setting != ACTIVE_SCHEME for _, (setting, _) in power):
+                # Values written to the active scheme only take effect once it is re-applied
+                lines.append("& powercfg /setactive SCHEME_CURRENT; ")
+
+            for key, script in batch.commands.items():
+                lines.append(_guarded(key, script + "; "))
+
+            lines.append("ConvertTo-Json -InputObject @($out) -Compress")
+            return self._collect(self._run("".join(lines)))
+        finally:
+            if reg_path:
+                try:
+                    os.remove(reg_path)
+                except OSError:
+                    pass
+
+    def read_tweak(self, tweak):
+        values = {}
+        for key, entry, _ in tweak.targets(True):
+            if key.startswith("reg:"):
+                values[key] = _reg_read(entry.path, entry.name)
+            elif key.startswith("svc:"):
+                values[key] = SERVICE_START.get(_reg_read(SERVICES_KEY + "\\" + entry.name, "Start"))
+            elif entry.setting == ACTIVE_SCHEME:
+                guid = (_reg_read(POWER_SCHEMES_KEY, "ActivePowerScheme") or "").lower()
+                values[key] = next((alias for alias, g in POWER_SCHEMES.items() if g == guid), guid or None)
+            else:
+                values[key] = _powercfg_value(entry.subgroup, entry.setting)
+        return values
+
+    def fingerprint(self, tweak):
+        stamps = []
+        for key, entry, _ in tweak.targets(True):
+            if key.startswith("reg:"):
+                stamps.append(_last_write(entry.path))
+            elif key.startswith("svc:"):
+                stamps.append(_last_write(SERVICES_KEY + "\\" + entry.name))
+            elif entry.setting == ACTIVE_SCHEME:
+                stamps.append(_last_write(POWER_SCHEMES_KEY))
+            else:
+                sub, setting = POWER_GUIDS.get(entry.subgroup), POWER_GUIDS.get(entry.setting)
+                if sub is None or setting is None:
+                    return None # No key to watch: always re-read
+                scheme = _reg_read(POWER_SCHEMES_KEY, "ActivePowerScheme")
+                stamps.append((scheme, _last_write(f"{POWER_SCHEMES_KEY}\\{scheme}\\{sub}\\{setting}")))
+        return tuple(stamps)
+
+    @staticmethod
+    def _write_reg(text):
+        # reg.exe expects UTF-16 with a BOM for "Version 5.00" files
+        fd, path = tempfile.mkstemp(prefix="vortex-", suffix=".reg")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b"\xff\xfe" + text.encode("utf-16-le"))
+        return path
+
+    @staticmethod
+    def _run(script):
+        from core.ps_host import current_host
+        # Pipeline stages running in parallel each have a host from their pool
+        res = current_host().run(script)
+        # A failing op also marks the run as failed; its status is in the JSON
+        raw = res['output'].strip()
+        if not raw:
+            raise RuntimeError(res['error'].strip() or "Unknown PS Error")
+        data = json.loads(raw)
+        return data if isinstance(data, list) else [data]
+
+    @staticmethod
+    def _collect(items):
+        results = {}
+        for item in items:
+            try:
+                results[item.get('Key')] = (bool(item.get('Ok')), item.get('Error') or '')
+            except AttributeError:
+                pass
+        return results
+
+
+def _open_key(path):
+    import winreg
+    hive, _, sub = path.partition("\\")
+    return winreg.OpenKey(getattr(winreg, hive), sub, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+
+
+def _reg_read(path, name):
+    import winreg
+    try:
+        with _open_key(path) as key:
+            return winreg.QueryValueEx(key, name)[0]
+    except OSError:
+        return None
+
+
+def _last_write(path):
+    import winreg
+    try:
+        with _open_key(path) as key:
+            return winreg.QueryInfoKey(key)[2]
+    except OSError:
+        return None
+
+
+def _powercfg_value(subgroup, setting):
+    """Current AC index of a setting in the active scheme (locale-independent parse)."""
+    try:
+        out = subprocess.run(["powercfg", "/query", "SCHEME_CURRENT", subgroup, setting],
+                             capture_output=True, text=True, timeout=10, creationflags=NO_WINDOW).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # The last two hex values are the current AC and DC indexes
+    indexes = re.findall(r":\s*(0x[0-9a-fA-F]+)\s*$", out, re.MULTILINE)
+    return int(indexes[-2], 16) if len(indexes) >= 2 else None
+
+
+def _ps_quote(text):
+    return str(text).replace("'", "''")
+
+
+def _guarded(key, body):
+    return ("try { " + body +
+            f"$out += @{{ Key='{key}'; Ok=$true; Error='' }} }} "
+            f"catch {{ $out += @{{ Key='{key}'; Ok=$false; Error=$_.Exception.Message }} }}; ")
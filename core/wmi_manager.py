@@ -1,78 +1,193 @@
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+
+# Max distance between a restore point and its VSS shadow copy
+SHADOW_MATCH_WINDOW = 120
+
+# How long a restore point scan is reused before a new one is needed
+CACHE_TTL = 30
+
+# Win32_ShadowStorage.MaxSpace of a volume with no limit (UINT64_MAX)
+UNBOUNDED_MAX_SPACE = 2**64 - 1
+
+_lock = threading.Lock()
+
+
+def parse_wmi_datetime(raw):
+    """
+    Parses a CIM datetime ('20260124162444.000000-000', offset in minutes).
+    Returns (local naive datetime, UTC epoch seconds) or (None, None).
+    """
+    if not raw or len(raw) < 14:
+        return None, None
+    try:
+        dt = datetime(int(raw[0:4]), int(raw[4:6]), int(raw[6:8]),
+                      int(raw[8:10]), int(raw[10:12]), int(raw[12:14]))
+    except ValueError:
+        return None, None
+
+    offset = 0
+    if len(raw) >= 25 and raw[21] in "+-":
+        try:
+            offset = int(raw[22:25]) * (1 if raw[21] == "+" else -1)
+        except ValueError:
+            offset = 0
+
+    utc = (dt - timedelta(minutes=offset)).replace(tzinfo=timezone.utc)
+    return dt, utc.timestamp()
+
+
+def match_shadow_ids(points, shadows, window=SHADOW_MATCH_WINDOW):
+    """
+    Correlates restore points with shadow copies by creation time.
+    points:  list of (key, epoch seconds or None)
+    shadows: list of (shadow_id, epoch seconds or None)
+    Returns {key: shadow_id}. Each point gets its nearest shadow strictly
+    inside the window and no shadow is handed out twice; closer pairs win.
+    Shadows are sorted once and each point bisects its window, so the cost
+    is O((R + S) log S) plus the handful of candidates inside the windows.
+    """
+    timed = sorted((t, order, sid) for order, (sid, t) in enumerate(shadows) if t is not None)
+    times = [t for t, _, _ in timed]
+
+    candidates = []
+    for p_order, (key, t) in enumerate(points):
+        if t is None:
+            continue
+        lo = bisect_right(times, t - window)
+        hi = bisect_left(times, t + window)
+        for j in range(lo, hi):
+            st, s_order, sid = timed[j]
+            candidates.append((abs(t - st), p_order, s_order, key, sid))
+
+    # Nearest pairs first; ties keep enumeration order like the old script
+    candidates.sort(key=lambda c: (c[0], c[1], c[2]))
+
+    matched = {}
+    used = set()
+    for _, _, _, key, sid in candidates:
+        if key in matched or sid in used:
+            continue
+        matched[key] = sid
+        used.add(sid)
+    return matched
+
+
+def _volume_ref_device_id(ref):
+    """
+    Win32_ShadowStorage.Volume is a WMI reference path such as
+    Win32_Volume.DeviceID="\\\\?\\Volume{...}\\". Returns the unescaped DeviceID.
+    """
+    if isinstance(ref, dict):
+        return ref.get('DeviceID')
+    if not ref or 'DeviceID="' not in ref:
+        return ref
+    value = ref.split('DeviceID="', 1)[1].rsplit('"', 1)[0]
+    return value.replace('\\\\', '\\')
+
+
+def _describe_delete_error(error):
+    err_msg = (error or "").lower()
+    if "access denied" in err_msg or "0x80041003" in err_msg:
+        return "Ошибка: Доступ запрещен. Запустите Vortex от имени Системы или проверьте антивирус."
+    return f"Ошибка ОС: {error}"
+
+
 class RestorePointManager:
+    _cache = None
+
+    @staticmethod
+    def backend():
+        """Configured access path (COM, PowerShell or in-memory fake), see core.backends."""
+        from core.backends import get_backend
+        return get_backend()
+
+    @staticmethod
+    def snapshot_cache():
+        from core.snapshot_cache import SnapshotCache
+        with _lock:
+            if RestorePointManager._cache is None:
+                RestorePointManager._cache = SnapshotCache(RestorePointManager.snapshot, ttl=CACHE_TTL)
+            return RestorePointManager._cache
+
+    @staticmethod
+    def get_cached_snapshot(force=False):
+        """
+        Shared system snapshot (see snapshot()); rescans only when expired,
+        invalidated or forced. Concurrent callers share one scan.
+        """
+        return RestorePointManager.snapshot_cache().get(force=force)
+
+    @staticmethod
+    def get_cached_points(force=False):
+        return RestorePointManager.get_cached_snapshot(force=force)['points']
+
+    @staticmethod
+    def invalidate_cache():
+        RestorePointManager.snapshot_cache().invalidate()
+
+    @staticmethod
+    def cache_stats():
+        return RestorePointManager.snapshot_cache().stats()
+
+    @staticmethod
+    def snapshot():
+        """
+        Restore points, shadow copies, shadow storage and volumes in one backend round-trip.
+        Returns {'points': [...], 'storage': {...}} shaped like
+        get_all_restore_points() / get_vss_storage_info().
+        """
+        raw = RestorePointManager.backend().snapshot()
+        return {
+            'points': RestorePointManager.build_points(raw.get('Points') or [], raw.get('Shadows') or []),
+            'storage': RestorePointManager.build_storage_info(raw.get('Storage') or [], raw.get('Volumes') or [])
+        }
+
     @staticmethod
     def get_all_restore_points():
-        import subprocess
-        import json
-        from datetime import datetime
-        
-        # We need both SequenceNumber (Official) and ShadowID (VSS)
-        # We'll use a more direct WMI query to avoid complex correlation if possible,
-        # but correlation is needed for ShadowID.
-        ps_script = (
-            "$rps = Get-WmiObject -Namespace root\\default -Class SystemRestore; "
-            "$shadows = Get-WmiObject Win32_ShadowCopy; "
-            "$results = @(); "
-            "foreach ($rp in $rps) { "
-            "  $best_sid = ''; "
-            "  if ($rp.CreationTime) { "
-            "    $rt = [Management.ManagementDateTimeConverter]::ToDateTime($rp.CreationTime); "
-            "    $min = 120; "
-            "    foreach ($sh in $shadows) { "
-            "      try { "
-            "        $st = [Management.ManagementDateTimeConverter]::ToDateTime($sh.InstallDate); "
-            "        $diff = [Math]::Abs(($rt - $st).TotalSeconds); "
-            "        if ($diff -lt $min) { $min=$diff; $best_sid=$sh.ID } "
-            "      } catch {} "
-            "    } "
-            "  } "
-            "  $results += @{ "
-            "    SequenceNumber = $rp.SequenceNumber; "
-            "    Description = $rp.Description; "
-            "    CreationTime = $rp.CreationTime; "
-            "    ShadowID = $best_sid "
-            "  } "
-            "}; "
-            "$results | ConvertTo-Json -Compress"
-        )
-        
-        all_points = []
-        data = RestorePointManager._run_ps_json(ps_script)
-        
-        for item in data:
+        # We need both SequenceNumber (Official) and ShadowID (VSS).
+        # The backend only lists both classes, correlation runs in Python
+        # (see match_shadow_ids) instead of a nested PowerShell loop.
+        raw_points, raw_shadows = RestorePointManager.backend().list_points()
+        return RestorePointManager.build_points(raw_points, raw_shadows)
+
+    @staticmethod
+    def build_points(raw_points, raw_shadows):
+        """
+        Turns raw SystemRestore / Win32_ShadowCopy rows into the point dicts used by the UI.
+        """
+        parsed = []
+        for item in raw_points:
             try:
                 seq_num = item.get('SequenceNumber')
                 if seq_num is None: continue
                 
                 desc = item.get('Description', 'Unknown Point')
-                shadow_id = item.get('ShadowID', '')
                 raw_time = item.get('CreationTime', '') # e.g. 20260124162444.000000-000
-                
-                # Parse WMI Date (YYYYMMDDHHMMSS...)
-                friendly_time = "Unknown Date"
-                dt_obj = datetime.min
-                
-                if raw_time and len(raw_time) >= 14:
-                    try:
-                        # Extract YYYY MM DD HH MM SS
-                        y = int(raw_time[0:4])
-                        m = int(raw_time[4:6])
-                        d = int(raw_time[6:8])
-                        hh = int(raw_time[8:10])
-                        mm = int(raw_time[10:12])
-                        ss = int(raw_time[12:14])
-                        dt_obj = datetime(y, m, d, hh, mm, ss)
-                        friendly_time = dt_obj.strftime("%d.%m.%Y | %H:%M")
-                    except: pass
-
-                all_points.append({
-                    'id': seq_num,
-                    'shadow_id': shadow_id,
-                    'name': desc,
-                    'timestamp': friendly_time,
-                    'dt_obj': dt_obj
-                })
+                dt_obj, epoch = parse_wmi_datetime(raw_time)
+                parsed.append((seq_num, desc, dt_obj, epoch))
             except:
                 continue
+
+        shadows = []
+        for sh in raw_shadows:
+            try:
+                shadows.append((sh.get('ID', ''), parse_wmi_datetime(sh.get('InstallDate', ''))[1]))
+            except:
+                continue
+
+        shadow_map = match_shadow_ids([(seq, epoch) for seq, _, _, epoch in parsed], shadows)
+
+        all_points = []
+        for seq_num, desc, dt_obj, _ in parsed:
+            all_points.append({
+                'id': seq_num,
+                'shadow_id': shadow_map.get(seq_num, ''),
+                'name': desc,
+                'timestamp': dt_obj.strftime("%d.%m.%Y | %H:%M") if dt_obj else "Unknown Date",
+                'dt_obj': dt_obj or datetime.min
+            })
         
         # FORCE SORT: Newest first
         all_points.sort(key=lambda x: x['dt_obj'], reverse=True)
@@ -88,114 +203,127 @@ class RestorePointManager:
         seq = point_data.get('sequence_number')
         
         print(f"[SYSTEM] Attempting to delete point. ShadowID: {sid or 'None'}, Seq: {seq}")
+        backend = RestorePointManager.backend()
         
         # Phase 1: Try ShadowCopy (GUID) - Best for space retrieval
         if sid:
-            cmd_shadow = f"Get-WmiObject Win32_ShadowCopy | Where-Object {{ $_.ID -eq '{sid}' }} | ForEach-Object {{ $_.Delete() }}"
-            res = RestorePointManager._run_ps_raw(cmd_shadow)
+            res = backend.delete_shadow(sid)
             if res['success']:
                 return True, "Точка успешно удалена (VSS)"
         
         # Phase 2: Fallback to SequenceNumber (SystemRestore class)
         if seq is not None:
             print(f"[SYSTEM] Falling back to SequenceNumber deletion for: {seq}")
-            cmd_sys = f"Get-WmiObject -Namespace root\\default -Class SystemRestore | Where-Object {{ $_.SequenceNumber -eq {seq} }} | ForEach-Object {{ $_.Delete() }}"
-            res = RestorePointManager._run_ps_raw(cmd_sys)
+            res = backend.delete_sequence(seq)
             if res['success']:
                 return True, "Точка удалена (SystemRestore)"
             else:
-                err_msg = res['error'].lower()
-                if "access denied" in err_msg or "0x80041003" in err_msg:
-                    return False, "Ошибка: Доступ запрещен. Запустите Vortex от имени Системы или проверьте антивирус."
-                return False, f"Ошибка ОС: {res['error']}"
+                return False, _describe_delete_error(res['error'])
 
         return False, "Не удалось определить идентификаторы точки для удаления"
 
+    @staticmethod
+    def delete_restore_points(points):
+        """
+        Bulk hybrid deletion in a single backend invocation.
+        points: list of dicts with 'shadow_id' and 'sequence_number'.
+        Returns [(point_data, success, message)] in the same order.
+        """
+        pairs = [(p.get('sequence_number'), p.get('shadow_id') or '') for p in points]
+        print(f"[SYSTEM] Bulk delete of {len(pairs)} points")
+        raw = RestorePointManager.backend().delete_many(pairs)
+        shadows = raw.get('shadows', {})
+        sequences = raw.get('sequences', {})
+        # A failed call leaves ids absent from the result without them being gone
+        call_ok = raw.get('success', True)
+
+        results = []
+        for point, (seq, sid) in zip(points, pairs):
+            if sid and shadows.get(sid, (False,))[0]:
+                results.append((point, True, "Точка успешно удалена (VSS)"))
+            elif seq in sequences:
+                ok, err = sequences[seq]
+                results.append((point, ok, "Точка удалена (SystemRestore)" if ok else _describe_delete_error(err)))
+            elif sid in shadows:
+                results.append((point, False, _describe_delete_error(shadows[sid][1])))
+            elif seq is None and not sid:
+                results.append((point, False, "Не удалось определить идентификаторы точки для удаления"))
+            elif not call_ok:
+                results.append((point, False, _describe_delete_error(raw.get('error'))))
+            else:
+                # Neither the shadow nor the SequenceNumber exists any more
+                results.append((point, True, "Точка уже отсутствует в системе"))
+        return results
+
     @staticmethod
     def get_vss_storage_info():
         """
-        Calculates total space used by shadow copies across all drives.
+        Calculates space used by shadow copies, total and per volume.
         """
-        # We'll use Get-WmiObject Win32_ShadowStorage as it's cleaner for JSON parsing
-        # Mapping Volume DeviceID to Drive Letter for details
-        script = (
-            "$results = @(); "
-            "$vols = Get-WmiObject Win32_Volume; "
-            "$shadows = Get-WmiObject Win32_ShadowStorage; "
-            "foreach ($sh in $shadows) { "
-            "  $v = $vols | Where-Object { $_.DeviceID -eq $sh.Volume.DeviceID }; "
-            "  $dl = if ($v) { $v.DriveLetter } else { '?' }; "
-            "  $results += @{ Drive=$dl; Used=$sh.UsedSpace } "
-            "}; "
-            "$results | ConvertTo-Json -Compress"
-        )
-        
-        data = RestorePointManager._run_ps_json(script)
-        
-        total_bytes = 0
-        drive_map = {}
-        
-        for item in data:
+        # The backend only lists both classes; the volume map is built once
+        # and joined by DeviceID in Python (see build_storage_info).
+        raw_storage, raw_volumes = RestorePointManager.backend().list_storage()
+        return RestorePointManager.build_storage_info(raw_storage, raw_volumes)
+
+    @staticmethod
+    def build_storage_info(raw_storage, raw_volumes):
+        """
+        Hash-joins Win32_ShadowStorage rows with Win32_Volume by DeviceID.
+        Returns totals plus a per-volume breakdown with Used/Allocated/Max space.
+        """
+        vol_map = {}
+        for v in raw_volumes:
             try:
-                used = int(item.get('Used', 0))
-                total_bytes += used
-                drv = item.get('Drive', '?') or '?'
-                drive_map[drv] = drive_map.get(drv, 0) + used
+                vol_map[v.get('DeviceID')] = v
             except: pass
-            
-        total_gb = total_bytes / (1024**3)
-        
+
+        volumes = {}
+        for item in raw_storage:
+            try:
+                vol = vol_map.get(_volume_ref_device_id(item.get('Volume')))
+                drv = (vol.get('DriveLetter') if vol else None) or '?'
+                entry = volumes.setdefault(drv, {'drive': drv, 'used': 0, 'allocated': 0, 'max': 0, 'capacity': 0})
+                entry['used'] += int(item.get('UsedSpace') or 0)
+                entry['allocated'] += int(item.get('AllocatedSpace') or 0)
+                max_space = int(item.get('MaxSpace') or 0)
+                if max_space < UNBOUNDED_MAX_SPACE:
+                    entry['max'] += max_space
+                if vol:
+                    entry['capacity'] = int(vol.get('Capacity') or 0)
+            except: pass
+
+        total_bytes = 0
         details = []
         # Sort by drive letter
-        for drv in sorted(drive_map.keys()):
-            gb = drive_map[drv] / (1024**3)
-            details.append(f"{drv} {gb:.2f} GB")
+        for drv in sorted(volumes.keys()):
+            entry = volumes[drv]
+            total_bytes += entry['used']
+            # Unbounded storage is capped by the volume itself
+            cap = entry['max']
+            if entry['capacity'] and (not cap or cap > entry['capacity']):
+                cap = entry['capacity']
+            entry['cap'] = cap
+            entry['usage'] = entry['used'] / cap if cap else None
+
+            gb = entry['used'] / (1024**3)
+            if cap:
+                details.append(f"{drv} {gb:.2f} / {cap / (1024**3):.2f} GB ({entry['usage'] * 100:.0f}%)")
+            else:
+                details.append(f"{drv} {gb:.2f} GB")
             
         return {
-            'total_gb': total_gb,
-            'details': "\n".join(details) if details else "Нет данных"
+            'total_gb': total_bytes / (1024**3),
+            'details': "\n".join(details) if details else "Нет данных",
+            'volumes': [volumes[drv] for drv in sorted(volumes.keys())]
         }
 
-    @staticmethod
-    def _run_ps_raw(cmd):
-        import subprocess
-        full_cmd = f"powershell -NoProfile -Command \"{cmd}\""
-        try:
-            res = subprocess.run(full_cmd, capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW, text=True)
-            if res.returncode == 0:
-                return {'success': True, 'error': ''}
-            else:
-                return {'success': False, 'error': res.stderr.strip() or "Unknown PS Error"}
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
-
-    @staticmethod
-    def _run_ps_json(cmd):
-        import json
-        import subprocess
-        full_cmd = f"powershell -NoProfile -Command \"[Console]::OutputEncoding = [System.Text.Encoding]::UTF8; {cmd}\""
-        try:
-            res = subprocess.run(full_cmd, capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            raw = res.stdout.decode('utf-8', errors='ignore').strip()
-            if not raw: return []
-            try:
-                data = json.loads(raw)
-            except: 
-                # Recovery for partial/bad JSON
-                return []
-            if isinstance(data, dict): data = [data]
-            return data
-        except: return []
-
     @staticmethod
     def generate_next_name():
-        points = RestorePointManager.get_all_restore_points()
+        points = RestorePointManager.get_cached_points()
         return f"Vortex Restore Point #{len(points) + 1}"
 
     @staticmethod
-    def create_point_wmi(description):
-        import win32com.client
-        try:
-            o = win32com.client.GetObject("winmgmts:\\\\.\\root\\default:SystemRestore")
-            return o.CreateRestorePoint(description, 12, 100) == 0
-        except: return False
+    def create_point(description, backend=None):
+        """Returns {'success': bool, 'error': str}."""
+        backend = backend or RestorePointManager.backend()
+        return backend.create(description)
@@ -1,9 +1,10 @@
+from core import startup # Starts the startup clock, keep it first
 import sys
 import ctypes
 import os
 import subprocess
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QFile, QTextStream
+from PySide6.QtCore import QObject, QEvent, QTimer
 
 def is_admin():
     try:
@@ -57,17 +58,42 @@ def check_wmi_access():
     """Verify we can actually read system restore points now."""
     print("[SYSTEM] Verifying WMI Access...")
     try:
-        import wmi
-        c = wmi.WMI(namespace="root\\default")
+        from core.backends import get_backend
+        backend = get_backend()
         # Just try to get count, don't need full list
-        points = c.SystemRestore()
-        print(f"[SYSTEM] WMI Access OK. Found {len(points)} system restore points.")
+        count = backend.count_points()
+        print(f"[SYSTEM] WMI Access OK ({backend.name}). Found {count} system restore points.")
     except Exception as e:
         print(f"[SYSTEM] WMI Warning (Access might still be restricted): {e}")
 
+class FirstPaintWatcher(QObject):
+    """Fires `callback` once, right after the first widget paint of the app."""
+    def __init__(self, app, callback):
+        super().__init__(app)
+        self.app = app
+        self.callback = callback
+        app.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.app.removeEventFilter(self)
+            startup.mark("first_paint")
+            # Let the frame finish before any background work is queued
+            QTimer.singleShot(0, self.callback)
+        return False
+
+def start_background_work(window):
+    """Deferred past the first frame: nothing here may delay the window appearing."""
+    from ui.jobs import get_scheduler, PRIORITY_BACKGROUND
+    get_scheduler().submit("startup:probe", check_wmi_access, priority=PRIORITY_BACKGROUND,
+                           on_done=lambda _: startup.mark("probe_done"))
+    window.prefetch()
+
 def main():
     # 1. Check Admin Rights BEFORE creating QApplication to avoid overhead if restarting
-    if not is_admin():
+    # (the in-memory fake backend doesn't touch the system and needs no elevation)
+    from core.backends import get_backend
+    if get_backend().requires_admin and not is_admin():
         print("[SYSTEM] Current User is NOT Admin.")
         
         # We need a small app just for the MessageBox if we want to ask user
@@ -87,24 +113,17 @@ def main():
     # --- ADMIN RIGHTS GRANTED ---
     print("[SYSTEM] Running with Admin Privileges.")
     
-    # verify wmi
-    check_wmi_access()
-    
+    # WMI is probed in the background once the window is on screen
     app = QApplication(sys.argv)
+    startup.mark("qt_ready")
     
-    # Resolve absolute path
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    style_path = os.path.join(base_dir, "ui/styles.qss")
-
-    # Load Stylesheet
-    style_file = QFile(style_path)
-    if style_file.open(QFile.ReadOnly | QFile.Text):
-        stream = QTextStream(style_file)
-        app.setStyleSheet(stream.readAll())
-        style_file.close()
+    # One application stylesheet compiled from the theme tokens (also kept in ui/styles.qss)
+    from ui import theme
+    theme.apply(app)
 
     from ui.mainwindow import MainWindow
     window = MainWindow()
+    startup.mark("window_built")
     
     # Apply Dark Title Bar
     if sys.platform == "win32":
@@ -114,8 +133,12 @@ def main():
         except Exception as e:
             pass
 
+    FirstPaintWatcher(app, lambda: start_background_work(window))
     window.show()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Duplicate search hashes on a process pool; frozen builds must dispatch to it first
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -8,11 +8,6 @@ class AIPage(QWidget):
         
         self.label = QLabel("AI Оптимизация — В разработке")
         self.label.setAlignment(Qt.AlignCenter)
-        self.label.setStyleSheet("""
-            color: #7aa2f7;
-            font-size: 24px;
-            font-weight: bold;
-            letter-spacing: 1px;
-        """)
+        self.label.setObjectName("placeholderTitle")
         
         layout.addWidget(self.label)
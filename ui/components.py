@@ -1,124 +1,167 @@
-from PySide6.QtWidgets import QPushButton, QGraphicsDropShadowEffect, QStackedWidget, QGraphicsOpacityEffect
-from PySide6.QtCore import QPropertyAnimation, QRect, QEasingCurve, QSize, Qt
-from PySide6.QtGui import QColor, QIcon
+from PySide6.QtWidgets import QPushButton, QGraphicsDropShadowEffect, QStackedWidget, QWidget
+from PySide6.QtCore import QPropertyAnimation, QVariantAnimation, QEasingCurve, QSize, QRect, QPoint, Qt
+from PySide6.QtGui import QIcon, QPainter
+from ui import theme
+from ui.effects import get_effects
 
 class AnimatedButton(QPushButton):
-    def __init__(self, text="", parent=None, color_default="#24283b", color_hover="#3b4261", icon_path=None):
+    def __init__(self, text="", parent=None, color_default=None, color_hover=None, icon_path=None):
         super().__init__(text, parent)
-        self.color_default = color_default
-        self.color_hover = color_hover
-        
-        button_style = f"""
-            QPushButton {{
-                background-color: {self.color_default};
-                border: 1px solid rgba(148, 163, 184, 0.1);
-                border-radius: 8px;
-                color: #cbd5e1;
-                font-weight: 600;
-                padding: 10px;
-                text-align: center;
-            }}
-        """
-        self.setStyleSheet(button_style)
+        # Look comes from the app stylesheet (role="animated"); hover is a pseudo-state there,
+        # so entering/leaving only repaints instead of re-polishing
+        self.setProperty("role", "animated")
+        if color_default or color_hover:
+            # Custom colors: one sheet at construction, still no re-parse on hover
+            rules = ""
+            if color_default:
+                rules += f'QPushButton {{ background-color: {color_default}; }}'
+            if color_hover:
+                rules += f'QPushButton:hover {{ background-color: {color_hover}; }}'
+            self.setStyleSheet(rules)
         
         if icon_path:
             self.setIcon(QIcon(icon_path))
             self.setIconSize(QSize(24, 24))
 
-        # Drop Shadow for "Glow"
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(0)
-        self.shadow.setColor(QColor(0, 0, 0, 0))
-        self.shadow.setOffset(0, 0)
-        self.setGraphicsEffect(self.shadow)
+        # Glow: only attached while hovered, and only if the effects budget allows it
+        self.shadow = None
+        self.anim = None
+        get_effects().mode_changed.connect(self.apply_effects)
 
-        # Animation
-        self.anim = QPropertyAnimation(self.shadow, b"blurRadius")
-        self.anim.setDuration(200)
-        self.anim.setEasingCurve(QEasingCurve.OutQuad)
+    def apply_effects(self, mode=None):
+        if self.anim is not None:
+            self.anim.stop()
+            self.anim.deleteLater() # May be inside its own finished() signal
+        self.anim = None
+        self.shadow = None
+        if isinstance(self.graphicsEffect(), QGraphicsDropShadowEffect):
+            self.setGraphicsEffect(None)
 
     def enterEvent(self, event):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.color_hover};
-                border: 1px solid #818cf8;
-                border-radius: 8px;
-                color: #ffffff;
-                font-weight: 700;
-                padding: 10px;
-            }}
-        """)
-        self.shadow.setColor(QColor("#818cf8"))
-        self.anim.setStartValue(0)
-        self.anim.setEndValue(25)
-        self.anim.start()
+        effects = get_effects()
+        if effects.allow_graphics_effects():
+            if self.shadow is None:
+                self.shadow = effects.shadow(self, 0, theme.TOKENS['primary_light'])
+                self.anim = QPropertyAnimation(self.shadow, b"blurRadius", self)
+                self.anim.setEasingCurve(QEasingCurve.OutQuad)
+                self.anim.finished.connect(self.on_glow_finished)
+            self.anim.stop()
+            self.anim.setDuration(effects.duration(200))
+            self.anim.setStartValue(self.shadow.blurRadius())
+            self.anim.setEndValue(25)
+            self.anim.start()
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.color_default};
-                border: 1px solid rgba(148, 163, 184, 0.1);
-                border-radius: 8px;
-                color: #cbd5e1;
-                font-weight: 600;
-                padding: 10px;
-            }}
-        """)
-        self.anim.setEndValue(0)
-        self.anim.start()
+        if self.anim is not None:
+            self.anim.stop()
+            self.anim.setStartValue(self.shadow.blurRadius())
+            self.anim.setEndValue(0)
+            self.anim.start()
         super().leaveEvent(event)
 
+    def on_glow_finished(self):
+        # Faded out: drop the effect so the idle button renders directly again
+        if self.shadow is not None and self.anim.endValue() == 0:
+            self.apply_effects()
+
+class CrossFadeOverlay(QWidget):
+    """
+    Blends two cached page snapshots. Sits on top of the stack for the
+    length of a transition, so the live pages underneath aren't repainted.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Opaque: Qt skips painting the pages it covers
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.pix_from = None
+        self.pix_to = None
+        self.progress = 0.0
+        self.hide()
+
+    def set_progress(self, value):
+        self.progress = value
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.pix_from is not None:
+            painter.drawPixmap(self.rect(), self.pix_from)
+        if self.pix_to is not None:
+            painter.setOpacity(self.progress)
+            painter.drawPixmap(self.rect(), self.pix_to)
+
 class FadingStackedWidget(QStackedWidget):
+    """
+    Stack with a cross-fade between pages. Both pages are grabbed into
+    pixmaps once and blended in an overlay, so a transition costs the same
+    whatever the pages contain. A switch requested mid-transition cancels
+    it and lands on the new page at once, so rapid clicks never queue up
+    fades. Honors the effects budget (no fade in "none" mode).
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.fade_anim = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_anim.setDuration(250)
-        self.fade_anim.setEasingCurve(QEasingCurve.OutCubic)
-        
         self.m_next_index = 0
         self.m_active = False
 
+        self.overlay = CrossFadeOverlay(self)
+        self.anim = QVariantAnimation(self)
+        self.anim.setStartValue(0.0)
+        self.anim.setEndValue(1.0)
+        self.anim.setEasingCurve(QEasingCurve.InOutQuad)
+        self.anim.valueChanged.connect(self.overlay.set_progress)
+        self.anim.finished.connect(self.on_fade_finished)
+
     def setCurrentIndex(self, index):
+        if self.m_active:
+            self.cancel_transition()
+            super().setCurrentIndex(index)
+            return
         if self.currentIndex() == index:
             return
             
         self.m_next_index = index
-        self.fade_out()
-
-    def fade_out(self):
-        current = self.currentWidget()
-        if not current:
-            super().setCurrentIndex(self.m_next_index)
+        if not get_effects().allow_animations() or not self.isVisible() or not self.currentWidget():
+            super().setCurrentIndex(index)
             return
+        self.cross_fade()
 
-        self.effect_out = QGraphicsOpacityEffect(current)
-        current.setGraphicsEffect(self.effect_out)
-        
-        self.anim_out = QPropertyAnimation(self.effect_out, b"opacity")
-        self.anim_out.setDuration(150)
-        self.anim_out.setStartValue(1.0)
-        self.anim_out.setEndValue(0.0)
-        self.anim_out.setEasingCurve(QEasingCurve.OutQuad)
-        self.anim_out.finished.connect(self.on_fade_out_finished)
-        self.anim_out.start()
-
-    def on_fade_out_finished(self):
+    def snapshot(self):
+        """The stack area as the user sees it, window background included."""
+        window = self.window()
+        return window.grab(QRect(self.mapTo(window, QPoint(0, 0)), self.size()))
+
+    def cross_fade(self):
+        # Everything below runs in one go, so no intermediate frame is ever shown
+        pix_from = self.snapshot()
         super().setCurrentIndex(self.m_next_index)
-        
-        new_widget = self.currentWidget()
-        if new_widget:
-            self.effect_in = QGraphicsOpacityEffect(new_widget)
-            new_widget.setGraphicsEffect(self.effect_in)
-            
-            self.anim_in = QPropertyAnimation(self.effect_in, b"opacity")
-            self.anim_in.setDuration(250)
-            self.anim_in.setStartValue(0.0)
-            self.anim_in.setEndValue(1.0)
-            self.anim_in.setEasingCurve(QEasingCurve.InQuad)
-            self.anim_in.finished.connect(self.on_fade_in_finished)
-            self.anim_in.start()
-
-    def on_fade_in_finished(self):
-        if self.currentWidget():
-            self.currentWidget().setGraphicsEffect(None)
+        pix_to = self.snapshot()
+
+        self.m_active = True
+        self.overlay.pix_from = pix_from
+        self.overlay.pix_to = pix_to
+        self.overlay.progress = 0.0
+        self.overlay.setGeometry(self.rect())
+        self.overlay.show()
+        self.overlay.raise_()
+
+        self.anim.setDuration(get_effects().duration(250))
+        self.anim.start()
+
+    def cancel_transition(self):
+        self.anim.stop()
+        self.on_fade_finished()
+
+    def resizeEvent(self, event):
+        # Snapshots are for the old size: finish the switch right away
+        if self.m_active:
+            self.cancel_transition()
+        super().resizeEvent(event)
+
+    def on_fade_finished(self):
+        # The real page is already current underneath: just reveal it
+        self.overlay.hide()
+        self.overlay.pix_from = None
+        self.overlay.pix_to = None
+        self.m_active = False
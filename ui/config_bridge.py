@@ -0,0 +1,28 @@
+from PySide6.QtCore import QObject, Signal
+
+
+class ConfigBridge(QObject):
+    """
+    Re-emits ConfigManager changes as a Qt signal. Changes made on worker
+    threads reach GUI-thread slots queued, so pages can connect directly.
+    """
+    changed = Signal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from core.config import ConfigManager
+        ConfigManager().changed.connect(self._forward)
+
+    def _forward(self, key, value):
+        self.changed.emit(key, value)
+
+
+_bridge = None
+
+
+def get_config_bridge():
+    """Application-wide bridge (create from the GUI thread)."""
+    global _bridge
+    if _bridge is None:
+        _bridge = ConfigBridge()
+    return _bridge
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
                                QPushButton, QSizePolicy)
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QObject, Signal
 from PySide6.QtGui import QIcon
 from ui.components import AnimatedButton
 import os
@@ -9,9 +9,33 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 
 
+class ProfileCard(QFrame):
+    """Dashboard card that starts its profile when clicked."""
+    clicked = Signal(str)
+
+    def __init__(self, profile_id):
+        super().__init__()
+        self.profile_id = profile_id
+        self.setCursor(Qt.PointingHandCursor)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self.isEnabled() and self.rect().contains(event.position().toPoint()):
+            self.clicked.emit(self.profile_id)
+        super().mouseReleaseEvent(event)
+
+
+class _PipelineSignals(QObject):
+    # Emitted from the pipeline's pool threads, delivered queued on the GUI thread
+    event = Signal(str, object)
+
+
 class Dashboard(QWidget):
     def __init__(self):
         super().__init__()
+        self.cards = []
+        self.pipeline_signals = _PipelineSignals()
+        self.pipeline_signals.event.connect(self.on_pipeline_event)
+        self._profile = None
         
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(40, 30, 40, 40)
@@ -21,10 +45,10 @@ class Dashboard(QWidget):
         cards_layout = QHBoxLayout()
         cards_layout.setSpacing(20)
 
-        self.add_card(cards_layout, "Производительный", "Идеальное быстродействие", os.path.join(ASSETS_DIR, "icons/diamond.svg"), "#7aa2f7")
-        self.add_card(cards_layout, "Энергосберегающий", "Баланс быстродействия", os.path.join(ASSETS_DIR, "icons/leaf.svg"), "#9ece6a")
-        self.add_card(cards_layout, "Рискованный", "Максимум, без гарантий", os.path.join(ASSETS_DIR, "icons/fire.svg"), "#f7768e")
-        self.add_card(cards_layout, "Пользовательский", "Индивидуальный набор", os.path.join(ASSETS_DIR, "icons/settings.svg"), "#e0af68")
+        self.add_card(cards_layout, "Производительный", "Идеальное быстродействие", os.path.join(ASSETS_DIR, "icons/diamond.svg"), "blue", "performance")
+        self.add_card(cards_layout, "Энергосберегающий", "Баланс быстродействия", os.path.join(ASSETS_DIR, "icons/leaf.svg"), "green", "power_saving")
+        self.add_card(cards_layout, "Рискованный", "Максимум, без гарантий", os.path.join(ASSETS_DIR, "icons/fire.svg"), "red", "risky")
+        self.add_card(cards_layout, "Пользовательский", "Индивидуальный набор", os.path.join(ASSETS_DIR, "icons/settings.svg"), "amber", "custom")
 
         main_layout.addLayout(cards_layout)
 
@@ -40,37 +64,20 @@ class Dashboard(QWidget):
         
         sp_title = QLabel("Начало использования")
         sp_title.setAlignment(Qt.AlignCenter)
-        sp_title.setStyleSheet("font-size: 20px; font-weight: bold; color: white; margin-bottom: 10px;")
+        sp_title.setObjectName("panelTitle")
         
-        sp_desc = QLabel("Нажмите кнопку ниже, чтобы применить\nрекомендованные настройки.")
-        sp_desc.setAlignment(Qt.AlignCenter)
-        sp_desc.setStyleSheet("color: #787c99; font-size: 14px; margin-bottom: 20px;")
+        self.sp_desc = QLabel("Нажмите кнопку ниже, чтобы применить\nрекомендованные настройки.")
+        self.sp_desc.setAlignment(Qt.AlignCenter)
+        self.sp_desc.setObjectName("panelText")
         
-        btn_start = QPushButton("Начать оптимизацию")
+        self.btn_start = btn_start = QPushButton("Начать оптимизацию")
         btn_start.setCursor(Qt.PointingHandCursor)
-        btn_start.setStyleSheet("""
-            QPushButton {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #4f46e5, stop:1 #818cf8);
-                color: white; 
-                border-radius: 8px; 
-                padding: 12px 24px;
-                font-weight: 700;
-                font-size: 14px;
-                border: 1px solid #6366f1;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 #4338ca, stop:1 #6366f1);
-                border: 1px solid #818cf8;
-            }
-            QPushButton:pressed {
-                 background-color: #3730a3;
-            }
-        """)
+        btn_start.setObjectName("primaryAction")
 
         btn_start.clicked.connect(self.on_start_optimization)
 
         sp_layout.addWidget(sp_title)
-        sp_layout.addWidget(sp_desc)
+        sp_layout.addWidget(self.sp_desc)
         sp_layout.addWidget(btn_start, 0, Qt.AlignCenter)
         
 
@@ -82,18 +89,18 @@ class Dashboard(QWidget):
         
         up_title = QLabel("Информация обновлений")
         up_title.setAlignment(Qt.AlignCenter)
-        up_title.setStyleSheet("font-size: 20px; font-weight: bold; color: white; margin-bottom: 10px;")
+        up_title.setObjectName("panelTitle")
         
         up_status = QLabel("У вас актуальная версия: 1.2.0")
         up_status.setAlignment(Qt.AlignCenter)
-        up_status.setStyleSheet("color: #9ece6a; font-weight: bold; margin-bottom: 10px;")
+        up_status.setObjectName("panelStatus")
 
         up_text = QLabel(
             "• Добавлен новый режим 'Рискованный'\n"
             "• Исправлены ошибки интерфейса\n"
             "• Улучшена производительность анимаций"
         )
-        up_text.setStyleSheet("color: #94a3b8; font-size: 13px; line-height: 1.6;")
+        up_text.setObjectName("panelNotes")
         up_text.setAlignment(Qt.AlignTop | Qt.AlignLeft)
         
         up_layout.addWidget(up_title)
@@ -107,24 +114,13 @@ class Dashboard(QWidget):
         main_layout.addLayout(info_layout)
         main_layout.addStretch()
 
-    def add_card(self, layout, title, desc, icon_path, color):
-        card = QFrame()
+    def add_card(self, layout, title, desc, icon_path, accent, profile_id):
+        card = ProfileCard(profile_id)
         card.setObjectName("card")
-        
-        base_style = """
-            #card {
-                background-color: rgba(30, 41, 59, 0.4);
-                border: 1px solid rgba(148, 163, 184, 0.1);
-                border-radius: 16px;
-            }
-        """
-        
-        card.setStyleSheet(base_style + f"""
-            #card:hover {{
-                background-color: rgba(30, 41, 59, 0.6);
-                border: 1px solid {color};
-            }}
-        """)
+        card.clicked.connect(self.on_profile_clicked)
+        self.cards.append(card)
+        # Hover border color comes from the accent rules in ui/theme.py
+        card.setProperty("accent", accent)
         
         c_layout = QVBoxLayout(card)
         c_layout.setContentsMargins(20, 30, 20, 30)
@@ -140,12 +136,12 @@ class Dashboard(QWidget):
 
         lbl_title = QLabel(title)
         lbl_title.setAlignment(Qt.AlignCenter)
-        lbl_title.setStyleSheet("font-size: 16px; font-weight: 700; color: #f1f5f9;")
+        lbl_title.setObjectName("cardTitle")
 
         lbl_desc = QLabel(desc)
         lbl_desc.setAlignment(Qt.AlignCenter)
         lbl_desc.setWordWrap(True)
-        lbl_desc.setStyleSheet("color: #94a3b8; font-size: 13px; font-weight: 500;")
+        lbl_desc.setObjectName("cardDesc")
 
         c_layout.addWidget(lbl_icon)
         c_layout.addWidget(lbl_title)
@@ -158,8 +154,123 @@ class Dashboard(QWidget):
         if hasattr(mw, 'safety'):
             # Define what to do after safety check passes
             def run_optimization():
-                print(">>> STARTING OPTIMIZATION PHASE... (Tweaks to be applied here)")
+                from core.tweaks import catalog
+                from core.tweaks.planner import TweakPlanner
+                from ui.jobs import get_scheduler, PRIORITY_USER
+                changes = [(t, True) for t in catalog.recommended()]
+                self.btn_start.setEnabled(False)
+                self.sp_desc.setText("Проверка текущих настроек...")
+                # Dry run first: only what differs from the current state gets applied
+                get_scheduler().submit(
+                    "tweaks:plan", lambda: TweakPlanner().plan(changes),
+                    priority=PRIORITY_USER,
+                    on_done=self.on_plan_ready,
+                    on_error=lambda err: self.on_optimization_finished({'success': False, 'tweaks': {}, 'error': err}))
             
             mw.safety.verify_and_run(run_optimization)
         else:
             print("Safety manager not found")
+
+    def set_busy(self, busy):
+        self.btn_start.setEnabled(not busy)
+        for card in self.cards:
+            card.setEnabled(not busy)
+
+    def on_profile_clicked(self, profile_id):
+        from core.tweaks import profiles
+        profile = profiles.get(profile_id)
+        mw = self.window()
+        if profile is None or not hasattr(mw, 'safety'):
+            return
+
+        def run_profile():
+            from core.tweaks.pipeline import compile_profile
+            from ui.jobs import get_scheduler, PRIORITY_USER
+            self.set_busy(True)
+            self.sp_desc.setText(f"Профиль «{profile.title}»:\nпроверка текущих настроек...")
+            get_scheduler().submit(
+                f"profile:plan:{profile.id}", lambda: compile_profile(profile),
+                priority=PRIORITY_USER,
+                on_done=lambda compiled: self.on_profile_planned(profile, *compiled),
+                on_error=lambda err: self.on_profile_finished(profile, {'success': False, 'tweaks': {}, 'error': err}))
+
+        mw.safety.verify_and_run(run_profile)
+
+    def on_profile_planned(self, profile, plan, stages):
+        if not len(plan):
+            self.set_busy(False)
+            self.sp_desc.setText(f"Профиль «{profile.title}» уже применён,\nизменения не требуются.")
+            return
+
+        from ui.plan_dialog import TweakPlanDialog
+        if not TweakPlanDialog(plan, self).exec():
+            self.set_busy(False)
+            self.sp_desc.setText("Нажмите кнопку ниже, чтобы применить\nрекомендованные настройки.")
+            return
+
+        from core.tweaks.pipeline import ProfilePipeline
+        from ui.jobs import get_scheduler, PRIORITY_USER
+        self._profile = profile
+        self.sp_desc.setText(f"Профиль «{profile.title}»: 0/{len(stages)}")
+        pipeline = ProfilePipeline(stages)
+        # Independent stages (registry, services, power, commands) run concurrently
+        get_scheduler().submit(
+            f"profile:{profile.id}",
+            lambda token: pipeline.run(self.pipeline_signals.event.emit, token),
+            priority=PRIORITY_USER, resource="tweaks:apply", wants_token=True,
+            on_done=lambda res: self.on_profile_finished(profile, res),
+            on_error=lambda err: self.on_profile_finished(profile, {'success': False, 'tweaks': {}, 'error': err}))
+
+    def on_pipeline_event(self, event, info):
+        if self._profile is None:
+            return
+        from core.tweaks.pipeline import EVENT_STARTED
+        if event == EVENT_STARTED:
+            return # Progress moves on completions; several stages may be running at once
+        self.sp_desc.setText(f"Профиль «{self._profile.title}»: {info['done']}/{info['total']}\n{info['title']}")
+
+    def on_profile_finished(self, profile, res):
+        self._profile = None
+        self.set_busy(False)
+        applied = sum(1 for ok, _ in res['tweaks'].values() if ok)
+        if res['success']:
+            freed = sum(report['bytes'] for report in res.get('cleanup', {}).values())
+            if freed:
+                from core.cleanup.engine import format_size
+                applied = f"{applied}, освобождено {format_size(freed)}"
+            self.sp_desc.setText(f"Профиль «{profile.title}» применён за {res['elapsed']:.1f} с\n"
+                                 f"(настроек: {applied}).")
+        else:
+            self.sp_desc.setText(f"Профиль «{profile.title}»: применено {applied} из {len(res['tweaks'])}.\n"
+                                 f"{res['error']}")
+
+    def on_plan_ready(self, plan):
+        if not len(plan):
+            self.btn_start.setEnabled(True)
+            self.sp_desc.setText(f"Всё уже применено ({plan.unchanged} параметров),\nизменения не требуются.")
+            return
+
+        from ui.plan_dialog import TweakPlanDialog
+        if not TweakPlanDialog(plan, self).exec():
+            self.btn_start.setEnabled(True)
+            self.sp_desc.setText("Нажмите кнопку ниже, чтобы применить\nрекомендованные настройки.")
+            return
+
+        from core.tweaks import get_engine
+        from ui.jobs import get_scheduler, PRIORITY_USER
+        self.sp_desc.setText("Применение настроек...")
+        # Only the diff: one batch with the operations that change something
+        get_scheduler().submit(
+            "tweaks:recommended", lambda: get_engine().run(plan.batch),
+            priority=PRIORITY_USER, resource="tweaks:apply",
+            on_done=self.on_optimization_finished,
+            on_error=lambda err: self.on_optimization_finished({'success': False, 'tweaks': {}, 'error': err}))
+
+    def on_optimization_finished(self, res):
+        self.btn_start.setEnabled(True)
+        applied = sum(1 for ok, _ in res['tweaks'].values() if ok)
+        if res['success']:
+            self.sp_desc.setText(f"Готово: применено настроек — {applied}.")
+        else:
+            error = res['error'] or next((e for ok, e in res['tweaks'].values() if not ok), "")
+            self.sp_desc.setText(f"Применено {applied} из {len(res['tweaks'])}.\n{error}")
@@ -0,0 +1,72 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit
+from PySide6.QtCore import Qt
+
+from core.cleanup.engine import format_size
+
+
+class DuplicatesDialog(QDialog):
+    """
+    Duplicate search results: in every group the oldest file stays and the
+    other copies are offered for deletion.
+    """
+    def __init__(self, res, parent=None):
+        super().__init__(parent)
+        self.groups = res['groups']
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
+        self.setObjectName("planDialog") # Same look as the tweak plan dialog
+        self.setFixedSize(640, 460)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 25, 30, 25)
+        layout.setSpacing(12)
+
+        title = QLabel("Дубликаты файлов")
+        title.setObjectName("planTitle")
+
+        copies = sum(len(group['paths']) - 1 for group in self.groups)
+        summary = QLabel(f"Групп: {len(self.groups)} · лишних копий: {copies} · "
+                         f"можно освободить {format_size(res['wasted'])} · {res['elapsed']:.1f} с")
+        summary.setObjectName("planSummary")
+
+        lines = []
+        for group in self.groups:
+            lines.append(f"{format_size(group['size'])} × {len(group['paths'])}:")
+            lines.append(f"  оставить  {group['paths'][0]}")
+            lines.extend(f"  удалить   {path}" for path in group['paths'][1:])
+            lines.append("")
+        listing = QPlainTextEdit("\n".join(lines))
+        listing.setObjectName("planDiff")
+        listing.setReadOnly(True)
+        listing.setLineWrapMode(QPlainTextEdit.NoWrap)
+
+        btns = QHBoxLayout()
+        b_cancel = QPushButton("Закрыть")
+        b_cancel.setObjectName("outlineButton")
+        b_cancel.setProperty("accent", "blue")
+        b_cancel.setCursor(Qt.PointingHandCursor)
+        b_cancel.clicked.connect(self.reject)
+
+        b_remove = QPushButton("Удалить копии")
+        b_remove.setObjectName("rowAction")
+        b_remove.setCursor(Qt.PointingHandCursor)
+        b_remove.clicked.connect(self.accept)
+
+        btns.addStretch()
+        btns.addWidget(b_cancel)
+        btns.addWidget(b_remove)
+
+        layout.addWidget(title)
+        layout.addWidget(summary)
+        layout.addWidget(listing, 1)
+        layout.addLayout(btns)
+
+    def selected(self):
+        """
+        Groups to pass to DuplicateFinder.remove(): the oldest file of each
+        group is kept, every other copy is deleted. Paths carry the mtime seen
+        by the search, so files changed since then are left alone.
+        """
+        return [{'size': group['size'], 'hash': group['hash'],
+                 'keep': (group['paths'][0], group['mtimes'][0]),
+                 'copies': list(zip(group['paths'][1:], group['mtimes'][1:]))}
+                for group in self.groups]
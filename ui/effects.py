@@ -0,0 +1,79 @@
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QGraphicsDropShadowEffect
+from PySide6.QtGui import QColor
+
+# Config key "effects_mode"
+EFFECTS_FULL = "full"       # shadows, glows, animated transitions
+EFFECTS_REDUCED = "reduced" # no graphics effects, shorter animations
+EFFECTS_NONE = "none"       # no effects, no animations
+EFFECTS_MODES = (EFFECTS_FULL, EFFECTS_REDUCED, EFFECTS_NONE)
+
+
+class EffectsBudget(QObject):
+    """
+    Decides which visual effects the UI may use. Graphics effects render the
+    widget offscreen on every paint, so they are the first thing to go.
+    Components ask allow_*()/duration() when building and re-apply on
+    mode_changed, so switching the mode takes effect without a restart.
+    """
+    mode_changed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from core.config import ConfigManager
+        from ui.config_bridge import get_config_bridge
+        self.mode = self._validate(ConfigManager().get("effects_mode", EFFECTS_FULL))
+        get_config_bridge().changed.connect(self._on_config_changed)
+
+    @staticmethod
+    def _validate(mode):
+        return mode if mode in EFFECTS_MODES else EFFECTS_FULL
+
+    def _on_config_changed(self, key, value):
+        if key != "effects_mode":
+            return
+        mode = self._validate(value)
+        if mode != self.mode:
+            self.mode = mode
+            self.mode_changed.emit(mode)
+
+    def allow_graphics_effects(self):
+        return self.mode == EFFECTS_FULL
+
+    def allow_animations(self):
+        return self.mode != EFFECTS_NONE
+
+    def duration(self, ms):
+        """Animation length under the current budget (0 means jump to the end)."""
+        if self.mode == EFFECTS_FULL:
+            return ms
+        if self.mode == EFFECTS_REDUCED:
+            return ms // 2
+        return 0
+
+    def shadow(self, widget, blur, color, offset=(0, 0)):
+        """
+        Attaches a drop shadow if the budget allows one, otherwise removes any.
+        Returns the effect or None.
+        """
+        if not self.allow_graphics_effects():
+            if isinstance(widget.graphicsEffect(), QGraphicsDropShadowEffect):
+                widget.setGraphicsEffect(None)
+            return None
+        effect = QGraphicsDropShadowEffect(widget)
+        effect.setBlurRadius(blur)
+        effect.setColor(QColor(color))
+        effect.setOffset(*offset)
+        widget.setGraphicsEffect(effect)
+        return effect
+
+
+_effects = None
+
+
+def get_effects():
+    """Application-wide effects budget (create from the GUI thread)."""
+    global _effects
+    if _effects is None:
+        _effects = EffectsBudget()
+    return _effects
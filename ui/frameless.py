@@ -57,7 +57,7 @@ class FramelessWindow(QMainWindow):
 
         # Title/Logo
         lbl_title = QLabel(title)
-        lbl_title.setStyleSheet("color: #7aa2f7; font-weight: bold;")
+        lbl_title.setObjectName("titleBarTitle")
         tb_layout.addWidget(lbl_title)
         tb_layout.addStretch()
 
@@ -0,0 +1,79 @@
+from PySide6.QtWidgets import QListView, QAbstractItemView, QFrame
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+PAGE_SIZE = 50
+
+EntryRole = Qt.UserRole + 1
+
+ACTION_LABELS = {
+    "create": "Создана точка",
+}
+
+
+class OperationLogModel(QAbstractListModel):
+    """
+    Operation history, newest first, pulled from the Logger one page at a time.
+    The view asks for more through canFetchMore/fetchMore as it scrolls.
+    """
+    def __init__(self, action=None, parent=None):
+        super().__init__(parent)
+        self.action = action
+        self._entries = []
+        self._cursor = None
+        self._exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            label = ACTION_LABELS.get(entry.get('action'), entry.get('action'))
+            return f"{entry.get('timestamp')}   {label}: {entry.get('name')}"
+        if role == Qt.ToolTipRole:
+            return entry.get('description')
+        if role == EntryRole:
+            return entry
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        from core.logger import Logger
+        page = Logger().query(action=self.action, limit=PAGE_SIZE, cursor=self._cursor)
+        entries = page['entries']
+        self._cursor = page['cursor']
+        self._exhausted = self._cursor is None
+        if entries:
+            self.beginInsertRows(QModelIndex(), len(self._entries), len(self._entries) + len(entries) - 1)
+            self._entries.extend(entries)
+            self.endInsertRows()
+
+    def reload(self):
+        """Drops loaded pages; the view fetches the first one again."""
+        self.beginResetModel()
+        self._entries = []
+        self._cursor = None
+        self._exhausted = False
+        self.endResetModel()
+
+
+class OperationLogList(QListView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setObjectName("historyList")
+        self.setProperty("transparent", True)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.NoFocus)
+
+        self.log_model = OperationLogModel(parent=self)
+        self.setModel(self.log_model)
@@ -0,0 +1,214 @@
+import itertools
+import threading
+from collections import deque
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+PRIORITY_BACKGROUND = 0
+PRIORITY_USER = 10
+
+# Error passed to the on_error of a job replaced through `supersede`
+SUPERSEDED = "superseded"
+
+
+class Job:
+    """
+    Handle for a submitted job. cancel() drops a pending job outright;
+    a running one gets its token set and its result is discarded.
+    """
+    def __init__(self, job_id, key, fn, priority, resource, on_done, on_error, wants_token=False):
+        self.id = job_id
+        self.key = key
+        self.fn = fn
+        self.wants_token = wants_token
+        self.priority = priority
+        self.resource = resource
+        self.callbacks = [(on_done, on_error)]
+        self.state = "pending" # pending -> running -> done / failed / cancelled
+        self.token = threading.Event()
+        self.runnable = None
+
+    @property
+    def cancelled(self):
+        return self.token.is_set()
+
+    def cancel(self):
+        get_scheduler().cancel(self)
+
+
+class _JobRunnable(QRunnable):
+    def __init__(self, job, signals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job = job
+        self.signals = signals
+
+    def run(self):
+        job = self.job
+        if job.cancelled:
+            # Still report back so the scheduler frees the job's resource
+            self.signals.completed.emit(job.id, None, None)
+            return
+        self.signals.started.emit(job.id)
+        try:
+            # Long jobs may take the cancellation token to stop early
+            if job.wants_token:
+                result = job.fn(job.token)
+            else:
+                result = job.fn()
+        except Exception as e:
+            self.signals.completed.emit(job.id, None, str(e) or e.__class__.__name__)
+            return
+        self.signals.completed.emit(job.id, result, None)
+
+
+class _JobSignals(QObject):
+    # Emitted from pool threads, delivered queued on the GUI thread
+    started = Signal(int)
+    completed = Signal(int, object, object)
+
+
+class JobScheduler(QObject):
+    """
+    Shared executor for system operations.
+      - identical pending jobs (same key) are coalesced into one;
+      - `supersede` cancels a pending or running job with the same key and queues
+        a fresh one; the old job's callers get on_error(SUPERSEDED);
+      - jobs with the same `resource` run strictly one after another;
+      - user-initiated work runs ahead of background refreshes.
+    Bookkeeping happens on the GUI thread only; callbacks are invoked there too.
+    """
+    job_finished = Signal(str, object)
+    job_failed = Signal(str, str)
+
+    def __init__(self, max_threads=4, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._ids = itertools.count(1)
+        self._jobs = {} # id -> Job, while pending or running
+        self._busy_resources = set()
+        self._waiting = {} # resource -> deque of jobs
+
+        self._signals = _JobSignals(self)
+        self._signals.started.connect(self._on_started)
+        self._signals.completed.connect(self._on_completed)
+
+    def submit(self, key, fn, priority=PRIORITY_BACKGROUND, resource=None,
+               supersede=False, on_done=None, on_error=None, wants_token=False):
+        """
+        Queues fn() on the pool. With wants_token=True it is called as
+        fn(token) instead, token being a threading.Event set on cancel.
+        With supersede=True the replacement may compute something else (the
+        opposite toggle, other targets), so it never answers the old job's
+        callbacks: each of them gets on_error(SUPERSEDED) instead.
+        """
+        superseded = []
+        for job in list(self._jobs.values()):
+            if job.key != key or job.cancelled:
+                continue
+            if job.state == "pending" and not supersede:
+                # Coalesce: one run answers every caller
+                job.callbacks.append((on_done, on_error))
+                if priority > job.priority:
+                    self._reprioritize(job, priority)
+                return job
+            if supersede:
+                superseded.extend(job.callbacks)
+                self.cancel(job)
+
+        job = Job(next(self._ids), key, fn, priority, resource, on_done, on_error, wants_token)
+        self._jobs[job.id] = job
+
+        if resource is not None and resource in self._busy_resources:
+            self._waiting.setdefault(resource, deque()).append(job)
+        else:
+            self._start(job)
+
+        for _, old_error in superseded:
+            if old_error: old_error(SUPERSEDED)
+        return job
+
+    def cancel(self, job):
+        if job.id not in self._jobs or job.cancelled:
+            return
+        job.token.set()
+        waiting = self._waiting.get(job.resource)
+        if waiting and job in waiting:
+            waiting.remove(job)
+            self._jobs.pop(job.id, None)
+        elif job.runnable is not None and self.pool.tryTake(job.runnable):
+            # Never reached a worker: release its resource right away
+            self._finish(job)
+        # Otherwise it is running: the result is dropped when it completes
+        job.state = "cancelled"
+
+    def cancel_key(self, key):
+        for job in list(self._jobs.values()):
+            if job.key == key:
+                self.cancel(job)
+
+    def pending_count(self):
+        return len(self._jobs)
+
+    def wait_for_done(self, msecs=-1):
+        return self.pool.waitForDone(msecs)
+
+    def _start(self, job):
+        if job.resource is not None:
+            self._busy_resources.add(job.resource)
+        job.runnable = _JobRunnable(job, self._signals)
+        self.pool.start(job.runnable, job.priority)
+
+    def _reprioritize(self, job, priority):
+        job.priority = priority
+        if job.runnable is not None and self.pool.tryTake(job.runnable):
+            self.pool.start(job.runnable, priority)
+
+    def _on_started(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is not None and job.state == "pending":
+            job.state = "running"
+
+    def _on_completed(self, job_id, result, error):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        self._finish(job)
+
+        if job.cancelled:
+            return
+        job.state = "failed" if error else "done"
+        for on_done, on_error in job.callbacks:
+            if error:
+                if on_error: on_error(error)
+            elif on_done:
+                on_done(result)
+        if error:
+            self.job_failed.emit(job.key, error)
+        else:
+            self.job_finished.emit(job.key, result)
+
+    def _finish(self, job):
+        self._jobs.pop(job.id, None)
+        job.runnable = None
+        if job.resource is None:
+            return
+        waiting = self._waiting.get(job.resource)
+        if waiting:
+            self._start(waiting.popleft())
+        else:
+            self._busy_resources.discard(job.resource)
+            self._waiting.pop(job.resource, None)
+
+
+_scheduler = None
+
+
+def get_scheduler():
+    """Application-wide scheduler (create from the GUI thread)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler()
+    return _scheduler
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                                QPushButton, QStackedWidget, QFrame, QLabel, QButtonGroup)
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QEvent, QTimer
 from PySide6.QtGui import QIcon
 from ui.frameless import FramelessWindow
 from ui.components import AnimatedButton, FadingStackedWidget
@@ -55,6 +55,8 @@ class MainWindow(FramelessWindow):
         # but here we can just import at top or here.
         from ui.modal import SafetyManager
         self.safety = SafetyManager(self)
+        # Routed through the window: the settings page may not be built yet
+        self.safety.restore_point_created.connect(self.on_restore_point_created)
 
     def create_sidebar(self, parent_layout):
         self.sidebar = QFrame()
@@ -103,62 +105,119 @@ class MainWindow(FramelessWindow):
             btn.setIcon(QIcon(icon_path))
             btn.setIconSize(QSize(28, 28))
         elif text == "AI":
-            # AI Section Styling
-            btn.setStyleSheet("""
-                QPushButton#sidebarButton {
-                    font-family: 'Montserrat', 'Gilroy', 'Segoe UI', sans-serif;
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: white;
-                    border: 1px solid rgba(122, 162, 247, 0.4);
-                    border-radius: 12px;
-                    background-color: transparent;
-                }
-                QPushButton#sidebarButton:hover {
-                    background-color: rgba(122, 162, 247, 0.1);
-                    border: 1px solid #7aa2f7;
-                }
-                QPushButton#sidebarButton:checked {
-                    background-color: rgba(122, 162, 247, 0.2);
-                    border: 1px solid #7aa2f7;
-                    border-left: 3px solid #7aa2f7;
-                    color: #7aa2f7;
-                }
-            """)
-            from PySide6.QtWidgets import QGraphicsDropShadowEffect
+            # AI Section Styling (sidebarButton[role="ai"] in the app stylesheet)
+            btn.setProperty("role", "ai")
             from PySide6.QtGui import QColor
-            glow = QGraphicsDropShadowEffect()
-            glow.setBlurRadius(15)
-            glow.setColor(QColor(122, 162, 247, 150))
-            glow.setOffset(0, 0)
-            btn.setGraphicsEffect(glow)
+            from ui.effects import get_effects
+            # Glow only in "full" effects mode; follows mode changes at runtime
+            apply_glow = lambda *args: get_effects().shadow(btn, 15, QColor(122, 162, 247, 150))
+            apply_glow()
+            get_effects().mode_changed.connect(apply_glow)
         elif icon_path:
             print(f"Icon not found: {icon_path}")
         
-        btn.clicked.connect(lambda: self.content_stack.setCurrentIndex(index))
+        btn.clicked.connect(lambda: self.show_page(index))
+        btn.installEventFilter(self) # Hover starts building the page
         layout.addWidget(btn, 0, Qt.AlignCenter)
         self.nav_group.addButton(btn, index)
         self.nav_buttons[index] = btn
 
     def init_pages(self):
-        from ui.dashboard import Dashboard
-        from ui.tweaks_container import TweaksContainer
-        from ui.settings_page import SettingsPage
-        from ui.ai_page import AIPage
+        """
+        Pages are registered as factories and built on first use; the stack
+        holds an empty placeholder at each index until then.
+        """
+        self.page_factories = {
+            0: self.build_dashboard,
+            1: self.build_ai_page,
+            2: self.build_tweaks,
+            3: self.build_settings,
+        }
+        self.pages = {}
+        self.settings_page = None
+        self._prebuild_queued = set()
 
-        # 0: Dashboard (Home)
-        self.content_stack.addWidget(Dashboard())
+        for index in sorted(self.page_factories):
+            self.content_stack.addWidget(QWidget())
 
-        # 1: AI Page
-        self.content_stack.addWidget(AIPage())
+        # The dashboard is what the user sees first
+        self.ensure_page(0)
 
-        # 2: System / Tweaks
-        self.content_stack.addWidget(TweaksContainer())
+    def build_dashboard(self):
+        from ui.dashboard import Dashboard
+        return Dashboard()
 
-        # 3: Settings
+    def build_ai_page(self):
+        from ui.ai_page import AIPage
+        return AIPage()
+
+    def build_tweaks(self):
+        from ui.tweaks_container import TweaksContainer
+        return TweaksContainer()
+
+    def build_settings(self):
+        from ui.settings_page import SettingsPage
         self.settings_page = SettingsPage()
-        self.content_stack.addWidget(self.settings_page)
-        
-        # Connect SafetyManager signal to Settings refresh
-        if hasattr(self, 'safety'):
-            self.safety.restore_point_created.connect(self.settings_page.refresh_logs)
+        # Served from the snapshot cache if the startup prefetch already ran
+        self.settings_page.refresh_logs()
+        return self.settings_page
+
+    def ensure_page(self, index):
+        page = self.pages.get(index)
+        if page is None:
+            page = self.page_factories[index]()
+            self.pages[index] = page
+            placeholder = self.content_stack.widget(index)
+            self.content_stack.insertWidget(index, page)
+            if self.content_stack.currentWidget() is placeholder:
+                # Swap in place: removing the current widget would make its neighbour current
+                self.content_stack.setCurrentWidget(page)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return page
+
+    def show_page(self, index):
+        self.ensure_page(index)
+        self.content_stack.setCurrentIndex(index)
+
+    def prebuild_page(self, index):
+        """Builds a page on the next idle pass of the event loop, ahead of the click."""
+        if index in self.pages or index in self._prebuild_queued:
+            return
+        self._prebuild_queued.add(index)
+        QTimer.singleShot(0, lambda: self.ensure_page(index))
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Enter:
+            index = self.nav_group.id(obj)
+            if index in getattr(self, 'page_factories', {}):
+                self.prebuild_page(index)
+        return super().eventFilter(obj, event)
+
+    def on_restore_point_created(self):
+        # Not built yet: it loads fresh data (the cache was invalidated) when opened
+        if self.settings_page is not None:
+            self.settings_page.refresh_logs()
+
+    def prefetch(self):
+        """
+        Warms the restore point snapshot once the first frame is painted,
+        whether or not the settings page exists yet.
+        """
+        from core import startup
+        from core.wmi_manager import RestorePointManager
+        from ui.jobs import get_scheduler, SUPERSEDED
+
+        def on_done(snapshot):
+            if self.settings_page is not None:
+                self.settings_page.on_snapshot_loaded(snapshot)
+            startup.finish()
+
+        def on_error(err):
+            # A failed or superseded prefetch still ends startup, so the report is printed
+            if err != SUPERSEDED:
+                print(f"[SYSTEM] Snapshot prefetch failed: {err}")
+            startup.finish()
+
+        get_scheduler().submit("snapshot", RestorePointManager.get_cached_snapshot,
+                               on_done=on_done, on_error=on_error)
@@ -35,25 +35,7 @@ class RestorePointDialog(QFrame):
         super().__init__(parent)
         self.setObjectName("restoreDialog")
         self.setFixedSize(500, 350)
-        
-        # Style logic to look like glass
-        self.setStyleSheet("""
-            #restoreDialog {
-                background-color: #1e1b4b; /* Deep Indigo Background */
-                border: 1px solid #4f46e5;
-                border-radius: 16px;
-            }
-            QLabel {
-                color: #e2e8f0;
-            }
-            QPushButton {
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 13px;
-                border: none;
-            }
-        """)
+        # Glass look comes from the app stylesheet (#restoreDialog, #prompt*)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
@@ -61,6 +43,7 @@ class RestorePointDialog(QFrame):
 
         # Title
         title = QLabel("Рекомендуем создать точку восстановления")
+        title.setObjectName("promptTitle")
         title.setAlignment(Qt.AlignCenter)
         title.setWordWrap(True)
         f_title = QFont()
@@ -73,7 +56,7 @@ class RestorePointDialog(QFrame):
         # Minimalist approach
         desc = QLabel("Создать точку перед изменениями?")
         desc.setAlignment(Qt.AlignCenter)
-        desc.setStyleSheet("color: #cbd5e1; font-size: 16px; margin-bottom: 20px;")
+        desc.setObjectName("promptText")
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -81,30 +64,12 @@ class RestorePointDialog(QFrame):
 
         btn_reject = QPushButton("Отклонить")
         btn_reject.setCursor(Qt.PointingHandCursor)
-        btn_reject.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #94a3b8;
-                border: 1px solid #334155;
-            }
-            QPushButton:hover {
-                border: 1px solid #475569;
-                color: #cbd5e1;
-            }
-        """)
+        btn_reject.setObjectName("promptReject")
         btn_reject.clicked.connect(self.rejected.emit)
 
         btn_create = QPushButton("Создать")
         btn_create.setCursor(Qt.PointingHandCursor)
-        btn_create.setStyleSheet("""
-            QPushButton {
-                background-color: #4f46e5;
-                color: white;
-            }
-            QPushButton:hover {
-                background-color: #4338ca;
-            }
-        """)
+        btn_create.setObjectName("promptAccept")
         btn_create.clicked.connect(self.accepted.emit)
 
         btn_layout.addWidget(btn_reject)
@@ -126,15 +91,7 @@ class ConfirmationDialog(QFrame):
         super().__init__(parent)
         self.setObjectName("confirmDialog")
         self.setFixedSize(400, 200)
-        
-        self.setStyleSheet("""
-            #confirmDialog {
-                background-color: #1e1b4b;
-                border: 1px solid #ef4444; /* Red border for alert */
-                border-radius: 16px;
-            }
-            QLabel { color: #e2e8f0; }
-        """)
+        # Red alert frame comes from the app stylesheet (#confirmDialog, #confirm*)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
@@ -142,43 +99,24 @@ class ConfirmationDialog(QFrame):
 
         lbl_title = QLabel(title)
         lbl_title.setAlignment(Qt.AlignCenter)
-        lbl_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #ef4444;")
+        lbl_title.setObjectName("confirmTitle")
         
         lbl_text = QLabel(text)
         lbl_text.setAlignment(Qt.AlignCenter)
         lbl_text.setWordWrap(True)
-        lbl_text.setStyleSheet("color: #cbd5e1; font-size: 14px;")
+        lbl_text.setObjectName("confirmText")
 
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(15)
 
         btn_cancel = QPushButton("Отмена")
         btn_cancel.setCursor(Qt.PointingHandCursor)
-        btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #475569;
-                color: #cbd5e1;
-                border-radius: 8px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover { background-color: rgba(255,255,255,0.05); }
-        """)
+        btn_cancel.setObjectName("confirmCancel")
         btn_cancel.clicked.connect(self.rejected.emit)
 
         btn_ok = QPushButton("Да, удалить")
         btn_ok.setCursor(Qt.PointingHandCursor)
-        btn_ok.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;
-                border: none;
-                color: white;
-                font-weight: bold;
-                border-radius: 8px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover { background-color: #dc2626; }
-        """)
+        btn_ok.setObjectName("confirmAccept")
         btn_ok.clicked.connect(self.accepted.emit)
 
         btn_layout.addWidget(btn_cancel)
@@ -267,8 +205,11 @@ class SafetyManager(QWidget):
         self.animate_window(self.confirm_dialog)
 
     def animate_window(self, widget):
+        from ui.effects import get_effects
+        if not get_effects().allow_animations():
+            return
         self.anim = QPropertyAnimation(widget, b"windowOpacity")
-        self.anim.setDuration(200)
+        self.anim.setDuration(get_effects().duration(200))
         self.anim.setStartValue(0)
         self.anim.setEndValue(1)
         self.anim.start()
@@ -287,23 +228,27 @@ class SafetyManager(QWidget):
             print("Done!", msg)
             ConfigManager().set("restore_point_suggested", True)
             self.restore_point_created.emit()
-            self.close_all()
-            if self._pending_action: self._pending_action()
+            action = self._pending_action
+            self.close_all() # Clears the pending action
+            if action: action()
         else:
             print("Error:", msg)
-            self.close_all()
-            if self._pending_action: self._pending_action()
+            action = self._pending_action
+            self.close_all() # Clears the pending action
+            if action: action()
 
     def on_reject(self):
         from core.config import ConfigManager
         ConfigManager().set("restore_point_suggested", True)
+        action = self._pending_action
         self.close_all()
-        if self._pending_action: self._pending_action()
+        if action: action()
 
     def on_confirm_accepted(self):
+        action = self._confirm_action
         self.close_all()
-        if self._confirm_action:
-            self._confirm_action()
+        if action:
+            action()
 
     def close_all(self):
         self._pending_action = None
@@ -0,0 +1,48 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit
+from PySide6.QtCore import Qt
+
+
+class TweakPlanDialog(QDialog):
+    """Shows a dry-run plan (what will change, grouped by mechanism) before anything runs."""
+    def __init__(self, plan, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
+        self.setObjectName("planDialog") # Styled by the app stylesheet
+        self.setFixedSize(560, 440)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(30, 25, 30, 25)
+        layout.setSpacing(12)
+
+        title = QLabel("План изменений")
+        title.setObjectName("planTitle")
+
+        summary = QLabel(f"Изменений: {len(plan)} · настроек: {len(plan.tweak_ids())} · "
+                         f"~{plan.estimated_cost():.1f} с")
+        summary.setObjectName("planSummary")
+
+        diff = QPlainTextEdit(plan.describe())
+        diff.setObjectName("planDiff")
+        diff.setReadOnly(True)
+        diff.setLineWrapMode(QPlainTextEdit.NoWrap)
+
+        btns = QHBoxLayout()
+        b_cancel = QPushButton("Отмена")
+        b_cancel.setObjectName("outlineButton")
+        b_cancel.setProperty("accent", "blue")
+        b_cancel.setCursor(Qt.PointingHandCursor)
+        b_cancel.clicked.connect(self.reject)
+
+        b_apply = QPushButton("Применить")
+        b_apply.setObjectName("rowAction")
+        b_apply.setCursor(Qt.PointingHandCursor)
+        b_apply.clicked.connect(self.accept)
+
+        btns.addStretch()
+        btns.addWidget(b_cancel)
+        btns.addWidget(b_apply)
+
+        layout.addWidget(title)
+        layout.addWidget(summary)
+        layout.addWidget(diff, 1)
+        layout.addLayout(btns)
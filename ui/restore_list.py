@@ -0,0 +1,243 @@
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView, QFrame
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, Signal, QEvent
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+
+ROW_HEIGHT = 50
+ROW_GAP = 10
+SIDE_MARGIN = 10
+
+PointRole = Qt.UserRole + 1
+KeyRole = Qt.UserRole + 2
+
+
+class RestorePointModel(QAbstractListModel):
+    """
+    Flat list of restore points (newest first), keyed by SequenceNumber.
+    Freshly created points live under "pending:<name>" until a rescan confirms them.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []
+        self._points = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._points)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._points):
+            return None
+        point = self._points[index.row()]
+        if role == Qt.DisplayRole:
+            return point.get('name')
+        if role == Qt.ToolTipRole:
+            return f"Seq: {point.get('id')}\nShadowID: {point.get('shadow_id') or '—'}"
+        if role == PointRole:
+            return point
+        if role == KeyRole:
+            return self._keys[index.row()]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self._points[index.row()].get('id') is None:
+            # Pending rows can't be selected for deletion yet
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def keys(self):
+        return list(self._keys)
+
+    def reconcile(self, keyed_points):
+        """
+        Brings the model in line with keyed_points (newest first), emitting
+        row inserts/removals only for what actually changed.
+        """
+        if not self._keys:
+            # First load: one reset instead of thousands of row inserts
+            self.beginResetModel()
+            self._keys = [key for key, _ in keyed_points]
+            self._points = [point for _, point in keyed_points]
+            self.endResetModel()
+            return
+
+        wanted = dict(keyed_points)
+
+        # Removals, back to front so row numbers stay valid
+        for row in range(len(self._keys) - 1, -1, -1):
+            if self._keys[row] not in wanted:
+                self._remove_row(row)
+
+        for target, (key, point) in enumerate(keyed_points):
+            if target < len(self._keys) and self._keys[target] == key:
+                if self._points[target] != point:
+                    self._points[target] = point
+                    idx = self.index(target)
+                    self.dataChanged.emit(idx, idx)
+                continue
+
+            if key in self._keys:
+                # Reordered (e.g. clock change): move instead of rebuilding
+                self._remove_row(self._keys.index(key))
+            self._insert_row(target, key, point)
+
+    def add_pending(self, name, point):
+        key = f"pending:{name}"
+        if key not in self._keys:
+            self._insert_row(0, key, point)
+
+    def remove_key(self, key):
+        if key in self._keys:
+            self._remove_row(self._keys.index(key))
+
+    def _insert_row(self, row, key, point):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._keys.insert(row, key)
+        self._points.insert(row, point)
+        self.endInsertRows()
+
+    def _remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._keys[row]
+        del self._points[row]
+        self.endRemoveRows()
+
+
+class RestorePointDelegate(QStyledItemDelegate):
+    """
+    Paints a restore point row (name, timestamp, delete button) directly,
+    so no per-row widgets exist. The delete button is hit-tested on click.
+    """
+    delete_requested = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover_pos = None
+
+        self.font_name = QFont()
+        self.font_name.setPixelSize(14)
+        self.font_name.setWeight(QFont.DemiBold)
+
+        self.font_time = QFont("Consolas")
+        self.font_time.setStyleHint(QFont.Monospace)
+        self.font_time.setPixelSize(14)
+        self.font_time.setWeight(QFont.Medium)
+
+        self.font_btn = QFont()
+        self.font_btn.setPixelSize(11)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), ROW_HEIGHT + ROW_GAP)
+
+    @staticmethod
+    def row_rect(rect):
+        return QRect(rect.left() + SIDE_MARGIN, rect.top(), rect.width() - 2 * SIDE_MARGIN, ROW_HEIGHT)
+
+    @staticmethod
+    def button_rect(rect):
+        row = RestorePointDelegate.row_rect(rect)
+        return QRect(row.right() - 25 - 70, row.top() + (ROW_HEIGHT - 28) // 2, 70, 28)
+
+    def paint(self, painter, option, index):
+        point = index.data(PointRole) or {}
+        row = self.row_rect(option.rect)
+        btn = self.button_rect(option.rect)
+        pending = point.get('id') is None
+        selected = bool(option.state & QStyle.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card
+        painter.setPen(QPen(QColor(129, 140, 248, 120) if selected else QColor(148, 163, 184, 13), 1))
+        painter.setBrush(QColor(30, 41, 59, 110 if selected else 51))
+        painter.drawRoundedRect(row.adjusted(0, 0, -1, -1), 8, 8)
+
+        # Timestamp: 180px column ending 40px before the button
+        time_rect = QRect(btn.left() - 40 - 180, row.top(), 180 - 15, ROW_HEIGHT)
+        painter.setFont(self.font_time)
+        painter.setPen(QColor("#7aa2f7"))
+        painter.drawText(time_rect, Qt.AlignRight | Qt.AlignVCenter,
+                         "создаётся..." if pending else str(point.get('timestamp')))
+
+        # Name
+        name_rect = QRect(row.left() + 25, row.top(), time_rect.left() - row.left() - 25, ROW_HEIGHT)
+        painter.setFont(self.font_name)
+        painter.setPen(QColor("#cbd5e1"))
+        name = painter.fontMetrics().elidedText(str(point.get('name')), Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
+
+        # Delete button
+        hovered = self.hover_pos is not None and btn.contains(self.hover_pos)
+        red = QColor("#64748b") if pending else QColor("#ef4444")
+        painter.setPen(QPen(red, 1))
+        painter.setBrush(red if hovered and not pending else Qt.transparent)
+        painter.drawRoundedRect(btn.adjusted(0, 0, -1, -1), 4, 4)
+        painter.setFont(self.font_btn)
+        painter.setPen(QColor("white") if hovered and not pending else red)
+        painter.drawText(btn, Qt.AlignCenter, "Удалить")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            on_button = self.button_rect(option.rect).contains(event.position().toPoint())
+            point = index.data(PointRole) or {}
+            if on_button and event.button() == Qt.LeftButton and point.get('id') is not None:
+                # Swallow the press so clicking "Удалить" doesn't change the selection
+                if etype == QEvent.MouseButtonRelease:
+                    self.delete_requested.emit(point)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class RestorePointList(QListView):
+    """
+    Virtualized restore point list: only visible rows are painted, so a
+    history of thousands of points costs the same as a handful.
+    """
+    delete_requested = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setProperty("transparent", True)
+        self.setUniformItemSizes(True)
+        self.setMouseTracking(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Ctrl/Shift-click to pick several points for bulk deletion
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.viewport().setAttribute(Qt.WA_Hover, True)
+
+        self.point_model = RestorePointModel(self)
+        self.setModel(self.point_model)
+
+        self.delegate = RestorePointDelegate(self)
+        self.delegate.delete_requested.connect(self.delete_requested)
+        self.setItemDelegate(self.delegate)
+        self._hover_index = QModelIndex()
+
+    def selected_points(self):
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return [self.point_model.index(row).data(PointRole) for row in rows]
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        # Repaint only the row under the cursor (and the one it left) for the button hover
+        pos = event.position().toPoint()
+        self.delegate.hover_pos = pos
+        index = self.indexAt(pos)
+        prev = self._hover_index
+        if prev.isValid() and prev != index:
+            self.update(prev)
+        if index.isValid():
+            self.update(index)
+        self._hover_index = index
+
+    def leaveEvent(self, event):
+        self.delegate.hover_pos = None
+        self.viewport().update()
+        super().leaveEvent(event)
@@ -1,43 +1,14 @@
-from PySide6.QtCore import Qt, QSize, QThread, Signal, QTimer, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-                               QPushButton, QDialog, QLineEdit, QGraphicsDropShadowEffect, QProgressBar)
-from PySide6.QtGui import QIcon, QColor
+                               QPushButton, QDialog, QLineEdit, QProgressBar, QComboBox)
+from PySide6.QtGui import QColor
 from core.wmi_manager import RestorePointManager
-from core.system import delete_restore_point_system
-import os
-
-class CreateThread(QThread):
-    finished = Signal(bool, str)
-    def __init__(self, name):
-        super().__init__()
-        self.name = name
-    def run(self):
-        from core.system import create_restore_point
-        success, msg = create_restore_point(self.name)
-        self.finished.emit(success, msg)
-
-class DeleteThread(QThread):
-    finished = Signal(bool, str)
-    def __init__(self, point_data):
-        super().__init__()
-        self.point_data = point_data
-    def run(self):
-        from core.system import delete_restore_point_system
-        success, msg = delete_restore_point_system(self.point_data)
-        self.finished.emit(success, msg)
-
-class WmiScanThread(QThread):
-    points_found = Signal(list)
-    
-    def run(self):
-        points = RestorePointManager.get_all_restore_points()
-        self.points_found.emit(points)
-
-class StorageScanThread(QThread):
-    info_ready = Signal(dict)
-    def run(self):
-        info = RestorePointManager.get_vss_storage_info()
-        self.info_ready.emit(info)
+from core.system import delete_restore_point_system, delete_restore_points_system
+from ui.restore_list import RestorePointList
+from ui.history_list import OperationLogList
+from ui import theme
+from ui.effects import get_effects, EFFECTS_FULL, EFFECTS_REDUCED, EFFECTS_NONE
+from ui.jobs import get_scheduler, PRIORITY_USER, PRIORITY_BACKGROUND
 
 class VortexCreationDialog(QDialog):
     """
@@ -57,30 +28,9 @@ class VortexCreationDialog(QDialog):
         # Container Frame for styling
         self.container = QFrame(self)
         self.container.setGeometry(0, 0, 500, 380)
-        self.container.setStyleSheet("""
-            QFrame {
-                background-color: #1a1b26; 
-                border: 1px solid #414868;
-                border-radius: 20px;
-            }
-            QLabel { color: #c0caf5; }
-            QLineEdit {
-                background-color: #24283b;
-                color: #c0caf5;
-                font-family: 'Consolas', monospace;
-                font-size: 14px;
-                padding: 10px;
-                border: 1px solid #414868;
-                border-radius: 8px;
-            }
-            QLineEdit:focus { border: 1px solid #7aa2f7; }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 5)
-        self.container.setGraphicsEffect(shadow)
+        self.container.setObjectName("dialogFrame")
+        
+        get_effects().shadow(self.container, 20, QColor(0, 0, 0, 150), (0, 5))
 
         self.layout = QVBoxLayout(self.container)
         self.layout.setContentsMargins(40, 40, 40, 40)
@@ -89,7 +39,7 @@ class VortexCreationDialog(QDialog):
         # 1. Header
         self.lbl_title = QLabel("ЗАЩИТА СИСТЕМЫ")
         self.lbl_title.setAlignment(Qt.AlignCenter)
-        self.lbl_title.setStyleSheet("font-size: 18px; font-weight: bold; color: white; letter-spacing: 1px;")
+        self.lbl_title.setObjectName("dialogTitle")
         
         # 2. Warning / Desc
         self.lbl_desc = QLabel(
@@ -97,11 +47,13 @@ class VortexCreationDialog(QDialog):
         )
         self.lbl_desc.setWordWrap(True)
         self.lbl_desc.setAlignment(Qt.AlignCenter)
-        self.lbl_desc.setStyleSheet("color: #94a3b8; font-size: 14px; line-height: 1.4;")
+        self.lbl_desc.setObjectName("dialogText")
+        self.lbl_desc.setProperty("state", "intro")
 
         # 3. Input
         self.prefix = "VORTEX-"
         self.input_field = QLineEdit(self.prefix)
+        self.input_field.setObjectName("dialogInput")
         self.input_field.textChanged.connect(self.on_text_changed)
         self.input_field.cursorPositionChanged.connect(self.on_cursor_changed)
         
@@ -110,17 +62,7 @@ class VortexCreationDialog(QDialog):
         self.progress.setRange(0, 0) # Indeterminate mode
         self.progress.setTextVisible(False)
         self.progress.setFixedHeight(6)
-        self.progress.setStyleSheet("""
-            QProgressBar {
-                background-color: #24283b;
-                border: none;
-                border-radius: 3px;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #bb9af7, stop:1 #7aa2f7);
-                border-radius: 3px;
-            }
-        """)
+        self.progress.setObjectName("dialogProgress")
         self.progress.hide()
 
         # 5. Buttons
@@ -130,32 +72,14 @@ class VortexCreationDialog(QDialog):
         self.btn_cancel = QPushButton("Отмена")
         self.btn_cancel.setCursor(Qt.PointingHandCursor)
         self.btn_cancel.setFixedHeight(40)
-        self.btn_cancel.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #565f89;
-                color: #a9b1d6;
-                border-radius: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: rgba(255,255,255,0.05); color: white; }
-        """)
+        self.btn_cancel.setObjectName("dialogCancel")
         self.btn_cancel.clicked.connect(self.reject)
         
         self.btn_action = QPushButton("Далее")
         self.btn_action.setCursor(Qt.PointingHandCursor)
         self.btn_action.setFixedHeight(40)
-        self.btn_action.setStyleSheet("""
-            QPushButton {
-                background-color: #7aa2f7;
-                color: #1a1b26;
-                border: none;
-                border-radius: 10px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover { background-color: #89b4fa; }
-        """)
+        self.btn_action.setObjectName("dialogAction")
+        self.btn_action.setProperty("accent", "blue")
         self.btn_action.clicked.connect(self.handle_action)
         
         self.btn_layout.addWidget(self.btn_cancel)
@@ -183,21 +107,11 @@ class VortexCreationDialog(QDialog):
             self.input_field.hide()
             self.lbl_title.setText("ПОДТВЕРЖДЕНИЕ")
             self.lbl_desc.setText("Вы точно уверены? Процесс займет около 30 секунд.")
-            self.lbl_desc.setStyleSheet("color: #c0caf5; font-size: 16px; font-weight: 500;")
+            theme.set_state(self.lbl_desc, "state", "confirm")
             
             self.btn_action.setText("ПОДТВЕРДИТЬ")
-            self.btn_action.setStyleSheet("""
-                QPushButton {
-                    background-color: #9ece6a; color: #1a1b26; border: none; border-radius: 10px; font-weight: bold;
-                }
-                QPushButton:hover { background-color: #b9f27c; }
-            """)
-            self.btn_cancel.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent; border: 1px solid #f7768e; color: #f7768e; border-radius: 10px; font-weight: bold;
-                }
-                QPushButton:hover { background-color: rgba(247, 118, 142, 0.1); }
-            """)
+            theme.set_state(self.btn_action, "accent", "green")
+            theme.set_state(self.btn_cancel, "accent", "red")
             
         elif self.state == "CONFIRM":
             self.state = "PROGRESS"
@@ -205,15 +119,19 @@ class VortexCreationDialog(QDialog):
             
             self.lbl_title.setText("СОЗДАНИЕ")
             self.lbl_desc.setText("Создание снимка системы (C, E, F)...\nПожалуйста, подождите.")
-            self.lbl_desc.setStyleSheet("color: #7aa2f7; font-size: 14px;")
+            theme.set_state(self.lbl_desc, "state", "progress")
             
             self.btn_action.hide()
             self.btn_cancel.hide()
             self.progress.show()
             
-            self.thread = CreateThread(self.result_name)
-            self.thread.finished.connect(self.on_creation_finished)
-            self.thread.start()
+            from core.system import create_restore_point
+            name = self.result_name
+            get_scheduler().submit(
+                "create_point", lambda: create_restore_point(name),
+                priority=PRIORITY_USER, resource="restore:create",
+                on_done=lambda res: self.on_creation_finished(*res),
+                on_error=lambda err: self.on_creation_finished(False, err))
 
     def on_creation_finished(self, success, msg):
         self.success = success
@@ -234,10 +152,10 @@ class SettingsPage(QWidget):
         # Header Row (Title + Storage)
         header_row = QHBoxLayout()
         header_text = QLabel("Настройки системы")
-        header_text.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
+        header_text.setObjectName("pageTitle")
         
         self.lbl_storage = QLabel("Место: сканирование...")
-        self.lbl_storage.setStyleSheet("color: #64748b; font-size: 13px; font-weight: 500;")
+        self.lbl_storage.setObjectName("storageLabel")
         
         header_row.addWidget(header_text)
         header_row.addStretch()
@@ -246,57 +164,71 @@ class SettingsPage(QWidget):
 
         # Content Container
         self.content_container = QFrame()
-        self.content_container.setStyleSheet("background: transparent;")
+        self.content_container.setProperty("transparent", True)
         self.content_layout = QVBoxLayout(self.content_container)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(15)
         
-        # Threads
-        self.scan_thread = WmiScanThread()
-        self.scan_thread.points_found.connect(self.on_points_loaded)
-        
-        self.storage_thread = StorageScanThread()
-        self.storage_thread.info_ready.connect(self.on_storage_info_ready)
+        # System operations go through the shared scheduler
+        self.jobs = get_scheduler()
 
         # 1. Restore Point Section
         self.create_restore_section()
 
-        self.main_layout.addWidget(self.content_container)
-        self.main_layout.addStretch()
-        
-        self.refresh_logs()
-        self.refresh_storage()
+        # 2. Interface
+        self.create_effects_section()
+
+        # 3. Operation History
+        self.create_history_section()
+
+        self.main_layout.addWidget(self.content_container, 1)
+        # The first scan is started by whoever builds the page (see MainWindow.build_settings)
 
-    def refresh_storage(self):
-        self.storage_thread.start()
+    def on_snapshot_loaded(self, snapshot):
+        self.on_points_loaded(snapshot.get('points', []))
+        self.on_storage_info_ready(snapshot.get('storage', {}))
 
     def on_storage_info_ready(self, info):
         gb = info.get('total_gb', 0)
         details = info.get('details', "")
         
         text = f"Занято точками: {gb:.2f} GB"
+
+        # The drive closest to its shadow storage cap decides the warning
+        capped = [v for v in info.get('volumes', []) if v.get('usage') is not None]
+        fullest = max(capped, key=lambda v: v['usage'], default=None)
+        if fullest:
+            text += f"  ·  {fullest['drive']} {fullest['usage'] * 100:.0f}% лимита"
+
         self.lbl_storage.setText(text)
         self.lbl_storage.setToolTip(details)
         
-        if gb > 20:
-            self.lbl_storage.setStyleSheet("color: #eab308; font-size: 13px; font-weight: bold;") # Amber/Yellow
-        else:
-            self.lbl_storage.setStyleSheet("color: #64748b; font-size: 13px; font-weight: 500;")
+        warn = gb > 20 or (fullest and fullest['usage'] >= 0.8)
+        theme.set_state(self.lbl_storage, "level", "warning" if warn else None) # Amber/Yellow
 
     def create_restore_section(self):
         # Section Title
         sec_title = QLabel("Менеджер точек восстановления (System Restore)")
-        sec_title.setStyleSheet("color: #94a3b8; font-size: 14px; font-weight: bold; text-transform: uppercase;")
+        sec_title.setObjectName("sectionTitle")
         
         # Header Row
         header_row = QHBoxLayout()
         header_row.addWidget(sec_title)
         header_row.addStretch()
+
+        self.btn_delete_selected = QPushButton()
+        self.btn_delete_selected.setCursor(Qt.PointingHandCursor)
+        self.btn_delete_selected.setObjectName("outlineButton")
+        self.btn_delete_selected.setProperty("accent", "danger")
+        self.btn_delete_selected.clicked.connect(self.request_delete_selected)
+        self.btn_delete_selected.hide()
+        header_row.addWidget(self.btn_delete_selected)
         
         btn_refresh = QPushButton("Обновить")
         btn_refresh.setCursor(Qt.PointingHandCursor)
-        btn_refresh.setStyleSheet("color: #7aa2f7; border: 1px solid #7aa2f7; border-radius: 4px; padding: 4px 10px; background: transparent;")
-        btn_refresh.clicked.connect(self.refresh_logs)
+        btn_refresh.setObjectName("outlineButton")
+        btn_refresh.setProperty("accent", "blue")
+        btn_refresh.clicked.connect(lambda: self.refresh_logs(force=True))
         header_row.addWidget(btn_refresh)
         
         self.content_layout.addLayout(header_row)
@@ -304,36 +236,18 @@ class SettingsPage(QWidget):
         # --- Main Action Row (Create New) ---
         self.action_row = QFrame()
         self.action_row.setObjectName("settingRow")
-        self.action_row.setStyleSheet("""
-            #settingRow {
-                background-color: rgba(30, 41, 59, 0.4);
-                border-radius: 12px;
-                border: 1px solid rgba(148, 163, 184, 0.1);
-            }
-            #settingRow:hover {
-                background-color: rgba(30, 41, 59, 0.6);
-                border: 1px solid rgba(129, 140, 248, 0.3);
-            }
-        """)
+
         
         ar_layout = QHBoxLayout(self.action_row)
         ar_layout.setContentsMargins(20, 15, 20, 15)
         
         lbl_name = QLabel("Создать новую точку")
-        lbl_name.setStyleSheet("color: #e2e8f0; font-size: 16px; font-weight: 600;")
+        lbl_name.setObjectName("rowTitle")
         
         btn_create = QPushButton("Создать")
         btn_create.setCursor(Qt.PointingHandCursor)
-        btn_create.setStyleSheet("""
-            QPushButton {
-                background-color: #4f46e5;
-                color: white;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #4338ca; }
-        """)
+        btn_create.setObjectName("rowAction")
+
         btn_create.clicked.connect(self.request_create_point)
 
         ar_layout.addWidget(lbl_name)
@@ -343,109 +257,117 @@ class SettingsPage(QWidget):
         self.content_layout.addWidget(self.action_row)
 
         # --- Points List ---
-        self.logs_container = QFrame()
-        self.logs_container.setObjectName("logsContainer")
-        self.logs_container.setStyleSheet("background: transparent;")
-        self.logs_layout = QVBoxLayout(self.logs_container)
-        self.logs_layout.setContentsMargins(10, 0, 10, 0)
-        self.logs_layout.setSpacing(10)
-        
-        self.content_layout.addWidget(self.logs_container)
-
-    def refresh_logs(self):
-        while self.logs_layout.count():
-            item = self.logs_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-                
-        lbl_loading = QLabel("Сканирование системы...")
-        lbl_loading.setStyleSheet("color: #64748b; font-style: italic;")
-        lbl_loading.setAlignment(Qt.AlignCenter)
-        self.logs_layout.addWidget(lbl_loading)
-        
-        self.scan_thread.start()
+        # Loading / empty state, shown instead of the list
+        self.lbl_list_status = QLabel("Сканирование системы...")
+        self.lbl_list_status.setObjectName("listStatus")
+        self.lbl_list_status.setAlignment(Qt.AlignCenter)
+        self.content_layout.addWidget(self.lbl_list_status)
+
+        # Virtualized list: rows are painted by a delegate, not built as widgets
+        self.points_view = RestorePointList()
+        self.points_view.delete_requested.connect(self.on_row_delete_requested)
+        self.points_model = self.points_view.point_model
+        self.points_model.rowsInserted.connect(self.update_list_status)
+        self.points_model.rowsRemoved.connect(self.update_list_status)
+        self.points_view.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.points_view.hide()
+        
+        self.content_layout.addWidget(self.points_view, 1)
+
+    def create_effects_section(self):
+        row = QFrame()
+        row.setObjectName("settingRow")
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(20, 10, 20, 10)
+
+        lbl = QLabel("Визуальные эффекты")
+        lbl.setObjectName("rowTitle")
+
+        self.cmb_effects = QComboBox()
+        self.cmb_effects.setCursor(Qt.PointingHandCursor)
+        for mode, title in ((EFFECTS_FULL, "Полные"), (EFFECTS_REDUCED, "Сниженные"), (EFFECTS_NONE, "Выключены")):
+            self.cmb_effects.addItem(title, mode)
+        self.cmb_effects.setCurrentIndex(max(0, self.cmb_effects.findData(get_effects().mode)))
+        self.cmb_effects.currentIndexChanged.connect(self.on_effects_mode_selected)
+
+        row_layout.addWidget(lbl)
+        row_layout.addStretch()
+        row_layout.addWidget(self.cmb_effects)
+        self.content_layout.addWidget(row)
+
+    def on_effects_mode_selected(self, index):
+        from core.config import ConfigManager
+        # Components pick the change up through the config change signal
+        ConfigManager().set("effects_mode", self.cmb_effects.itemData(index))
+
+    def create_history_section(self):
+        sec_title = QLabel("История операций")
+        sec_title.setObjectName("sectionTitle")
+        self.content_layout.addWidget(sec_title)
+
+        # Pages are pulled from the log as the list scrolls, never the whole history
+        self.history_view = OperationLogList()
+        self.history_view.setMaximumHeight(180)
+        self.history_model = self.history_view.log_model
+        self.content_layout.addWidget(self.history_view)
+
+    def refresh_logs(self, force=False):
+        # Our own history is local and cheap: restart it from the first page
+        self.history_model.reload()
+
+        # Existing rows stay on screen while the background scan runs
+        if self.points_model.rowCount() == 0:
+            self.lbl_list_status.setText("Сканирование системы...")
+            self.lbl_list_status.show()
+        
+        # A forced (user) refresh supersedes a pending/running background one;
+        # repeated background refreshes coalesce into a single scan.
+        # Points and storage come from the same backend round-trip.
+        self.jobs.submit(
+            "snapshot", lambda: RestorePointManager.get_cached_snapshot(force=force),
+            priority=PRIORITY_USER if force else PRIORITY_BACKGROUND,
+            supersede=force, on_done=self.on_snapshot_loaded)
 
     def on_points_loaded(self, points):
-        while self.logs_layout.count():
-            item = self.logs_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-                
-        if not points:
-            lbl = QLabel("Система готова к созданию первой точки")
-            lbl.setAlignment(Qt.AlignCenter)
-            lbl.setStyleSheet("color: #64748b; font-style: italic;")
-            self.logs_layout.addWidget(lbl)
-            return
-
-        for p in points:
-            row = self.create_point_row(p)
-            self.logs_layout.addWidget(row)
-
-    def create_point_row(self, point):
-        row = QFrame()
-        row.setStyleSheet("""
-            QFrame {
-                background-color: rgba(30, 41, 59, 0.2);
-                border-radius: 8px;
-                border: 1px solid rgba(148, 163, 184, 0.05);
-            }
-        """)
-        row.setFixedHeight(50)
-        
-        lyt = QHBoxLayout(row)
-        lyt.setContentsMargins(25, 0, 25, 0)
-        lyt.setAlignment(Qt.AlignVCenter)
-        
-        # Name
-        lbl_name = QLabel(point.get('name'))
-        lbl_name.setStyleSheet("color: #cbd5e1; font-weight: 600; font-size: 14px;")
-        
-        # Timestamp
-        lbl_time = QLabel(str(point.get('timestamp')))
-        lbl_time.setFixedWidth(180) # 180px fixed
-        lbl_time.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        lbl_time.setStyleSheet("color: #7aa2f7; font-weight: 500; font-family: 'Consolas', monospace; padding-right: 15px;")
-        
-        # Identifiers
-        point_data = {
+        # Keyed by SequenceNumber: only added/removed points touch the view
+        self.points_model.reconcile([(p.get('id'), p) for p in points])
+        self.update_list_status()
+
+    def update_list_status(self, *args):
+        if self.points_model.rowCount():
+            self.lbl_list_status.hide()
+            self.points_view.show()
+        else:
+            self.points_view.hide()
+            self.lbl_list_status.setText("Система готова к созданию первой точки")
+            self.lbl_list_status.show()
+
+    def add_pending_row(self, name):
+        """Shows a freshly created point right away; the next scan replaces it with the real entry."""
+        from datetime import datetime
+        point = {'id': None, 'shadow_id': '', 'name': name,
+                 'timestamp': datetime.now().strftime("%d.%m.%Y | %H:%M"), 'dt_obj': datetime.now()}
+        self.points_model.add_pending(name, point)
+
+    def on_selection_changed(self, *args):
+        count = len(self.points_view.selected_points())
+        self.btn_delete_selected.setText(f"Удалить выбранные ({count})")
+        self.btn_delete_selected.setVisible(count > 1)
+
+    def on_row_delete_requested(self, point):
+        self.request_delete_point({
             'shadow_id': point.get('shadow_id'),
             'sequence_number': point.get('id')
-        }
-
-        # Delete Button
-        btn_del = QPushButton("Удалить")
-        btn_del.setCursor(Qt.PointingHandCursor)
-        btn_del.setFixedSize(70, 28)
-        btn_del.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #ef4444;
-                border: 1px solid #ef4444;
-                border-radius: 4px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #ef4444;
-                color: white;
-            }
-        """)
-        btn_del.clicked.connect(lambda checked=False, p=point_data: self.request_delete_point(p))
-
-        lyt.addWidget(lbl_name)
-        lyt.addStretch()
-        lyt.addWidget(lbl_time)
-        lyt.addSpacing(40)
-        lyt.addWidget(btn_del)
-        
-        return row
+        })
 
     def request_create_point(self):
         dlg = VortexCreationDialog(self)
         if dlg.exec():
-            # Dialog handles creation and thread now
+            # Dialog handles creation through the scheduler
             success, msg = dlg.get_result()
             if success:
+                self.add_pending_row(dlg.result_name)
                 self.refresh_logs()
-                self.refresh_storage()
             else:
                 err_dlg = VortexMessageDialog("Ошибка создания", f"Не удалось создать точку:\n{msg}", is_error=True, parent=self)
                 err_dlg.exec()
@@ -461,15 +383,50 @@ class SettingsPage(QWidget):
              self.perform_delete(point_data)
 
     def perform_delete(self, point_data):
-        # Run in background to prevent freeze
-        self._del_thread = DeleteThread(point_data)
-        self._del_thread.finished.connect(self.on_delete_finished)
-        self._del_thread.start()
-        
-    def on_delete_finished(self, success, msg):
+        # Run in background to prevent freeze. Deletions (single and bulk) are
+        # serialized, and a second click on the same point joins the pending delete.
+        point_key = point_data.get('sequence_number') or point_data.get('shadow_id')
+        self.jobs.submit(
+            f"delete:{point_key}", lambda: delete_restore_point_system(point_data),
+            priority=PRIORITY_USER, resource="restore:points",
+            on_done=lambda res, p=point_data: self.on_delete_finished(*res, p),
+            on_error=lambda err, p=point_data: self.on_delete_finished(False, err, p))
+        
+    def request_delete_selected(self):
+        points = [{'shadow_id': p.get('shadow_id'), 'sequence_number': p.get('id')}
+                  for p in self.points_view.selected_points()]
+        if not points:
+            return
+
+        dlg = VortexConfirmDialog("Удаление", f"Вы уверены? Будут удалены выбранные точки восстановления ({len(points)}) навсегда.", self)
+        if dlg.exec():
+            self.points_view.clearSelection()
+            # Whole batch in one backend invocation
+            self.jobs.submit(
+                "delete:bulk", lambda: delete_restore_points_system(points),
+                priority=PRIORITY_USER, resource="restore:points",
+                on_done=self.on_bulk_delete_finished,
+                on_error=lambda err: self.on_delete_finished(False, err))
+
+    def on_bulk_delete_finished(self, results):
+        failed = []
+        for point_data, success, msg in results:
+            if success:
+                self.points_model.remove_key(point_data.get('sequence_number'))
+            else:
+                failed.append(f"#{point_data.get('sequence_number')}: {msg}")
+        self.refresh_logs()
+
+        if failed:
+            text = f"Не удалось удалить {len(failed)} из {len(results)}:\n" + "\n".join(failed[:5])
+            dlg = VortexMessageDialog("Ошибка удаления", text, is_error=True, parent=self)
+            dlg.exec()
+
+    def on_delete_finished(self, success, msg, point_data=None):
         if success:
+            if point_data:
+                self.points_model.remove_key(point_data.get('sequence_number'))
             self.refresh_logs()
-            self.refresh_storage()
         else:
             # Show error nicely
             dlg = VortexMessageDialog("Ошибка удаления", f"Не удалось удалить точку:\n{msg}", is_error=True, parent=self)
@@ -480,25 +437,18 @@ class VortexConfirmDialog(QDialog):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setFixedSize(400, 200)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1b26;
-                border: 1px solid #f7768e;
-                border-radius: 15px;
-            }
-            QLabel { color: #c0caf5; }
-            QPushButton {
-                 border-radius: 8px; font-weight: bold; padding: 8px;
-            }
-        """)
+        self.setObjectName("messageDialog")
+        self.setProperty("accent", "red")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30,30,30,30)
         
         l_title = QLabel(title)
-        l_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #f7768e;")
+        l_title.setObjectName("dialogTitle")
+        l_title.setProperty("accent", "red")
         l_title.setAlignment(Qt.AlignCenter)
         
         l_text = QLabel(text)
+        l_text.setObjectName("dialogText")
         l_text.setWordWrap(True)
         l_text.setAlignment(Qt.AlignCenter)
         
@@ -507,12 +457,13 @@ class VortexConfirmDialog(QDialog):
         
         btns = QHBoxLayout()
         b_ca = QPushButton("Отмена")
+        b_ca.setObjectName("dialogCancel")
         b_ca.clicked.connect(self.reject)
-        b_ca.setStyleSheet("background: transparent; color: #a9b1d6; border: 1px solid #565f89;")
         
         b_ok = QPushButton("Удалить")
+        b_ok.setObjectName("dialogAction")
+        b_ok.setProperty("accent", "red")
         b_ok.clicked.connect(self.accept)
-        b_ok.setStyleSheet("background: #f7768e; color: #1a1b26; border: none;")
         
         btns.addWidget(b_ca)
         btns.addWidget(b_ok)
@@ -524,29 +475,19 @@ class VortexMessageDialog(QDialog):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setFixedSize(400, 200)
         
-        color = "#f7768e" if is_error else "#7aa2f7"
-        
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: #1a1b26;
-                border: 1px solid {color};
-                border-radius: 15px;
-            }}
-            QLabel {{ color: #c0caf5; }}
-            QPushButton {{
-                 border-radius: 8px; font-weight: bold; padding: 8px;
-                 background-color: {color}; color: #1a1b26; border: none;
-            }}
-            QPushButton:hover {{ background-color: {color}99; }}
-        """)
+        accent = "red" if is_error else "blue"
+        self.setObjectName("messageDialog")
+        self.setProperty("accent", accent)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30,30,30,30)
         
         l_title = QLabel(title)
-        l_title.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {color};")
+        l_title.setObjectName("dialogTitle")
+        l_title.setProperty("accent", accent)
         l_title.setAlignment(Qt.AlignCenter)
         
         l_text = QLabel(text)
+        l_text.setObjectName("dialogText")
         l_text.setWordWrap(True)
         l_text.setAlignment(Qt.AlignCenter)
         
@@ -554,5 +495,7 @@ class VortexMessageDialog(QDialog):
         layout.addWidget(l_text)
         
         b_ok = QPushButton("OK")
+        b_ok.setObjectName("dialogAction")
+        b_ok.setProperty("accent", accent)
         b_ok.clicked.connect(self.accept)
         layout.addWidget(b_ok)
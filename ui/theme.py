@@ -0,0 +1,690 @@
+"""
+Design tokens and the application stylesheet built from them.
+
+Widgets never carry their own stylesheet: they get an objectName and,
+for variations, dynamic properties (accent="green", level="warning",
+state="hover") matched by the one compiled sheet. Changing a property via
+set_state() only re-polishes that widget instead of re-parsing a sheet;
+plain mouse hover is left to :hover rules, which need no polish at all.
+
+Regenerate ui/styles.qss after editing tokens:
+    python -m ui.theme
+"""
+import os
+from string import Template
+
+STYLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.qss")
+
+TOKENS = {
+    # Surfaces
+    'bg_start': "#0f172a",
+    'bg_end': "#1e1b4b",
+    'window_border': "#2e3c54",
+    'sidebar': "rgba(30, 41, 59, 0.5)",
+    'surface': "rgba(30, 41, 59, 0.4)",
+    'surface_hover': "rgba(30, 41, 59, 0.6)",
+    'surface_active': "rgba(30, 41, 59, 0.7)",
+    'hairline': "rgba(148, 163, 184, 0.1)",
+    'hairline_faint': "rgba(148, 163, 184, 0.05)",
+    'glow': "rgba(129, 140, 248, 0.3)",
+    'glow_strong': "rgba(129, 140, 248, 0.5)",
+
+    # Text
+    'text': "#cbd5e1",
+    'text_strong': "#e2e8f0",
+    'text_title': "#f1f5f9",
+    'text_muted': "#94a3b8",
+    'text_dim': "#64748b",
+    'text_faint': "#787c99",
+
+    # Brand / states
+    'primary': "#4f46e5",
+    'primary_hover': "#4338ca",
+    'primary_mid': "#6366f1",
+    'primary_light': "#818cf8",
+    'primary_pressed': "#3730a3",
+    'link': "#7aa2f7",
+    'link_faint': "rgba(122, 162, 247, 0.1)",
+    'link_soft': "rgba(122, 162, 247, 0.2)",
+    'link_border': "rgba(122, 162, 247, 0.4)",
+    'danger': "#ef4444",
+    'danger_hover': "#dc2626",
+    'warning': "#eab308",
+    'success': "#9ece6a",
+
+    # Controls
+    'button': "#24283b",
+    'button_hover': "#3b4261",
+    'toggle_off': "#334155",
+    'toggle_border': "#475569",
+
+    # Dialogs
+    'dialog_bg': "#1a1b26",
+    'dialog_border': "#414868",
+    'dialog_text': "#c0caf5",
+    'dialog_outline': "#565f89",
+    'dialog_outline_text': "#a9b1d6",
+    'progress_start': "#bb9af7",
+
+    # Shape
+    'radius_window': "12px",
+    'radius_card': "16px",
+    'radius_row': "12px",
+    'radius_item': "8px",
+    'radius_small': "4px",
+    'font_family': "'Segoe UI Variable Display', 'Segoe UI', sans-serif",
+    'font_display': "'Montserrat', 'Gilroy', 'Segoe UI', sans-serif",
+}
+
+# Named accents for the accent="..." property
+ACCENTS = {
+    'blue': "#7aa2f7",
+    'green': "#9ece6a",
+    'red': "#f7768e",
+    'amber': "#e0af68",
+    'indigo': "#818cf8",
+    'danger': "#ef4444",
+}
+
+BASE_TEMPLATE = """/* Global Styles - Deep Nebula Theme */
+/* Generated by ui/theme.py from design tokens - edit the tokens, not this file. */
+QMainWindow {
+    background-color: transparent; /* Translucent for custom gradient in central widget */
+}
+
+/* Central Widget Gradient Background */
+QWidget#centralWidget {
+    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:1,
+                                      stop:0 $bg_start, stop:1 $bg_end);
+    border-radius: $radius_window;
+    border: 1px solid $window_border;
+}
+
+QWidget {
+    font-family: $font_family;
+    font-size: 14px;
+    color: $text;
+}
+
+*[transparent="true"] {
+    background: transparent;
+    border: none;
+}
+
+/* Custom Title Bar */
+QFrame#titleBar {
+    background-color: transparent;
+    border-top-left-radius: $radius_window;
+    border-top-right-radius: $radius_window;
+}
+
+QLabel#titleBarTitle {
+    color: $link;
+    font-weight: bold;
+}
+
+QPushButton#titleBarBtn {
+    background-color: transparent;
+    border: none;
+    border-radius: 6px;
+}
+QPushButton#titleBarBtn:hover {
+    background-color: rgba(255, 255, 255, 0.1);
+}
+QPushButton#titleBarBtnClose:hover {
+    background-color: $danger;
+}
+
+/* Sidebar */
+QFrame#sidebar {
+    background-color: $sidebar;
+    border-right: 1px solid $hairline;
+    border-bottom-left-radius: $radius_window;
+}
+
+/* Sidebar Buttons */
+QPushButton#sidebarButton {
+    background-color: transparent;
+    border: none;
+    border-radius: $radius_window;
+    margin: 5px;
+    padding: 10px;
+}
+
+QPushButton#sidebarButton:hover {
+    background-color: $hairline;
+}
+
+QPushButton#sidebarButton:checked {
+    background-color: rgba(129, 140, 248, 0.2);
+    border-left: 3px solid $primary_light;
+    color: #ffffff;
+}
+
+/* Text-only sidebar entry (AI) */
+QPushButton#sidebarButton[role="ai"] {
+    font-family: $font_display;
+    font-size: 16px;
+    font-weight: bold;
+    color: white;
+    border: 1px solid $link_border;
+    border-radius: 12px;
+    background-color: transparent;
+}
+QPushButton#sidebarButton[role="ai"]:hover {
+    background-color: $link_faint;
+    border: 1px solid $link;
+}
+QPushButton#sidebarButton[role="ai"]:checked {
+    background-color: $link_soft;
+    border: 1px solid $link;
+    border-left: 3px solid $link;
+    color: $link;
+}
+
+/* Placeholder Pages */
+QLabel#placeholderTitle {
+    color: $link;
+    font-size: 24px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+
+/* Top Tabs (Tweaks Page) */
+QPushButton#tabButton {
+    background-color: transparent;
+    color: $text_muted;
+    font-weight: 600;
+    font-size: 14px;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 6px;
+}
+
+QPushButton#tabButton:hover {
+    color: $text_strong;
+    background-color: rgba(255, 255, 255, 0.05);
+}
+
+QPushButton#tabButton:checked {
+    color: $primary_light;
+    background-color: rgba(129, 140, 248, 0.1);
+}
+
+/* ScrollBar */
+QScrollBar:vertical {
+    border: none;
+    background: transparent;
+    width: 8px;
+    margin: 0px 0px 0px 0px;
+}
+QScrollBar::handle:vertical {
+    background: $toggle_border;
+    min-height: 20px;
+    border-radius: $radius_small;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+    background: transparent;
+}
+QScrollBar:horizontal {
+    border: none;
+    background: transparent;
+    height: 8px;
+    margin: 0px 0px 0px 0px;
+}
+QScrollBar::handle:horizontal {
+    background: $toggle_border;
+    min-width: 20px;
+    border-radius: $radius_small;
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0px;
+}
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+    background: transparent;
+}
+
+/* Animated Buttons: hover is the :hover pseudo-state (repaint only, no re-polish);
+   state="hover" forces the same look from code */
+QPushButton[role="animated"] {
+    background-color: $button;
+    border: 1px solid $hairline;
+    border-radius: $radius_item;
+    color: $text;
+    font-weight: 600;
+    padding: 10px;
+    text-align: center;
+}
+QPushButton[role="animated"]:hover,
+QPushButton[role="animated"][state="hover"] {
+    background-color: $button_hover;
+    border: 1px solid $primary_light;
+    color: #ffffff;
+    font-weight: 700;
+}
+
+/* Cards (Dashboard) */
+QFrame#card {
+    background-color: $surface;
+    border-radius: $radius_card;
+    border: 1px solid $hairline;
+}
+
+QFrame#card:hover {
+    background-color: $surface_hover;
+    border: 1px solid $glow_strong;
+}
+$card_accents
+QLabel#cardTitle {
+    font-size: 16px;
+    font-weight: 700;
+    color: $text_title;
+}
+QLabel#cardDesc {
+    color: $text_muted;
+    font-size: 13px;
+    font-weight: 500;
+}
+
+/* Info Panels */
+QFrame#infoPanel {
+    background-color: $surface;
+    border-radius: $radius_card;
+    border: 1px solid $hairline;
+}
+QLabel#panelTitle {
+    font-size: 20px;
+    font-weight: bold;
+    color: white;
+    margin-bottom: 10px;
+}
+QLabel#panelText {
+    color: $text_faint;
+    font-size: 14px;
+    margin-bottom: 20px;
+}
+QLabel#panelStatus {
+    color: $success;
+    font-weight: bold;
+    margin-bottom: 10px;
+}
+QLabel#panelNotes {
+    color: $text_muted;
+    font-size: 13px;
+}
+
+QPushButton#primaryAction {
+    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 $primary, stop:1 $primary_light);
+    color: white;
+    border-radius: $radius_item;
+    padding: 12px 24px;
+    font-weight: 700;
+    font-size: 14px;
+    border: 1px solid $primary_mid;
+}
+QPushButton#primaryAction:hover {
+    background-color: qlineargradient(spread:pad, x1:0, y1:0, x2:1, y2:0, stop:0 $primary_hover, stop:1 $primary_mid);
+    border: 1px solid $primary_light;
+}
+QPushButton#primaryAction:pressed {
+    background-color: $primary_pressed;
+}
+
+/* Tweak Rows */
+QFrame#tweakItem {
+    background-color: $surface;
+    border-radius: $radius_item;
+    border: 1px solid $hairline_faint;
+    min-height: 56px;
+}
+QFrame#tweakItem:hover {
+    background-color: $surface_hover;
+    border: 1px solid $glow;
+}
+QLabel#tweakLabel {
+    color: $text_strong;
+    font-size: 14px;
+    font-weight: 500;
+}
+QPushButton#tweakHint {
+    background: transparent;
+    border: none;
+    color: $text_muted;
+    font-size: 13px;
+    padding: 0 10px;
+}
+QPushButton#tweakHint:hover {
+    color: $text_strong;
+}
+
+/* Settings Page */
+QLabel#pageTitle {
+    color: white;
+    font-size: 24px;
+    font-weight: bold;
+}
+QLabel#sectionTitle {
+    color: $text_muted;
+    font-size: 14px;
+    font-weight: bold;
+    text-transform: uppercase;
+}
+QLabel#storageLabel {
+    color: $text_dim;
+    font-size: 13px;
+    font-weight: 500;
+}
+QLabel#storageLabel[level="warning"] {
+    color: $warning;
+    font-weight: bold;
+}
+QLabel#listStatus {
+    color: $text_dim;
+    font-style: italic;
+}
+
+QPushButton#outlineButton {
+    border-radius: $radius_small;
+    padding: 4px 10px;
+    background: transparent;
+}
+$outline_accents
+QFrame#settingRow {
+    background-color: $surface;
+    border-radius: $radius_row;
+    border: 1px solid $hairline;
+}
+QFrame#settingRow:hover {
+    background-color: $surface_hover;
+    border: 1px solid $glow;
+}
+QLabel#rowTitle {
+    color: $text_strong;
+    font-size: 16px;
+    font-weight: 600;
+}
+QPushButton#rowAction {
+    background-color: $primary;
+    color: white;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-weight: bold;
+}
+QPushButton#rowAction:hover {
+    background-color: $primary_hover;
+}
+
+/* Plan Dialog (Dashboard) */
+QDialog#planDialog {
+    background-color: $bg_end;
+    border: 1px solid $primary_light;
+    border-radius: $radius_card;
+}
+QLabel#planTitle {
+    color: $text_title;
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel#planSummary {
+    color: $text_muted;
+    font-size: 13px;
+}
+QPlainTextEdit#planDiff {
+    background-color: $surface;
+    border: 1px solid $hairline;
+    border-radius: $radius_item;
+    color: $text;
+    font-family: Consolas, monospace;
+    font-size: 12px;
+    padding: 6px;
+}
+
+/* Restore Point Dialogs */
+QFrame#dialogFrame {
+    background-color: $dialog_bg;
+    border: 1px solid $dialog_border;
+    border-radius: 20px;
+}
+QDialog#messageDialog {
+    background-color: $dialog_bg;
+    border: 1px solid $dialog_border;
+    border-radius: 15px;
+}
+QLabel#dialogTitle {
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel#dialogText {
+    color: $dialog_text;
+    font-size: 14px;
+}
+QLabel#dialogText[state="intro"] {
+    color: $text_muted;
+}
+QLabel#dialogText[state="confirm"] {
+    font-size: 16px;
+    font-weight: 500;
+}
+QLabel#dialogText[state="progress"] {
+    color: $link;
+}
+QLineEdit#dialogInput {
+    background-color: $button;
+    color: $dialog_text;
+    font-family: Consolas, monospace;
+    font-size: 14px;
+    padding: 10px;
+    border: 1px solid $dialog_border;
+    border-radius: $radius_item;
+}
+QLineEdit#dialogInput:focus {
+    border: 1px solid $link;
+}
+QProgressBar#dialogProgress {
+    background-color: $button;
+    border: none;
+    border-radius: 3px;
+}
+QProgressBar#dialogProgress::chunk {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 $progress_start, stop:1 $link);
+    border-radius: 3px;
+}
+QPushButton#dialogCancel {
+    background-color: transparent;
+    border: 1px solid $dialog_outline;
+    color: $dialog_outline_text;
+    border-radius: 10px;
+    font-weight: bold;
+    padding: 8px;
+}
+QPushButton#dialogCancel:hover {
+    background-color: rgba(255, 255, 255, 0.05);
+    color: white;
+}
+QPushButton#dialogAction {
+    color: $dialog_bg;
+    border: none;
+    border-radius: 10px;
+    font-weight: bold;
+    font-size: 14px;
+    padding: 8px;
+}
+$dialog_accents
+/* Safety Prompts (overlay modals) */
+QFrame#restoreDialog, QFrame#confirmDialog {
+    background-color: $bg_end;
+    border: 1px solid $primary;
+    border-radius: $radius_card;
+}
+QFrame#confirmDialog {
+    border: 1px solid $danger;
+}
+QLabel#promptTitle {
+    color: $text_strong;
+}
+QPushButton#promptReject, QPushButton#promptAccept {
+    border-radius: $radius_item;
+    padding: 10px 20px;
+    font-weight: bold;
+    font-size: 13px;
+}
+QLabel#promptText {
+    color: $text;
+    font-size: 16px;
+    margin-bottom: 20px;
+}
+QLabel#confirmTitle {
+    color: $danger;
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel#confirmText {
+    color: $text;
+    font-size: 14px;
+}
+QPushButton#promptReject {
+    background-color: transparent;
+    color: $text_muted;
+    border: 1px solid $toggle_off;
+}
+QPushButton#promptReject:hover {
+    border: 1px solid $toggle_border;
+    color: $text;
+}
+QPushButton#promptAccept {
+    background-color: $primary;
+    border: none;
+    color: white;
+}
+QPushButton#promptAccept:hover {
+    background-color: $primary_hover;
+}
+QPushButton#confirmCancel, QPushButton#confirmAccept {
+    border-radius: $radius_item;
+    padding: 8px 16px;
+}
+QPushButton#confirmCancel {
+    background-color: transparent;
+    border: 1px solid $toggle_border;
+    color: $text;
+}
+QPushButton#confirmCancel:hover {
+    background-color: rgba(255, 255, 255, 0.05);
+}
+QPushButton#confirmAccept {
+    background-color: $danger;
+    border: none;
+    color: white;
+    font-weight: bold;
+}
+QPushButton#confirmAccept:hover {
+    background-color: $danger_hover;
+}
+QListView#historyList {
+    color: $text_muted;
+    font-size: 13px;
+}
+QListView#historyList::item {
+    padding: 4px 10px;
+}
+
+/* Toggles (Checkboxes) */
+QCheckBox {
+    spacing: 12px;
+    color: $text;
+    font-size: 14px;
+}
+
+QCheckBox::indicator {
+    width: 48px;
+    height: 26px;
+    border-radius: 13px;
+    background-color: $toggle_off;
+    border: 1px solid $toggle_border;
+}
+
+QCheckBox::indicator:checked {
+    background-color: $primary;
+    border: 1px solid $primary_light;
+    image: none;
+}
+
+QCheckBox::indicator:checked:hover {
+    background-color: $primary_hover;
+}
+"""
+
+
+def build_stylesheet(tokens=None, accents=None):
+    """Compiles the application stylesheet from tokens."""
+    tokens = dict(TOKENS, **(tokens or {}))
+    accents = accents or ACCENTS
+
+    card_accents = "".join(
+        f'QFrame#card[accent="{name}"]:hover {{\n    border: 1px solid {color};\n}}\n'
+        for name, color in accents.items())
+    outline_accents = "".join(
+        f'QPushButton#outlineButton[accent="{name}"] {{\n    color: {color};\n    border: 1px solid {color};\n}}\n'
+        for name, color in accents.items())
+
+    dialog_accents = "".join(
+        f'QDialog#messageDialog[accent="{name}"] {{\n    border: 1px solid {color};\n}}\n'
+        f'QLabel#dialogTitle[accent="{name}"] {{\n    color: {color};\n}}\n'
+        f'QPushButton#dialogAction[accent="{name}"] {{\n    background-color: {color};\n}}\n'
+        f'QPushButton#dialogAction[accent="{name}"]:hover {{\n    background-color: {_rgba(color, 0.8)};\n}}\n'
+        f'QPushButton#dialogCancel[accent="{name}"] {{\n    color: {color};\n    border: 1px solid {color};\n}}\n'
+        f'QPushButton#dialogCancel[accent="{name}"]:hover {{\n    background-color: {_rgba(color, 0.1)};\n}}\n'
+        for name, color in accents.items())
+
+    return Template(BASE_TEMPLATE).substitute(tokens, card_accents=card_accents, outline_accents=outline_accents,
+                                              dialog_accents=dialog_accents)
+
+
+def _rgba(color, alpha):
+    """"#rrggbb" -> "rgba(r, g, b, alpha)" (QSS reads 8-digit hex as #aarrggbb)."""
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def write_stylesheet(path=STYLES_PATH):
+    """Writes the compiled sheet to ui/styles.qss if it changed. Returns the sheet."""
+    sheet = build_stylesheet()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == sheet:
+                return sheet
+    except OSError:
+        pass
+    try:
+        with open(path, 'w', encoding='utf-8', newline='\r\n') as f:
+            f.write(sheet)
+    except OSError as e:
+        print(f"[SYSTEM] Could not write {path}: {e}")
+    return sheet
+
+
+def apply(app):
+    app.setStyleSheet(build_stylesheet())
+
+
+def set_state(widget, name, value):
+    """
+    Sets a dynamic style property and re-polishes just this widget
+    (children keep their computed style). value=None means "no state",
+    stored as "" so it matches none of the [name="..."] rules.
+    """
+    value = "" if value is None else value
+    if (widget.property(name) or "") == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().polish(widget)
+    widget.update()
+
+
+if __name__ == "__main__":
+    write_stylesheet()
+    print(f"Wrote {STYLES_PATH}")
@@ -1,10 +1,25 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, 
-                               QScrollArea, QCheckBox, QSpacerItem, QSizePolicy)
-from PySide6.QtCore import Qt
+                               QScrollArea, QCheckBox, QPushButton, QSpacerItem, QSizePolicy)
+from PySide6.QtCore import Qt, QObject, Signal
+from core.tweaks.catalog import KIND_ACTION, CleanupStep
+from ui.jobs import get_scheduler, PRIORITY_USER, SUPERSEDED
+
+
+class _CleanupSignals(QObject):
+    # (tweak id, progress info) from the job thread, delivered queued on the GUI thread
+    progress = Signal(str, object)
+
 
 class TweaksPage(QWidget):
-    def __init__(self, title, items):
+    def __init__(self, title, tweaks):
         super().__init__()
+        self.tweaks = tweaks
+        self.switches = {} # tweak id -> QCheckBox
+        self.buttons = {} # tweak id -> "Запустить" button of an action
+        self.hints = {} # tweak id -> reclaimable space of a cleanup action (click: full rescan)
+        self.applying = set() # tweak ids with an apply in flight
+        self.cleanup_signals = _CleanupSignals()
+        self.cleanup_signals.progress.connect(self.on_cleanup_progress)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -19,53 +34,196 @@ class TweaksPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("background: transparent;") # Make scroll area transparent
+        # Transparent through the app stylesheet (see ui/theme.py)
+        scroll.setProperty("transparent", True)
+        scroll.viewport().setProperty("transparent", True)
         
         content_widget = QWidget()
-        content_widget.setStyleSheet("background: transparent;")
-        content_layout = QVBoxLayout(content_widget)
+        content_widget.setProperty("transparent", True)
+        self.content_layout = content_layout = QVBoxLayout(content_widget)
         content_layout.setSpacing(15)
         content_layout.setContentsMargins(20, 20, 20, 20)
 
-        for item_text in items:
-            self.add_tweak_item(content_layout, item_text)
+        for tweak in tweaks:
+            self.add_tweak_item(content_layout, tweak)
 
         content_layout.addStretch()
         scroll.setWidget(content_widget)
         layout.addWidget(scroll)
 
-    def add_tweak_item(self, layout, text):
+    def add_tweak_item(self, layout, tweak):
         frame = QFrame()
-        frame.setObjectName("tweakItem")
-        frame.setStyleSheet("""
-            #tweakItem {
-                background-color: rgba(30, 41, 59, 0.4);
-                border-radius: 8px;
-                border: 1px solid rgba(148, 163, 184, 0.05);
-                min-height: 56px;
-            }
-            #tweakItem:hover {
-                background-color: rgba(30, 41, 59, 0.6);
-                border: 1px solid rgba(129, 140, 248, 0.3);
-            }
-        """)
+        frame.setObjectName("tweakItem") # Styled by the app stylesheet
         
         row_layout = QHBoxLayout(frame)
         row_layout.setContentsMargins(20, 10, 20, 10)
         
-        lbl = QLabel(text)
-        lbl.setStyleSheet("color: #e2e8f0; font-size: 14px; font-weight: 500;")
+        lbl = QLabel(tweak.title)
+        lbl.setObjectName("tweakLabel")
         
-        switch = QCheckBox()
-        switch.setCursor(Qt.PointingHandCursor)
-        # Styling the switch (QCheckBox) - inheriting mostly from global styles but ensuring size
-        # We can rely on global QCheckBox styles in styles.qss for consistency!
-        # Just ensure no overriding here unless needed.
-        # But for the "knob" animation hack we might need something, but styles.qss handles standard indicator well.
-        # Let's trust styles.qss for the clean consistency.
+        if tweak.kind == KIND_ACTION:
+            # One-shot actions have nothing to switch off: a button instead of a toggle
+            control = QPushButton("Запустить")
+            control.setObjectName("outlineButton")
+            control.setProperty("accent", "blue")
+            control.setCursor(Qt.PointingHandCursor)
+            control.clicked.connect(lambda: self.request_apply(tweak, True, control))
+            self.buttons[tweak.id] = control
+            if cleanup_targets(tweak):
+                hint = QPushButton()
+                hint.setObjectName("tweakHint")
+                hint.setCursor(Qt.PointingHandCursor)
+                hint.setVisible(False) # Until the first estimate
+                hint.clicked.connect(lambda: self.estimate(force=True))
+                self.hints[tweak.id] = hint
+        else:
+            control = QCheckBox()
+            control.setCursor(Qt.PointingHandCursor)
+            # Unknown until the prober reports the current state
+            control.setEnabled(False)
+            control.setToolTip("Проверка состояния...")
+            # Look comes from the global QCheckBox rules in the app stylesheet
+            control.toggled.connect(lambda checked: self.request_apply(tweak, checked, control))
+            self.switches[tweak.id] = control
 
         row_layout.addWidget(lbl)
         row_layout.addStretch()
-        row_layout.addWidget(switch)
+        if tweak.id in self.hints:
+            row_layout.addWidget(self.hints[tweak.id])
+        row_layout.addWidget(control)
         
         layout.addWidget(frame)
+
+    def add_tool_item(self, title, button_text, on_click):
+        """Row for a tool that isn't a catalog tweak (opens its own dialog); returns its button."""
+        frame = QFrame()
+        frame.setObjectName("tweakItem")
+        row_layout = QHBoxLayout(frame)
+        row_layout.setContentsMargins(20, 10, 20, 10)
+
+        lbl = QLabel(title)
+        lbl.setObjectName("tweakLabel")
+        button = QPushButton(button_text)
+        button.setObjectName("outlineButton")
+        button.setProperty("accent", "blue")
+        button.setCursor(Qt.PointingHandCursor)
+        button.clicked.connect(on_click)
+
+        row_layout.addWidget(lbl)
+        row_layout.addStretch()
+        row_layout.addWidget(button)
+        # Above the trailing stretch
+        self.content_layout.insertWidget(self.content_layout.count() - 1, frame)
+        return button
+
+    def request_apply(self, tweak, enable, control):
+        def run():
+            from core.tweaks import get_engine
+            # Cleanup steps report freed space while they run
+            progress = None
+            if cleanup_targets(tweak):
+                progress = lambda info: self.cleanup_signals.progress.emit(tweak.id, info)
+            # Serialized with every other tweak batch; toggling again replaces a pending apply
+            # and the replacement's callback updates the control
+            get_scheduler().submit(
+                f"tweak:{tweak.id}", lambda: get_engine().apply([(tweak, enable)], progress),
+                priority=PRIORITY_USER, resource="tweaks:apply", supersede=True,
+                on_done=lambda res: self.on_applied(tweak, enable, control, res),
+                on_error=lambda err: err == SUPERSEDED or self.on_applied(
+                    tweak, enable, control, {'success': False, 'tweaks': {}, 'error': err}))
+
+        if isinstance(control, QPushButton):
+            control.setEnabled(False)
+        else:
+            self.applying.add(tweak.id)
+        safety = getattr(self.window(), 'safety', None)
+        if safety is not None:
+            safety.verify_and_run(run)
+        else:
+            run()
+
+    def on_applied(self, tweak, enable, control, res):
+        ok, error = res['tweaks'].get(tweak.id, (res['success'], res['error']))
+        self.applying.discard(tweak.id)
+        if isinstance(control, QPushButton):
+            control.setEnabled(True)
+            control.setText("Запустить")
+        elif not ok and control.isChecked() == enable:
+            # Didn't happen: put the switch back without re-triggering an apply
+            control.blockSignals(True)
+            control.setChecked(not enable)
+            control.blockSignals(False)
+        control.setToolTip("" if ok else f"Ошибка: {error}")
+        reports = res.get('cleanup', {}).values()
+        if ok and reports:
+            from core.cleanup.engine import format_size
+            freed = sum(report['bytes'] for report in reports)
+            skipped = sum(report['skipped'] for report in reports)
+            control.setToolTip(f"Освобождено: {format_size(freed)}" +
+                               (f", пропущено занятых файлов: {skipped}" if skipped else ""))
+        if not ok:
+            print(f"[SYSTEM] Tweak '{tweak.id}' failed: {error}")
+        if tweak.id in self.hints:
+            # Only the directories the cleanup touched are listed again
+            self.estimate()
+
+    def estimate(self, force=False):
+        """Reclaimable space of the cleanup actions, from the persisted index (force: full rescan)."""
+        if not self.hints:
+            return
+        from core.cleanup import get_index
+        from core.cleanup.targets import load_targets
+        from ui.jobs import PRIORITY_BACKGROUND
+        wanted = {target_id for tweak in self.tweaks for target_id in cleanup_targets(tweak)}
+        targets = [target for target in load_targets() if target.id in wanted]
+        if force:
+            for hint in self.hints.values():
+                hint.setText("Пересчёт...")
+        get_scheduler().submit(
+            "cleanup:estimate", lambda token: get_index().estimate(targets, force, token),
+            priority=PRIORITY_USER if force else PRIORITY_BACKGROUND, supersede=True, wants_token=True,
+            on_done=lambda res: self.on_estimated(targets, res),
+            on_error=lambda err: err == SUPERSEDED or print(f"[SYSTEM] Cleanup estimate failed: {err}"))
+
+    def on_estimated(self, targets, res):
+        from core.cleanup import get_index
+        from core.cleanup.engine import format_size
+        index = get_index()
+        for tweak_id, hint in self.hints.items():
+            ids = cleanup_targets(next(t for t in self.tweaks if t.id == tweak_id))
+            size = sum(res['targets'][target_id]['bytes'] for target_id in ids if target_id in res['targets'])
+            hint.setText(f"≈ {format_size(size)}")
+            hint.setVisible(True)
+            # Largest entries come straight from the index, no disk access
+            mine = [target for target in targets if target.id in ids]
+            lines = [f"{format_size(s)}  {p}" for s, p in index.top_dirs(mine, 5)]
+            files = [f"{format_size(s)}  {p}" for s, p in index.top_files(mine, 5)]
+            tooltip = []
+            if lines:
+                tooltip += ["Крупные папки:"] + lines
+            if files:
+                tooltip += ["Крупные файлы:"] + files
+            tooltip.append("Нажмите, чтобы пересчитать заново")
+            hint.setToolTip("\n".join(tooltip))
+
+    def on_cleanup_progress(self, tweak_id, info):
+        button = self.buttons.get(tweak_id)
+        if button is not None and not button.isEnabled():
+            from core.cleanup.engine import format_size
+            button.setText(format_size(info['bytes']))
+
+    def set_tweak_state(self, tweak_id, state):
+        """Shows a probed state (True/False, None = unknown) unless the user is changing it."""
+        switch = self.switches.get(tweak_id)
+        if switch is None or tweak_id in self.applying:
+            return
+        switch.blockSignals(True)
+        switch.setChecked(bool(state))
+        switch.blockSignals(False)
+        switch.setEnabled(True)
+        switch.setToolTip("Не удалось определить состояние" if state is None else "")
+
+
+def cleanup_targets(tweak):
+    """Cleanup target ids an action works on."""
+    return [step.target for step in tweak.commands if isinstance(step, CleanupStep)]
@@ -1,10 +1,35 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget, QButtonGroup)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, Signal
 from ui.tweaks import TweaksPage
+from ui.jobs import get_scheduler, PRIORITY_BACKGROUND
+from core.tweaks import catalog
+
+
+class _StateSignals(QObject):
+    # Emitted from the probe pool, delivered queued on the GUI thread
+    ready = Signal(str, object)
+
+
+class _DuplicateSignals(QObject):
+    # (stage, done, total) from the search job
+    progress = Signal(str, int, int)
+
+
+DUPLICATE_STAGES = {
+    "size": "сравнение размеров",
+    "partial": "начала и концы файлов",
+    "full": "полное сравнение",
+}
+
 
 class TweaksContainer(QWidget):
     def __init__(self):
         super().__init__()
+        self.probed = False
+        self.state_signals = _StateSignals(self)
+        self.state_signals.ready.connect(self.on_state_ready)
+        self.duplicate_signals = _DuplicateSignals(self)
+        self.duplicate_signals.progress.connect(self.on_duplicates_progress)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 10, 20, 20)
         layout.setSpacing(15)
@@ -30,26 +55,14 @@ class TweaksContainer(QWidget):
         self.stack = QStackedWidget()
         layout.addWidget(self.stack)
 
-        # Init Pages
-        self.stack.addWidget(TweaksPage("Производительность", [
-            "Установить схему питания", "Интеллектуальная производительность памяти",
-            "Отключить энергосбережение видеокарты NVIDIA", "Ускорить запуск Windows",
-            "Задать приоритет играм", "Убрать фоновые операции"
-        ]))
-        
-        self.stack.addWidget(TweaksPage("Задержка", [
-            "Убрать ускорение мыши", "Автозапуск приложений без задержек",
-            "Отключить фильтрацию ввода", "Убрать задержку показа окон"
-        ]))
-
-        self.stack.addWidget(TweaksPage("Интернет", [
-            "Уменьшить сетевую задержку", "Отключить оптимизацию доставки",
-            "Не ограничивать сетевой трафик"
-        ]))
-        
-        self.stack.addWidget(TweaksPage("Прочее", [
-            "Очистить временные файлы", "Удалить кэш обновлений", "Очистить кэш DNS"
-        ]))
+        # Init Pages: rows come from the tweak catalog, one page per tab
+        for index in range(len(self.tab_group.buttons())):
+            title = self.tab_group.button(index).text()
+            self.stack.addWidget(TweaksPage(title, catalog.by_category(title)))
+
+        # Next to the cleanup actions: finds copies instead of deleting whole folders
+        self.btn_duplicates = self.stack.widget(3).add_tool_item(
+            "Найти дубликаты файлов", "Найти", self.find_duplicates)
         
         # Select first
         self.tab_group.button(0).setChecked(True)
@@ -59,6 +72,94 @@ class TweaksContainer(QWidget):
         btn.setObjectName("tabButton")
         btn.setCheckable(True)
         btn.setCursor(Qt.PointingHandCursor)
-        btn.clicked.connect(lambda: self.stack.setCurrentIndex(index))
+        btn.clicked.connect(lambda: self.show_tab(index))
         layout.addWidget(btn)
         self.tab_group.addButton(btn, index)
+
+    def show_tab(self, index):
+        self.stack.setCurrentIndex(index)
+        # Cheap when nothing changed: the prober only compares fingerprints
+        self.probe(self.stack.widget(index).tweaks, f"tweaks:probe:{index}")
+        # Same for the cleanup index: only changed directories are listed again
+        self.stack.widget(index).estimate()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.probed:
+            # First open: every tab at once, the pool reads them in parallel
+            self.probed = True
+            tweaks = [t for i in range(self.stack.count()) for t in self.stack.widget(i).tweaks]
+            self.probe(tweaks, "tweaks:probe:all")
+        else:
+            self.show_tab(self.stack.currentIndex())
+
+    def probe(self, tweaks, key):
+        from core.tweaks import get_prober
+        prober = get_prober()
+        emit = self.state_signals.ready.emit
+        # Switches fill in one by one as results arrive
+        get_scheduler().submit(
+            key, lambda token: prober.probe(tweaks, emit, token),
+            priority=PRIORITY_BACKGROUND, wants_token=True,
+            on_error=lambda err: self.on_probe_failed(tweaks, err))
+
+    def on_state_ready(self, tweak_id, state):
+        for i in range(self.stack.count()):
+            self.stack.widget(i).set_tweak_state(tweak_id, state)
+
+    def on_probe_failed(self, tweaks, error):
+        print(f"[SYSTEM] Tweak probe failed: {error}")
+        for tweak in tweaks:
+            self.on_state_ready(tweak.id, None)
+
+    def find_duplicates(self):
+        from core.cleanup import get_finder
+        from core.cleanup.targets import duplicates_target
+        from ui.jobs import PRIORITY_USER
+        roots = duplicates_target().roots()
+        if not roots:
+            self.btn_duplicates.setToolTip("Папки для поиска не найдены")
+            return
+        finder = get_finder()
+        emit = self.duplicate_signals.progress.emit
+        self.btn_duplicates.setEnabled(False)
+        self.btn_duplicates.setText("Поиск...")
+        get_scheduler().submit(
+            "cleanup:duplicates", lambda token: finder.find(roots, on_progress=emit, token=token),
+            priority=PRIORITY_USER, wants_token=True,
+            on_done=self.on_duplicates_found,
+            on_error=lambda err: self.on_duplicates_done(f"Ошибка: {err}"))
+
+    def on_duplicates_progress(self, stage, done, total):
+        if not self.btn_duplicates.isEnabled():
+            self.btn_duplicates.setToolTip(f"{DUPLICATE_STAGES.get(stage, stage)}: {done}/{total}")
+            self.btn_duplicates.setText(f"{done * 100 // max(total, 1)}%")
+
+    def on_duplicates_found(self, res):
+        from core.cleanup.engine import format_size
+        if not res['groups']:
+            self.on_duplicates_done("Дубликаты не найдены")
+            return
+        summary = f"Дубликатов: {sum(len(g['paths']) - 1 for g in res['groups'])}, {format_size(res['wasted'])}"
+
+        from ui.duplicates_dialog import DuplicatesDialog
+        dialog = DuplicatesDialog(res, self)
+        if not dialog.exec():
+            self.on_duplicates_done(summary)
+            return
+
+        from core.cleanup.duplicates import DuplicateFinder
+        from ui.jobs import PRIORITY_USER
+        groups = dialog.selected()
+        self.btn_duplicates.setText("Удаление...")
+        get_scheduler().submit(
+            "cleanup:duplicates:remove", lambda: DuplicateFinder.remove(groups),
+            priority=PRIORITY_USER,
+            on_done=lambda out: self.on_duplicates_done(
+                f"Освобождено: {format_size(out[0])}" + (f", не удалено: {len(out[1])}" if out[1] else "")),
+            on_error=lambda err: self.on_duplicates_done(f"Ошибка: {err}"))
+
+    def on_duplicates_done(self, message):
+        self.btn_duplicates.setEnabled(True)
+        self.btn_duplicates.setText("Найти")
+        self.btn_duplicates.setToolTip(message)